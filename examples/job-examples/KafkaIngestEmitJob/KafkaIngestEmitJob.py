@@ -13,7 +13,10 @@ def main():
     ingest = KafkaIngest(serializer=ingestSerializer, 
         kafka_topic=context.getVariable("import_key"),
         bootstrap_server=context.getVariable("bootstrap_server"), 
-        bootstrap_port=context.getVariable("bootstrap_port"))
+        bootstrap_port=context.getVariable("bootstrap_port"),
+        fetch_min_bytes=context.getVariable("fetch_min_bytes"),
+        fetch_wait_max_ms=context.getVariable("fetch_wait_max_ms"),
+        queued_max_messages_kbytes=context.getVariable("queued_max_messages_kbytes"))
     process = BaseProcess()
     emit = KafkaEmit(serializer=emitSerializer, 
         kafka_topic=context.getVariable("export_key"),
@@ -11,7 +11,9 @@ requires = [
 
 recommended = {
     "mysql": ["mysql-connector-python>=8.0.21"],
-    "sklearn":["scikit-learn>=0.23.2"]
+    "sklearn":["scikit-learn>=0.23.2"],
+    "columnar":["numpy>=1.17", "pyarrow>=1.0"],
+    "json":["orjson>=3.0"]
 }
 # Create full install that includes all extra dependencies
 full = []
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+
+class AdaptiveBatchController:
+    """An AdaptiveBatchController tunes a batch size and batch timeout from the observed latency of writing 
+    each batch, with additive-increase/multiplicative-decrease (AIMD). 
+
+    A write that finishes within the target latency grows the batch size by `additive_increase` records; 
+    a slower write multiplies it by `decrease_factor`. So batches grow steadily while the sink keeps up, and 
+    back off quickly when it does not. The timeout is scaled with the batch size, so that a slow stream
+    still fills the same fraction of a batch before it is written. Both are kept within their bounds.
+
+    Attributes:
+        batch_size (int): The current batch size, in records.
+        timeout_s (float): The current batch timeout, in seconds.
+    """
+    batch_size: int
+    timeout_s: float
+    def __init__(self, target_latency_s: float, batch_size: int, timeout_s: float,
+            min_batch_size: int = 1, max_batch_size: int = None,
+            additive_increase: int = None, decrease_factor: float = 0.5):
+        """Initializes the AdaptiveBatchController.
+
+        Args:
+            target_latency_s (float): The target latency of a single write, in seconds.
+            batch_size (int): The initial batch size.
+            timeout_s (float): The batch timeout at the initial batch size.
+            min_batch_size (int, optional): The smallest batch size. Defaults to 1.
+            max_batch_size (int, optional): The largest batch size. Defaults to None, which is 16 times the initial batch size.
+            additive_increase (int, optional): Records added to the batch size after a fast write. Defaults to None, 
+                which is a quarter of the initial batch size (at least 1).
+            decrease_factor (float, optional): Factor applied to the batch size after a slow write. Defaults to 0.5.
+
+        Raises:
+            ValueError: If the target latency, bounds or factors are invalid.
+        """
+        if target_latency_s <= 0:
+            raise ValueError("target_latency_s must be positive; received {target_latency_s}".format(target_latency_s=target_latency_s))
+        if max_batch_size is None:
+            max_batch_size = 16 * batch_size
+        if not 1 <= min_batch_size <= batch_size <= max_batch_size:
+            raise ValueError("Batch sizes must satisfy 1 <= min_batch_size <= batch_size <= max_batch_size; received {min_batch_size}, {batch_size}, {max_batch_size}"
+                                .format(min_batch_size=min_batch_size, batch_size=batch_size, max_batch_size=max_batch_size))
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1; received {decrease_factor}".format(decrease_factor=decrease_factor))
+        self.target_latency_s = target_latency_s
+        self.initial_batch_size = batch_size
+        self.initial_timeout_s = timeout_s
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.additive_increase = additive_increase if additive_increase is not None else max(1, batch_size // 4)
+        self.decrease_factor = decrease_factor
+        self.batch_size = batch_size
+        self.timeout_s = timeout_s
+
+    def observeWrite(self, latency_s: float):
+        """Updates the batch size and timeout after a write.
+
+        Args:
+            latency_s (float): How long the write took, in seconds.
+        """
+        if latency_s <= self.target_latency_s:
+            batch_size = min(self.max_batch_size, self.batch_size + self.additive_increase)
+        else:
+            batch_size = max(self.min_batch_size, int(self.batch_size * self.decrease_factor))
+        self.timeout_s = self.initial_timeout_s * batch_size / self.initial_batch_size
+        self.batch_size = batch_size
@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+import itertools
+
+
+class BufferView(Sequence):
+    """A read-only view of the first `length` items of a preallocated list, such as an emit buffer. Unlike 
+    slicing the list, creating a BufferView does not copy the items. The view is only valid until the list is reused.
+    """
+    def __init__(self, buffer: list, length: int):
+        self.buffer = buffer
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.buffer[:self.length][index]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("BufferView index out of range")
+        return self.buffer[index]
+
+    def __iter__(self):
+        return itertools.islice(self.buffer, self.length)
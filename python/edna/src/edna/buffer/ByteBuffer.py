@@ -1,21 +1,30 @@
 from __future__ import annotations
 
-import io
 import socket
+import threading
+import time
+from typing import List
 from edna.types.enums import BufferMode
 from edna.utils import NameUtils
+from edna.utils import TimerService
 from edna.defaults import EdnaDefault
 
 class ByteBuffer:
-    """A ByteBuffer is a wrapper around an `io.BytesIO()` buffer. EDNA uses the ByteBuffer to
+    """A ByteBuffer is a wrapper around a preallocated `bytearray`. EDNA uses the ByteBuffer to
     pass records in a local DAG.
 
-    The ByteBuffer is initialized with a MAX_BUFFER_SIZE (defaults to 32KiB). When the internal
-    buffer is filled, ByteBuffer will emit the contents to the provided socket, then reset the buffer
-    to write additional records.
+    The ByteBuffer is initialized with a MAX_BUFFER_SIZE (defaults to 32KiB). Messages are copied into
+    the internal buffer until the next message does not fit. Then the buffer contents and that message
+    are sent to the provided socket together with a single scatter-gather `sendmsg()`, so the message itself
+    is never copied, and the buffer is reused for additional records.
+
+    A partially filled buffer is sent once it has been idle for MAX_BUFFER_TIMEOUT_S, by the shared 
+    `edna.utils.TimerService`. Writes and sends are guarded by a lock, since the timer runs on its own thread.
     """
     socket: socket.socket
-    buffer: io.BytesIO
+    buffer: bytearray
+    buffer_view: memoryview
+    buffer_index: int
     name: str
     buffer_mode: BufferMode
     def __init__(self, socket: socket.socket, 
@@ -27,21 +36,29 @@ class ByteBuffer:
 
         Args:
             socket (socket.socket): A socket object to write to. This socket should be initialized outside the class. 
-                `ByteBuffer` will call the `send()` method for this socket object.
+                `ByteBuffer` will call the `sendmsg()` method for this socket object, or `sendall()` if the
+                object does not have `sendmsg()`.
             max_buffer_size (int, optional): Maximum size of the ByteBuffer's internal buffer. Defaults to 2048.
             max_buffer_timeout (float, optional): Maximum time to wait for incomplete buffer before emitting it. 
-                Unused for now. Defaults to 0.5.
+                Use None to disable the timeout. Defaults to EdnaDefault.BUFFER_MAX_TIMEOUT_S.
             name (str, optional): Name for this ByteBuffer. Defaults to "default".
             buffer_mode (BufferMode, optional): An `edna.types.enums.BufferMode` for this ByteBuffer. 
                 Defaults to BufferMode.READ.
         """
         self.MAX_BUFFER_SIZE = max_buffer_size
-        self.MAX_BUFFER_TIMEOUT_S = max_buffer_timeout  # Unused for now...
+        self.MAX_BUFFER_TIMEOUT_S = max_buffer_timeout
         self.name = self.setName(name)
         self.buffer_mode = buffer_mode
         self.socket = socket
+        self.buffer = bytearray(self.MAX_BUFFER_SIZE)
+        self.buffer_view = memoryview(self.buffer)
+        self.scatter_gather = hasattr(self.socket, "sendmsg")
+        self.lock = threading.RLock()
 
         self.reset()
+        self.timer_handle = None
+        if self.MAX_BUFFER_TIMEOUT_S is not None:
+            self.timer_handle = TimerService.getInstance().schedule(self.timer + self.MAX_BUFFER_TIMEOUT_S, self.checkBufferTimeout)
 
     def setName(self, name: str):
         """Attaches a suffix to the name if it is 'default'. Otherwise, returns the name itself.
@@ -68,74 +85,91 @@ class ByteBuffer:
         Returns:
             (int): Overflow of message in internal buffer. 
         """
-        return self.buffer.tell() + message_length - self.MAX_BUFFER_SIZE
+        return self.buffer_index + message_length - self.MAX_BUFFER_SIZE
 
-    def computeWriteIndex(self, message_length: int, overflow: int):
-        """Compute how much of the message to write given the message lenth and
-        overflow, the latter obtained from `computeOverflow()`. In case of 0 overflow,
-        the entire message can be written into the buffer.
+    def sendBuffers(self, buffers: List[memoryview]):
+        """Sends the provided buffers to the socket, in order. Partial sends are resumed until every 
+        byte has been sent.
 
         Args:
-            message_length (int): Length of message
-            overflow (int): Message overflow, obtained from `computeOverflow`
+            buffers (List[memoryview]): The buffers to send.
+        """
+        buffers = [buffer for buffer in buffers if len(buffer)]
+        if not self.scatter_gather:
+            for buffer in buffers:
+                self.socket.sendall(buffer)
+            return
+        while buffers:
+            sent = self.socket.sendmsg(buffers)
+            # Drop the buffers that were sent completely, and trim the one that was sent partially
+            while buffers and sent >= len(buffers[0]):
+                sent -= len(buffers[0])
+                buffers.pop(0)
+            if sent:
+                buffers[0] = buffers[0][sent:]
+
+    def sendBufferAndReset(self, message: bytes = None):
+        """Sends the current contents of the buffer to the socket and reset it.
 
-        Returns:
-            (int): Index up to which current message can be written into buffer. Returns length of message
-                if overflow is 0.
+        Args:
+            message (bytes, optional): A message to send right after the buffer contents, without copying 
+                it into the buffer. Defaults to None.
         """
-        write_index = message_length # This is how much of the message we will write
-        if overflow >= 0:   # Add =0 for consistency
-            write_index = message_length - overflow
-        return write_index
+        with self.lock:
+            # First send the buffer contents
+            if self.buffer_index or message:  #i.e. if there is something to send
+                buffers = [self.buffer_view[:self.buffer_index]]
+                if message:
+                    buffers.append(memoryview(message))
+                self.sendBuffers(buffers)
+                self.reset()
+
+    def checkBufferTimeout(self):
+        """Sends the buffer if it has not been sent for MAX_BUFFER_TIMEOUT_S. This is called by the `TimerService`.
 
-    def sendBufferAndReset(self):
-        """Sends the current contents of the buffer to the socket and reset it.
+        Returns:
+            (float): The time at which the buffer times out next.
         """
-        # TODO for java, add a reentrant lock here
-        # First send the buffer contents
-        if self.buffer.tell():  #i.e. if there is something in buffer
-            self.socket.send(self.buffer.getvalue())
-            self.reset()
+        with self.lock:
+            if (time.time() - self.timer) >= self.MAX_BUFFER_TIMEOUT_S:
+                self.sendBufferAndReset()
+                self.timer = time.time()    # Restart the timeout even if the buffer was empty
+            return self.timer + self.MAX_BUFFER_TIMEOUT_S
+
+    def close(self):
+        """Sends any remaining contents of the buffer and stops the buffer timeout. The socket is not closed.
+        """
+        if self.timer_handle is not None:
+            TimerService.getInstance().cancel(self.timer_handle)
+        with self.lock:
+            self.sendBufferAndReset()
 
     def reset(self):
-        """Reset the ByteBuffer. TODO Timing reset might be added in the future here, if ByteBuffer is managed on another thread.
+        """Reset the ByteBuffer and restart its timeout.
         """
-        self.reset_buffer()
+        self.resetBuffer()
+        self.timer = time.time()
 
     def resetBuffer(self):
-        """Reset the contents of the internal buffer
-        """
-        self.buffer = io.BytesIO()
-
-    def addStragglers(self, message: bytes, message_length: int, write_length: int):
-        """Adds the remaining contents of a message after a buffer reset in 
-        case of overflow due to lalrge message.
-
-        Args:
-            message (bytes): The full message.
-            message_length (int): The length of the message
-            write_length (int): The message write index to write from. This is obtained from `computeWriteIndex`
+        """Reset the contents of the internal buffer. The preallocated buffer is reused.
         """
-        if write_length < message_length:
-            self.buffer.write(message[write_length:])
-
+        self.buffer_index = 0
 
     def write(self, message: bytes):
-        """Writes a given message into the internal buffer. If the messaage is too large to fit
-        into the current buffer, `write()` will ad as much of the message as possible to the buffer,
-        emit the buffer to the provided socket, reset, and fill it with the rest of the message.
+        """Writes a given message into the internal buffer. If the message does not fit into the
+        current buffer, `write()` will send the buffer contents and the message to the provided socket 
+        together, and reset.
 
         Args:
             message (bytes): The message to write to the buffer.
         """
-        # TODO for java, add a reentrant lock here
-        message_length = len(message)
-        overflow = self.computeOverflow(message_length=message_length)
-        write_length = self.computeWriteIndex(message_length=message_length, overflow=overflow)
-        # Write to buffer main message
-        self.buffer.write(message[:write_length])
-
-        if self.buffer.tell() == self.MAX_BUFFER_SIZE:
-            self.send_buffer_and_reset()
-        
-        self.addStragglers(message, message_length, write_length)
\ No newline at end of file
+        with self.lock:
+            message_length = len(message)
+            if self.computeOverflow(message_length=message_length) > 0:
+                self.sendBufferAndReset(message)
+                return
+            self.buffer_view[self.buffer_index:self.buffer_index + message_length] = message
+            self.buffer_index += message_length
+
+            if self.buffer_index == self.MAX_BUFFER_SIZE:
+                self.sendBufferAndReset()
\ No newline at end of file
@@ -1 +1,3 @@
-from .ByteBuffer import ByteBuffer
\ No newline at end of file
+from .ByteBuffer import ByteBuffer
+from .AdaptiveBatchController import AdaptiveBatchController
+from .BufferView import BufferView
\ No newline at end of file
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from edna.types.enums import FrameFlag
+
+from typing import Callable, List, Tuple
+import math
+import struct
+
+
+class BatchFrameHeader:
+    """The header of a BatchFrame.
+
+    Attributes:
+        flags (FrameFlag): Flags of the frame.
+        record_count (int): Number of records in the payload.
+        payload_length (int): Length of the payload in bytes.
+        min_event_time (float): Smallest event time in the batch, or NaN if unknown. For a watermark frame, the watermark.
+        max_event_time (float): Largest event time in the batch, or NaN if unknown. For a watermark frame, the watermark.
+    """
+    __slots__ = ("flags", "record_count", "payload_length", "min_event_time", "max_event_time")
+    def __init__(self, flags: FrameFlag, record_count: int, payload_length: int, 
+            min_event_time: float = math.nan, max_event_time: float = math.nan):
+        self.flags = FrameFlag(flags)
+        self.record_count = record_count
+        self.payload_length = payload_length
+        self.min_event_time = min_event_time
+        self.max_event_time = max_event_time
+
+    def isEndOfStream(self) -> bool:
+        return bool(self.flags & FrameFlag.END_OF_STREAM)
+
+    def isWatermark(self) -> bool:
+        return bool(self.flags & FrameFlag.WATERMARK)
+
+
+class BatchFrame:
+    """Framing for batches of serialized records between task primitives. Each frame is a fixed-size header
+    followed by a payload of `payload_length` bytes holding `record_count` serialized records:
+
+        | magic (2) | flags (2) | record_count (4) | payload_length (4) | min_event_time (8) | max_event_time (8) | payload |
+
+    A receiver can read the header without decoding the payload, so it knows how many records to expect and
+    can route or skip whole frames. Control frames have no payload: an END_OF_STREAM frame closes the stream, 
+    and a WATERMARK frame carries a watermark in its event times.
+    """
+    MAGIC : int = 0xED4A
+    HEADER = struct.Struct("<HHIIdd")
+    HEADER_SIZE : int = HEADER.size
+
+    @staticmethod
+    def packHeader(header: BatchFrameHeader) -> bytes:
+        return BatchFrame.HEADER.pack(BatchFrame.MAGIC, header.flags, header.record_count, header.payload_length,
+                header.min_event_time, header.max_event_time)
+
+    @staticmethod
+    def unpackHeader(buffer, offset: int = 0) -> BatchFrameHeader:
+        """Reads a header from `buffer` at `offset`.
+
+        Raises:
+            ValueError: The bytes at `offset` are not a BatchFrame header.
+
+        Returns:
+            BatchFrameHeader: The header.
+        """
+        magic, flags, record_count, payload_length, min_event_time, max_event_time = BatchFrame.HEADER.unpack_from(buffer, offset)
+        if magic != BatchFrame.MAGIC:
+            raise ValueError("Invalid BatchFrame header: bad magic number {magic:#x}".format(magic=magic))
+        return BatchFrameHeader(flags, record_count, payload_length, min_event_time, max_event_time)
+
+    @staticmethod
+    def buildHeader(records: List[object], payload_length: int, event_time: Callable[[object], float] = None) -> BatchFrameHeader:
+        """Builds the header for a batch of records.
+
+        Args:
+            records (List[obj]): The records in the batch.
+            payload_length (int): Length of the serialized records in bytes.
+            event_time (Callable[[obj], float], optional): Extracts the event time from a record. Defaults to None,
+                in which case the event times are unknown.
+
+        Returns:
+            BatchFrameHeader: The header.
+        """
+        min_event_time = max_event_time = math.nan
+        if event_time is not None and records:
+            event_times = [event_time(record) for record in records]
+            min_event_time, max_event_time = min(event_times), max(event_times)
+        return BatchFrameHeader(FrameFlag.NONE, len(records), payload_length, min_event_time, max_event_time)
+
+    @staticmethod
+    def endOfStream() -> bytes:
+        return BatchFrame.packHeader(BatchFrameHeader(FrameFlag.END_OF_STREAM, 0, 0))
+
+    @staticmethod
+    def watermark(watermark: float) -> bytes:
+        return BatchFrame.packHeader(BatchFrameHeader(FrameFlag.WATERMARK, 0, 0, watermark, watermark))
+
+
+class BatchFrameDecoder:
+    """Splits a stream of bytes back into BatchFrames. Bytes are fed as they arrive, and complete frames
+    are returned by `frames()`; a partial frame stays buffered until the rest of it is fed.
+    """
+    buffer: bytearray
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, message: bytes):
+        self.buffer += message
+
+    def frames(self) -> List[Tuple[BatchFrameHeader, memoryview]]:
+        """Returns the complete frames that have been fed.
+
+        Returns:
+            (List[Tuple[BatchFrameHeader, memoryview]]): The header and the payload of each complete frame. 
+        """
+        frames = []
+        offset = 0
+        buffer_length = len(self.buffer)
+        view = memoryview(self.buffer)
+        while buffer_length - offset >= BatchFrame.HEADER_SIZE:
+            header = BatchFrame.unpackHeader(self.buffer, offset)
+            payload_end = offset + BatchFrame.HEADER_SIZE + header.payload_length
+            if payload_end > buffer_length:     # The rest of the payload has not arrived yet
+                break
+            frames.append((header, view[offset + BatchFrame.HEADER_SIZE:payload_end]))
+            offset = payload_end
+        if offset:
+            # Keep only the partial frame. The returned payloads still refer to the old buffer.
+            self.buffer = self.buffer[offset:]
+        return frames
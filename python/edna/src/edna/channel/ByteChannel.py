@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from edna.channel import ChannelWriter, ChannelReader
+from edna.channel.BatchFrame import BatchFrame, BatchFrameDecoder, BatchFrameHeader
+from edna.buffer import ByteBuffer
+from edna.defaults import EdnaDefault
+from edna.serializers import Serializable, BufferedSerializable
+
+from typing import Callable, List, Tuple
+
+
+class ByteChannelWriter(ChannelWriter):
+    """A ByteChannelWriter serializes each batch of records into a `BatchFrame` in a `ByteBuffer` that is 
+    flushed to a byte transport. The transport can be any object with the `sendmsg()` or `sendall()`, 
+    and `close()` methods of a connected `socket.socket`.
+    """
+    buffer: ByteBuffer
+    def __init__(self, sender, out_serializer: Serializable, 
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE,
+            max_buffer_timeout: float = EdnaDefault.BUFFER_MAX_TIMEOUT_S,
+            event_time: Callable[[object], float] = None):
+        """Initializes the ByteChannelWriter.
+
+        Args:
+            sender (socket.socket): A connected transport to flush the buffer to.
+            out_serializer (Serializable): Serializer for outgoing records.
+            max_buffer_size (int, optional): Size of the ByteBuffer. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            max_buffer_timeout (float, optional): Maximum time a partially filled ByteBuffer is held before it is sent.
+                Defaults to EdnaDefault.BUFFER_MAX_TIMEOUT_S.
+            event_time (Callable[[obj], float], optional): Extracts the event time of a record for the frame headers.
+                Defaults to None, in which case the event times in the headers are NaN.
+        """
+        self.sender = sender
+        self.out_serializer = out_serializer
+        if isinstance(self.out_serializer, BufferedSerializable):   # Packs a batch into one buffer
+            self.serialize_batch = self.out_serializer.write_many
+        else:
+            self.serialize_batch = lambda records: b"".join(self.out_serializer.write_many(records))
+        self.event_time = event_time
+        self.buffer = ByteBuffer(self.sender, max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
+
+    def write(self, records: List[object]):
+        if not records:
+            return
+        payload = self.serialize_batch(records)
+        header = BatchFrame.buildHeader(records, len(payload), event_time=self.event_time)
+        with self.buffer.lock:  # Keep the timer from flushing between the header and the payload
+            self.buffer.write(BatchFrame.packHeader(header))
+            self.buffer.write(payload)
+
+    def writeWatermark(self, watermark: float):
+        self.buffer.write(BatchFrame.watermark(watermark))
+
+    def flush(self):
+        self.buffer.sendBufferAndReset()
+
+    def close(self):
+        self.buffer.write(BatchFrame.endOfStream())
+        self.buffer.close()
+        self.sender.close()
+
+
+class ByteChannelReader(ChannelReader):
+    """A ByteChannelReader receives `BatchFrame`s from a transport and deserializes their payloads with a 
+    `BufferedSerializable`.
+
+    Any child class must:
+
+    - Implement the `recv()` method to receive bytes from the transport
+    """
+    in_serializer: BufferedSerializable
+    decoder: BatchFrameDecoder
+    def __init__(self, in_serializer: BufferedSerializable, max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE):
+        self.in_serializer = in_serializer
+        self.max_buffer_size = max_buffer_size
+        self.decoder = BatchFrameDecoder()
+        self.watermark = None
+        self.end_of_stream = False
+
+    def recv(self, timeout: float) -> bytes:
+        """Receives the next bytes from the transport.
+
+        Args:
+            timeout (float): Maximum time to wait for bytes.
+
+        Raises:
+            NotImplementedError: Child classes should implement this method.
+
+        Returns:
+            (bytes): The received bytes, None if nothing arrived within `timeout`, or b'' if the writer
+                closed the transport.
+        """
+        raise NotImplementedError
+
+    def readFrames(self, timeout: float) -> List[Tuple[BatchFrameHeader, memoryview]]:
+        """Receives the complete data frames that are available, without decoding their payloads. Control 
+        frames are handled here: watermarks update `getWatermark()`, and an END_OF_STREAM frame ends the stream.
+
+        Args:
+            timeout (float): Maximum time to wait for bytes.
+
+        Returns:
+            (List[Tuple[BatchFrameHeader, memoryview]]): The header and payload of each data frame, or None 
+                if the stream has ended.
+        """
+        if self.end_of_stream:
+            return None
+        message = self.recv(timeout)
+        if message is None:
+            return []
+        if not message: # The transport closed without an END_OF_STREAM frame
+            self.end_of_stream = True
+            return None
+        self.decoder.feed(message)
+        frames = []
+        for header, payload in self.decoder.frames():
+            if header.isEndOfStream():
+                self.end_of_stream = True
+                break
+            if header.isWatermark():
+                self.watermark = header.max_event_time
+                continue
+            frames.append((header, payload))
+        if self.end_of_stream and not frames:
+            return None
+        return frames
+
+    def read(self, timeout: float) -> List[object]:
+        frames = self.readFrames(timeout)
+        if frames is None:
+            return None
+        if len(frames) == 1:
+            header, payload = frames[0]
+            return self.in_serializer.read_many(payload, header.record_count)
+        records = []
+        for header, payload in frames:
+            records.extend(self.in_serializer.read_many(payload, header.record_count))
+        return records
+
+    def getWatermark(self) -> float:
+        return self.watermark
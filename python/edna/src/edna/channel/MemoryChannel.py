@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from edna.channel import ChannelWriter, ChannelReader
+from edna.defaults import EdnaDefault
+
+from typing import List
+import queue
+import threading
+
+
+class MemoryChannel:
+    """A MemoryChannel connects two task primitives running in the same process. Batches of records are
+    handed over as Python objects through a bounded queue, so records are never serialized and never
+    copied through the kernel. The writer blocks when `max_batches` batches are waiting, which applies
+    backpressure to the sending task. If the reader is closed while the writer is blocked, e.g. because the 
+    receiving task failed, the writer raises `BrokenPipeError` instead of waiting forever.
+    """
+    channel_queue: queue.Queue
+    reader_closed: threading.Event
+    def __init__(self, max_batches: int = EdnaDefault.CHANNEL_MAX_BATCHES):
+        """Initializes the MemoryChannel.
+
+        Args:
+            max_batches (int, optional): Maximum number of batches waiting in the channel. 
+                Defaults to EdnaDefault.CHANNEL_MAX_BATCHES.
+        """
+        self.channel_queue = queue.Queue(maxsize=max_batches)
+        self.reader_closed = threading.Event()
+        self.writer = MemoryChannelWriter(self.channel_queue, self.reader_closed)
+        self.reader = MemoryChannelReader(self.channel_queue, self.reader_closed)
+
+    def getWriter(self) -> MemoryChannelWriter:
+        return self.writer
+
+    def getReader(self) -> MemoryChannelReader:
+        return self.reader
+
+
+class MemoryChannelWriter(ChannelWriter):
+    END_OF_STREAM = None    # Placed in the queue by `close()`
+    def __init__(self, channel_queue: queue.Queue, reader_closed: threading.Event):
+        self.channel_queue = channel_queue
+        self.reader_closed = reader_closed
+
+    def write(self, records: List[object]):
+        if records:
+            self._put(records)
+
+    def close(self):
+        self._put(self.END_OF_STREAM)
+
+    def _put(self, item):
+        while True:
+            if self.reader_closed.is_set():
+                raise BrokenPipeError("The reader of the MemoryChannel is closed")
+            try:
+                self.channel_queue.put(item, timeout=EdnaDefault.POLL_TIMEOUT)
+                return
+            except queue.Full:
+                pass
+
+
+class MemoryChannelReader(ChannelReader):
+    def __init__(self, channel_queue: queue.Queue, reader_closed: threading.Event):
+        self.channel_queue = channel_queue
+        self.reader_closed = reader_closed
+
+    def read(self, timeout: float) -> List[object]:
+        try:
+            records = self.channel_queue.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        if records is MemoryChannelWriter.END_OF_STREAM:
+            return None
+        return records
+
+    def close(self):
+        self.reader_closed.set()
\ No newline at end of file
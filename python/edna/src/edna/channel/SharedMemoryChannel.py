@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from edna.channel.ByteChannel import ByteChannelWriter, ByteChannelReader
+from edna.defaults import EdnaDefault
+from edna.serializers import Serializable, BufferedSerializable
+from edna.serializers.MsgPackBufferedSerializable import MsgPackBufferedSerializer
+
+from multiprocessing import shared_memory
+from typing import Callable
+import os
+import platform
+import struct
+import time
+import warnings
+
+# Architectures whose stores become visible to other cores in program order (total store order)
+_STORE_ORDERED_MACHINES = ("x86_64", "amd64", "i386", "i686", "x86")
+
+
+class SharedMemoryRingBuffer:
+    """A single-producer/single-consumer ring buffer of length-prefixed frames in a
+    `multiprocessing.shared_memory.SharedMemory` segment. The writer and the reader may live in
+    different processes: the reader creates the segment, and the writer attaches to it by `name`.
+
+    The segment starts with a header holding the total number of bytes written, the total number of bytes
+    read, a closed flag for each side, and the process id of each side. Each counter has a single owner, and 
+    the writer only publishes a frame after it is fully copied. Python has no memory barriers, so this is only
+    safe without locks where stores become visible in program order, i.e. on x86 and x86-64. A warning is 
+    raised when the ring buffer is created on any other architecture.
+
+    Each side polls with a short backoff when the buffer is empty (reader) or full (writer). While polling,
+    each side checks that its peer is still alive, and raises `BrokenPipeError` if the peer process exited 
+    or closed its end, so neither side waits forever on a dead peer.
+    """
+    HEADER = struct.Struct("QQ??II")   # bytes written, bytes read, writer closed, reader closed, writer pid, reader pid
+    HEADER_SIZE : int = 64
+    WRITER_CLOSED_OFFSET : int = 16
+    READER_CLOSED_OFFSET : int = 17
+    WRITER_PID_OFFSET : int = 20
+    READER_PID_OFFSET : int = 24
+    FRAME_PREFIX = struct.Struct("I")
+    shm: shared_memory.SharedMemory
+    def __init__(self, name: str = None, capacity: int = EdnaDefault.CHANNEL_SHARED_MEMORY_SIZE):
+        """Creates a new ring buffer, or attaches to an existing one if `name` is provided.
+
+        Args:
+            name (str, optional): Name of an existing segment to attach to. Defaults to None, which creates a new segment.
+            capacity (int, optional): Size of the ring in bytes, for a new segment. Defaults to EdnaDefault.CHANNEL_SHARED_MEMORY_SIZE.
+        """
+        self.owner = name is None
+        if self.owner:
+            if platform.machine().lower() not in _STORE_ORDERED_MACHINES:
+                warnings.warn("SharedMemoryRingBuffer relies on ordered stores, which {machine} does not guarantee. Use a "
+                    "UnixSocketChannel to connect tasks in different processes on this platform.".format(machine=platform.machine()))
+            self.shm = shared_memory.SharedMemory(create=True, size=self.HEADER_SIZE + capacity)
+            self.HEADER.pack_into(self.shm.buf, 0, 0, 0, False, False, 0, os.getpid())
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            struct.pack_into("I", self.shm.buf, self.WRITER_PID_OFFSET, os.getpid())
+        self.name = self.shm.name
+        self.capacity = self.shm.size - self.HEADER_SIZE
+        self.ring = self.shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + self.capacity]
+        # Frames larger than this are split, so a frame always fits into an empty ring
+        self.max_frame_size = self.capacity // 2 - self.FRAME_PREFIX.size
+
+    def getWritten(self) -> int:
+        return struct.unpack_from("Q", self.shm.buf, 0)[0]
+
+    def getRead(self) -> int:
+        return struct.unpack_from("Q", self.shm.buf, 8)[0]
+
+    def isClosed(self) -> bool:
+        return struct.unpack_from("?", self.shm.buf, self.WRITER_CLOSED_OFFSET)[0]
+
+    def isReaderClosed(self) -> bool:
+        return struct.unpack_from("?", self.shm.buf, self.READER_CLOSED_OFFSET)[0]
+
+    def _isAlive(self, pid_offset: int) -> bool:
+        pid = struct.unpack_from("I", self.shm.buf, pid_offset)[0]
+        if pid == 0:    # The peer has not attached yet
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:     # The process exists, but belongs to another user
+            return True
+        return True
+
+    def _checkReader(self):
+        if self.isReaderClosed() or not self._isAlive(self.READER_PID_OFFSET):
+            raise BrokenPipeError("The reader of shared memory segment {name} is closed or has exited".format(name=self.name))
+
+    def _checkWriter(self):
+        if not self._isAlive(self.WRITER_PID_OFFSET):
+            raise BrokenPipeError("The writer of shared memory segment {name} has exited".format(name=self.name))
+
+    def _copyIn(self, position: int, data):
+        start = position % self.capacity
+        first = min(len(data), self.capacity - start)
+        self.ring[start:start + first] = data[:first]
+        if first < len(data):   # Wrap around to the start of the ring
+            self.ring[:len(data) - first] = data[first:]
+
+    def _copyOut(self, position: int, length: int) -> bytes:
+        start = position % self.capacity
+        first = min(length, self.capacity - start)
+        if first == length:
+            return bytes(self.ring[start:start + length])
+        return bytes(self.ring[start:]) + bytes(self.ring[:length - first])
+
+    def _wait(self, ready, timeout: float = None, check_peer: Callable[[], None] = None) -> bool:
+        deadline = None if timeout is None else time.time() + timeout
+        backoff = EdnaDefault.CHANNEL_POLL_MIN_S
+        while not ready():
+            if deadline is not None and time.time() >= deadline:
+                return False
+            if check_peer is not None and backoff == EdnaDefault.CHANNEL_POLL_MAX_S:
+                check_peer()    # Only once the backoff has grown, so short waits skip the syscall
+            time.sleep(backoff)
+            backoff = min(backoff * 2, EdnaDefault.CHANNEL_POLL_MAX_S)
+        return True
+
+    def sendall(self, data: bytes, timeout: float = None):
+        """Writes `data` into the ring as one or more frames, waiting for the reader to free space if needed.
+
+        Args:
+            data (bytes): The bytes to write.
+            timeout (float, optional): Maximum time to wait for space for each frame. Defaults to None, i.e. wait 
+                as long as the reader is alive.
+
+        Raises:
+            BrokenPipeError: Raised if the reader closed its end or exited while waiting for space.
+            TimeoutError: Raised if there was no space for a frame within `timeout`.
+        """
+        view = memoryview(data)
+        for offset in range(0, len(view), self.max_frame_size):
+            frame = view[offset:offset + self.max_frame_size]
+            frame_size = self.FRAME_PREFIX.size + len(frame)
+            written = self.getWritten()
+            if not self._wait(lambda: self.capacity - (written - self.getRead()) >= frame_size, timeout, self._checkReader):
+                raise TimeoutError("No space in shared memory segment {name} within {timeout}s".format(name=self.name, timeout=timeout))
+            self._copyIn(written, self.FRAME_PREFIX.pack(len(frame)))
+            self._copyIn(written + self.FRAME_PREFIX.size, frame)
+            struct.pack_into("Q", self.shm.buf, 0, written + frame_size)    # Publish the frame
+
+    def recv(self, timeout: float = None) -> bytes:
+        """Reads the next frame from the ring.
+
+        Args:
+            timeout (float, optional): Maximum time to wait for a frame. Defaults to None, i.e. wait indefinitely.
+
+        Raises:
+            BrokenPipeError: Raised if the writer exited without closing the ring buffer while waiting for a frame.
+
+        Returns:
+            (bytes): The frame, None if no frame arrived within `timeout`, or b'' if the writer closed the 
+                ring buffer and all frames have been read.
+        """
+        read = self.getRead()
+        if not self._wait(lambda: self.getWritten() > read or self.isClosed(), timeout, self._checkWriter):
+            return None
+        if self.getWritten() == read:   # Closed, and nothing left to read
+            return b''
+        frame_length = self.FRAME_PREFIX.unpack(self._copyOut(read, self.FRAME_PREFIX.size))[0]
+        frame = self._copyOut(read + self.FRAME_PREFIX.size, frame_length)
+        struct.pack_into("Q", self.shm.buf, 8, read + self.FRAME_PREFIX.size + frame_length)  # Free the frame
+        return frame
+
+    def close(self):
+        """Closes this end of the ring buffer. The writer marks the ring buffer closed, which signals the end 
+        of the stream to the reader. The reader, which owns the segment, marks its end closed, so a waiting
+        writer raises instead of blocking, and also unlinks the segment."""
+        if self.owner:
+            struct.pack_into("?", self.shm.buf, self.READER_CLOSED_OFFSET, True)
+        else:
+            struct.pack_into("?", self.shm.buf, self.WRITER_CLOSED_OFFSET, True)
+        self.ring.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class SharedMemoryChannel:
+    """A SharedMemoryChannel connects two task primitives on the same host through a `SharedMemoryRingBuffer`.
+    Records are serialized into a `ByteBuffer` by the writer, and each flush of the buffer becomes one frame
+    in the ring. Tasks in other processes on the host can attach a `SharedMemoryChannelWriter` to `name`.
+    """
+    def __init__(self, capacity: int = EdnaDefault.CHANNEL_SHARED_MEMORY_SIZE,
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE,
+            in_serializer: BufferedSerializable = None,
+            out_serializer: Serializable = None,
+            event_time: Callable[[object], float] = None):
+        """Initializes both ends of the SharedMemoryChannel.
+
+        Args:
+            capacity (int, optional): Size of the ring in bytes. Defaults to EdnaDefault.CHANNEL_SHARED_MEMORY_SIZE.
+            max_buffer_size (int, optional): Size of the writer's ByteBuffer. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            in_serializer (BufferedSerializable, optional): Serializer for the reader. Defaults to a `MsgPackBufferedSerializer`.
+            out_serializer (Serializable, optional): Serializer for the writer. Defaults to a `MsgPackBufferedSerializer`.
+            event_time (Callable[[obj], float], optional): Extracts the event time of a record for the frame headers. Defaults to None.
+        """
+        in_serializer = in_serializer if in_serializer is not None else MsgPackBufferedSerializer()
+        out_serializer = out_serializer if out_serializer is not None else MsgPackBufferedSerializer()
+        self.reader = SharedMemoryChannelReader(in_serializer=in_serializer, capacity=capacity)
+        self.name = self.reader.name
+        self.writer = SharedMemoryChannelWriter(name=self.name, out_serializer=out_serializer, 
+                max_buffer_size=max_buffer_size, event_time=event_time)
+
+    def getWriter(self) -> SharedMemoryChannelWriter:
+        return self.writer
+
+    def getReader(self) -> SharedMemoryChannelReader:
+        return self.reader
+
+
+class SharedMemoryChannelWriter(ByteChannelWriter):
+    sender: SharedMemoryRingBuffer
+    def __init__(self, name: str, out_serializer: Serializable, 
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE,
+            event_time: Callable[[object], float] = None):
+        super().__init__(sender=SharedMemoryRingBuffer(name=name), out_serializer=out_serializer, 
+                max_buffer_size=max_buffer_size, event_time=event_time)
+
+
+class SharedMemoryChannelReader(ByteChannelReader):
+    ring_buffer: SharedMemoryRingBuffer
+    def __init__(self, in_serializer: BufferedSerializable, capacity: int = EdnaDefault.CHANNEL_SHARED_MEMORY_SIZE):
+        super().__init__(in_serializer=in_serializer)
+        self.ring_buffer = SharedMemoryRingBuffer(capacity=capacity)
+        self.name = self.ring_buffer.name
+
+    def recv(self, timeout: float) -> bytes:
+        return self.ring_buffer.recv(timeout)
+
+    def close(self):
+        self.ring_buffer.close()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from edna.channel.ByteChannel import ByteChannelWriter, ByteChannelReader
+from edna.defaults import EdnaDefault
+from edna.serializers import Serializable, BufferedSerializable
+
+from typing import Callable
+from edna.serializers.MsgPackBufferedSerializable import MsgPackBufferedSerializer
+
+import socket
+
+
+class SocketChannel:
+    """A SocketChannel connects two task primitives over a TCP socket on `EdnaDefault.TASK_PRIMITIVE_HOST`. 
+    Records are serialized into a `ByteBuffer` by the writer and deserialized with a `BufferedSerializable`
+    by the reader. The reader is created first and binds to `port` (or a port chosen by the OS if `port` is 0), 
+    then the writer connects to it.
+    """
+    family: socket.AddressFamily = socket.AF_INET
+    reader_class: type = None   # Defaults to SocketChannelReader
+    writer_class: type = None   # Defaults to SocketChannelWriter
+    def __init__(self, port: int = 0, 
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE,
+            in_serializer: BufferedSerializable = None,
+            out_serializer: Serializable = None,
+            event_time: Callable[[object], float] = None):
+        """Initializes both ends of the SocketChannel.
+
+        Args:
+            port (int, optional): Port for the reader to listen on. Defaults to 0, i.e. a port chosen by the OS.
+            max_buffer_size (int, optional): Size of the writer's ByteBuffer and of each `recv()`. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            in_serializer (BufferedSerializable, optional): Serializer for the reader. Defaults to a `MsgPackBufferedSerializer`.
+            out_serializer (Serializable, optional): Serializer for the writer. Defaults to a `MsgPackBufferedSerializer`.
+            event_time (Callable[[obj], float], optional): Extracts the event time of a record for the frame headers. Defaults to None.
+        """
+        self.buildChannel(address=(EdnaDefault.TASK_PRIMITIVE_HOST, port), max_buffer_size=max_buffer_size,
+                in_serializer=in_serializer, out_serializer=out_serializer, event_time=event_time)
+
+    def buildChannel(self, address, max_buffer_size: int, in_serializer: BufferedSerializable, out_serializer: Serializable,
+            event_time: Callable[[object], float] = None):
+        in_serializer = in_serializer if in_serializer is not None else MsgPackBufferedSerializer()
+        out_serializer = out_serializer if out_serializer is not None else MsgPackBufferedSerializer()
+        reader_class = self.reader_class if self.reader_class is not None else SocketChannelReader
+        writer_class = self.writer_class if self.writer_class is not None else SocketChannelWriter
+        self.reader = reader_class(address=address, family=self.family, 
+                in_serializer=in_serializer, max_buffer_size=max_buffer_size)
+        self.writer = writer_class(address=self.reader.address, family=self.family, 
+                out_serializer=out_serializer, max_buffer_size=max_buffer_size, event_time=event_time)
+
+    def getWriter(self) -> SocketChannelWriter:
+        return self.writer
+
+    def getReader(self) -> SocketChannelReader:
+        return self.reader
+
+
+class SocketChannelWriter(ByteChannelWriter):
+    sender: socket.socket
+    def __init__(self, address, out_serializer: Serializable, 
+            family: socket.AddressFamily = socket.AF_INET, 
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE,
+            event_time: Callable[[object], float] = None):
+        self.address = address
+        sender = socket.socket(family, socket.SOCK_STREAM)
+        sender.connect(self.address)
+        super().__init__(sender=sender, out_serializer=out_serializer, max_buffer_size=max_buffer_size, event_time=event_time)
+
+
+class SocketChannelReader(ByteChannelReader):
+    receiver: socket.socket
+    client: socket.socket
+    def __init__(self, address, in_serializer: BufferedSerializable, 
+            family: socket.AddressFamily = socket.AF_INET, 
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE):
+        super().__init__(in_serializer=in_serializer, max_buffer_size=max_buffer_size)
+        self.receiver = socket.socket(family, socket.SOCK_STREAM)
+        self.receiver.bind(address)
+        self.receiver.listen(1)
+        self.address = self.receiver.getsockname()
+        self.client = None
+        self.receive_buffer = bytearray(self.max_buffer_size)   # Reused by every recv()
+        self.receive_view = memoryview(self.receive_buffer)
+
+    def recv(self, timeout: float) -> bytes:
+        if self.client is None:
+            self.receiver.settimeout(timeout)
+            try:
+                self.client, _ = self.receiver.accept()
+            except socket.timeout:
+                return None
+        self.client.settimeout(timeout)
+        try:
+            received = self.client.recv_into(self.receive_view)
+        except socket.timeout:
+            return None
+        return self.receive_view[:received]
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+        self.receiver.close()
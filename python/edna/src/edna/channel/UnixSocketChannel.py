@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from edna.channel.SocketChannel import SocketChannel, SocketChannelReader
+from edna.defaults import EdnaDefault
+from edna.serializers import Serializable, BufferedSerializable
+
+from typing import Callable
+
+import os
+import socket
+import tempfile
+
+
+class UnixSocketChannelReader(SocketChannelReader):
+    """Removes the socket file when the reader is closed."""
+    def close(self):
+        super().close()
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+        socket_dir = os.path.dirname(self.address)
+        if os.path.basename(socket_dir).startswith(EdnaDefault.CHANNEL_SOCKET_PREFIX):
+            try:    # Remove the temporary directory created by UnixSocketChannel, if it is now empty
+                os.rmdir(socket_dir)
+            except OSError:
+                pass
+
+
+class UnixSocketChannel(SocketChannel):
+    """A UnixSocketChannel connects two task primitives on the same host over an AF_UNIX socket. It avoids
+    the loopback TCP stack and does not need a port; the socket is a file that is removed when the reader 
+    is closed. Tasks in other processes on the host can connect to `path`.
+    """
+    family: socket.AddressFamily = socket.AF_UNIX
+    reader_class: type = UnixSocketChannelReader
+    def __init__(self, path: str = None, 
+            max_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE,
+            in_serializer: BufferedSerializable = None,
+            out_serializer: Serializable = None,
+            event_time: Callable[[object], float] = None):
+        """Initializes both ends of the UnixSocketChannel.
+
+        Args:
+            path (str, optional): Path of the socket file. Defaults to None, i.e. a new file in a temporary directory.
+            max_buffer_size (int, optional): Size of the writer's ByteBuffer and of each `recv()`. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            in_serializer (BufferedSerializable, optional): Serializer for the reader. Defaults to a `MsgPackBufferedSerializer`.
+            out_serializer (Serializable, optional): Serializer for the writer. Defaults to a `MsgPackBufferedSerializer`.
+            event_time (Callable[[obj], float], optional): Extracts the event time of a record for the frame headers. Defaults to None.
+        """
+        if path is None:
+            path = os.path.join(tempfile.mkdtemp(prefix=EdnaDefault.CHANNEL_SOCKET_PREFIX), "channel.sock")
+        self.path = path
+        self.buildChannel(address=self.path, max_buffer_size=max_buffer_size,
+                in_serializer=in_serializer, out_serializer=out_serializer, event_time=event_time)
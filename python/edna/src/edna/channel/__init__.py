@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import List
+
+
+class ChannelWriter(object):
+    """ChannelWriter is the sending end of a channel between two task primitives.
+
+    Any child class must:
+
+    - Implement the `write()` method to send a batch of records
+
+    - Implement the `close()` method to flush any pending records and signal the end of the stream
+    """
+    def write(self, records: List[object]):
+        """Sends a batch of records to the receiving task.
+
+        Args:
+            records (List[obj]): The records to send.
+
+        Raises:
+            NotImplementedError: Child classes should implement this method.
+        """
+        raise NotImplementedError
+
+    def writeWatermark(self, watermark: float):
+        """Sends a watermark to the receiving task. Writers that do not carry watermarks ignore it.
+
+        Args:
+            watermark (float): The event time up to which the stream is complete.
+        """
+        pass
+
+    def flush(self):
+        """Sends any records held back by the writer. Writers that do not hold back records do not need to override this."""
+        pass
+
+    def close(self):
+        """Flushes the writer and signals the end of the stream to the receiving task.
+
+        Raises:
+            NotImplementedError: Child classes should implement this method.
+        """
+        raise NotImplementedError
+
+
+class ChannelReader(object):
+    """ChannelReader is the receiving end of a channel between two task primitives.
+
+    Any child class must:
+
+    - Implement the `read()` method to receive a batch of records
+    """
+    def read(self, timeout: float) -> List[object]:
+        """Receives the records that are available, waiting up to `timeout` for at least one.
+
+        Args:
+            timeout (float): Maximum time to wait for records.
+
+        Raises:
+            NotImplementedError: Child classes should implement this method.
+
+        Returns:
+            (List[obj]): The received records, an empty list if none arrived within `timeout`, or None 
+                if the sending task closed the channel.
+        """
+        raise NotImplementedError
+
+    def getWatermark(self) -> float:
+        """Get the last watermark received from the sending task.
+
+        Returns:
+            (float): The watermark, or None if no watermark has been received.
+        """
+        return None
+
+    def close(self):
+        """Releases any resources held by the reader."""
+        pass
+
+from .MemoryChannel import MemoryChannel
+from .SocketChannel import SocketChannel
+from .UnixSocketChannel import UnixSocketChannel
+from .SharedMemoryChannel import SharedMemoryChannel
\ No newline at end of file
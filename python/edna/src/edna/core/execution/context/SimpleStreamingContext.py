@@ -1,7 +1,12 @@
 from edna.core.execution.context import EdnaContext
 from edna.core.configuration import StreamingConfiguration
 from edna.types.enums import IngestPattern
+from edna.defaults import EdnaDefault
+import collections
 import concurrent.futures
+import pickle
+import threading
+import queue
 
 from edna.exception import PrimitiveNotSetException
 
@@ -10,9 +15,33 @@ from edna.process import BaseProcess
 from edna.emit import BaseEmit
 
 
+_worker_process = None  # The copy of the process primitive held by a worker process
+
+
+def _initProcessWorker(pickled_process: bytes):
+    global _worker_process
+    _worker_process = pickle.loads(pickled_process)
+
+
+def _runProcessWorker(streaming_records):
+    # Workers release held back records right away, since the next batch may go to another worker
+    processed_records = _worker_process(streaming_records)
+    released_records = _worker_process.flush()
+    if released_records:    # The processed records are not necessarily a list, e.g. a FeatureBatch
+        processed_records = list(processed_records) + list(released_records)
+    return processed_records
+
+
 class SimpleStreamingContext(EdnaContext):
     """A `SimpleStreamingContext` is the context for a simple EDNA Job. TODO update this.
     It uses 2 threads - 1 thread for the ingest, and 1 thread for the process and emit.
+    The ingest thread continuously prefetches batches of records into a bounded queue, and the process
+    and emit thread blocks on this queue until batches are available.
+
+    With `process_workers`, batches are instead processed in a pool of worker processes, each holding a pickled
+    copy of the process primitive, so CPU-bound processes can use more than one core. The process primitive
+    (including any callables it holds) must then be picklable. The processed batches are emitted in the order
+    they were ingested, or, with `process_ordered=False`, as soon as they are done.
     It provides methods to control the job execution and to configure job variables.
     See docs for edna.core.execution.context.EdnaContext to initialize
 
@@ -20,6 +49,8 @@ class SimpleStreamingContext(EdnaContext):
         ingest (BaseIngest): Stores a reference to an ingest primitive.
         process (BaseProcess): Stores a reference to a process primitive.
         emit (BaseEmit): Stores a reference to an emit primitive
+        ingest_queue (queue.Queue): Bounded queue of prefetched record batches between the ingest thread 
+            and the process/emit thread.
 
     Args:
         EdnaContext ([Abstract Base Class]): An abstract class for all Contexts that provides the interface for interacting with a Context.
@@ -27,7 +58,15 @@ class SimpleStreamingContext(EdnaContext):
     ingest: BaseIngest
     process: BaseProcess
     emit: BaseEmit
-    def __init__(self, dir : str = ".", confpath : str = "ednaconf.yaml", confclass: StreamingConfiguration = StreamingConfiguration):
+    ingest_queue: queue.Queue
+    _END_OF_STREAM = object()   # Sentinel placed in `ingest_queue` once the ingest is exhausted
+    def __init__(self, dir : str = ".", confpath : str = "ednaconf.yaml", confclass: StreamingConfiguration = StreamingConfiguration,
+            ingest_prefetch_depth: int = EdnaDefault.INGEST_PREFETCH_DEPTH,
+            ingest_batch_size: int = EdnaDefault.INGEST_BATCH_MAX_RECORDS,
+            ingest_batch_timeout: float = EdnaDefault.INGEST_BATCH_MAX_WAIT_S,
+            process_workers: int = None,
+            process_ordered: bool = True,
+            process_max_inflight: int = None):
         """Initialize the SimpleStreamingContext to accept an EDNA job and configuration.
 
         Args:
@@ -36,8 +75,38 @@ class SimpleStreamingContext(EdnaContext):
                 fields from this file]. Defaults to "ednaconf.yaml".
             confclass (StreamingConfiguration, optional): [Object to store and interact with the Configuration]. 
                 Defaults to edna.core.configuration.StreamingConfiguration.
-        """        
+            ingest_prefetch_depth (int, optional): [Maximum number of ingested batches the ingest thread can 
+                prefetch ahead of the process and emit thread]. Defaults to `EdnaDefault.INGEST_PREFETCH_DEPTH`.
+            ingest_batch_size (int, optional): [Maximum number of records the ingest fetches in one batch]. 
+                Defaults to `EdnaDefault.INGEST_BATCH_MAX_RECORDS`.
+            ingest_batch_timeout (float, optional): [Maximum time (in s) the ingest waits for a batch to fill]. 
+                Defaults to `EdnaDefault.INGEST_BATCH_MAX_WAIT_S`.
+            process_workers (int, optional): [Number of worker processes to process batches in]. Defaults to None, 
+                which processes batches on the process and emit thread.
+            process_ordered (bool, optional): [Whether to emit processed batches in the order they were ingested]. 
+                Defaults to True.
+            process_max_inflight (int, optional): [Maximum number of batches being processed by the workers at once]. 
+                Defaults to twice `process_workers`.
+        """
+        if ingest_prefetch_depth <= 0:
+            raise ValueError("ingest_prefetch_depth must be positive; received {ingest_prefetch_depth}".format(ingest_prefetch_depth=ingest_prefetch_depth))
+        if ingest_batch_size <= 0:
+            raise ValueError("ingest_batch_size must be positive; received {ingest_batch_size}".format(ingest_batch_size=ingest_batch_size))
+        if process_workers is not None and process_workers <= 0:
+            raise ValueError("process_workers must be positive; received {process_workers}".format(process_workers=process_workers))
+        if process_max_inflight is not None and process_max_inflight <= 0:
+            raise ValueError("process_max_inflight must be positive; received {process_max_inflight}".format(process_max_inflight=process_max_inflight))
+        self.ingest_prefetch_depth = ingest_prefetch_depth
+        self.ingest_batch_size = ingest_batch_size
+        self.ingest_batch_timeout_s = ingest_batch_timeout
+        self.ingest_queue = queue.Queue(maxsize=self.ingest_prefetch_depth)
+        self.ingest_stop = threading.Event()
         self.ingest_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.process_workers = process_workers
+        self.process_ordered = process_ordered
+        if process_max_inflight is None and process_workers is not None:
+            process_max_inflight = 2 * process_workers
+        self.process_max_inflight = process_max_inflight
         super().__init__(dir=dir, confpath=confpath, confclass=confclass)
     
     def addIngest(self, ingest: BaseIngest):
@@ -78,17 +147,125 @@ class SimpleStreamingContext(EdnaContext):
             raise PrimitiveNotSetException("StreamingContext", "Emit")
 
         if self.ingest.execution_mode == IngestPattern.CLIENT_SIDE_STREAM:
-            while True:
-                record_future = self.ingest_executor.submit(next, self.ingest)
-                while not record_future.done():
-                    pass    # Perform buffering?
-                streaming_record = record_future.result()
-                self.emit(self.process(streaming_record)) # Serialization verification TODO
+            self.ingest_stop.clear()
+            ingest_future = self.ingest_executor.submit(self._prefetchIngest)
+            try:
+                if self.process_workers is None:
+                    self._processBatches()
+                else:
+                    self._processBatchesInWorkers()
+            finally:
+                self.ingest_stop.set()
+            ingest_future.result()  # Propagates any exception raised in the ingest thread
         if self.ingest.execution_mode == IngestPattern.SERVER_SIDE_STREAM:
             raise NotImplementedError
 
-    
-            
+    def _getIngestBatch(self):
+        """Waits for a batch of records from the ingest thread.
+
+        Returns:
+            (List[obj]): The batch, None if no batch arrived in time, or `_END_OF_STREAM`.
+        """
+        try:
+            return self.ingest_queue.get(timeout=EdnaDefault.POLL_TIMEOUT)
+        except queue.Empty:
+            return None
+
+    def _processBatches(self):
+        """Processes and emits batches from the ingest thread on this thread until the stream ends."""
+        while True:
+            streaming_records = self._getIngestBatch()
+            if streaming_records is self._END_OF_STREAM:
+                break
+            if streaming_records:
+                self.emit(self.process(streaming_records)) # Serialization verification TODO
+            # Records the process held back for too long, e.g. in a partially filled batch
+            released_records = self.process.flush(expired_only=True)
+            if released_records:
+                self.emit(released_records)
+        released_records = self.process.flush()
+        if released_records:
+            self.emit(released_records)
+        self.emit.flush()   # Write the last, partially filled emit buffer
+
+    def _processBatchesInWorkers(self):
+        """Sends batches from the ingest thread to the worker processes, and emits the processed batches, 
+        until the stream ends. At most `process_max_inflight` batches are sent before their results are emitted.
+        An exception raised by a worker is re-raised here.
+        """
+        process_executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.process_workers, 
+                                initializer=_initProcessWorker, initargs=(pickle.dumps(self.process),))
+        inflight_batches = collections.deque()  # Futures of the processed batches, in the order they were sent
+        try:
+            while True:
+                streaming_records = self._getIngestBatch()
+                if streaming_records is self._END_OF_STREAM:
+                    break
+                if streaming_records:
+                    while len(inflight_batches) >= self.process_max_inflight:
+                        self._emitProcessedBatches(inflight_batches, block=True)
+                    inflight_batches.append(process_executor.submit(_runProcessWorker, streaming_records))
+                self._emitProcessedBatches(inflight_batches, block=False)
+            while inflight_batches:
+                self._emitProcessedBatches(inflight_batches, block=True)
+            self.emit.flush()   # Write the last, partially filled emit buffer
+        finally:
+            for inflight_batch in inflight_batches:
+                inflight_batch.cancel()
+            process_executor.shutdown(wait=True)
+
+    def _emitProcessedBatches(self, inflight_batches: collections.deque, block: bool):
+        """Emits the processed batches that are done. If `process_ordered` is set, a batch is only emitted after
+        all batches sent before it, so `inflight_batches` doubles as the reorder buffer.
+
+        Args:
+            inflight_batches (collections.deque): Futures of the processed batches, in the order they were sent.
+            block (bool): Wait until at least one batch can be emitted.
+        """
+        if self.process_ordered:
+            if block:
+                concurrent.futures.wait([inflight_batches[0]])
+            while inflight_batches and inflight_batches[0].done():
+                self.emit(inflight_batches.popleft().result())
+        else:
+            done_batches, _ = concurrent.futures.wait(inflight_batches, timeout=None if block else 0, 
+                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for done_batch in done_batches:
+                inflight_batches.remove(done_batch)
+                self.emit(done_batch.result())
+
+    def _prefetchIngest(self):
+        """Runs on the ingest thread. Pulls batches of records from the ingest primitive and places them in 
+        `ingest_queue` until the ingest is exhausted or the process/emit thread stops. The end of the stream 
+        is marked with a sentinel so the process/emit thread does not block forever.
+        """
+        try:
+            while not self.ingest_stop.is_set():
+                try:
+                    streaming_records = self.ingest.fetch_batch(self.ingest_batch_size, self.ingest_batch_timeout_s)
+                except StopIteration:
+                    return
+                if streaming_records and not self._putIngestBatch(streaming_records):
+                    return
+        finally:
+            self._putIngestBatch(self._END_OF_STREAM)
+
+    def _putIngestBatch(self, streaming_records) -> bool:
+        """Places a batch of records in `ingest_queue`, waiting while the queue is full. 
+
+        Args:
+            streaming_records (List[obj]): Batch of records (or sentinel) to place in the queue.
+
+        Returns:
+            bool: False if the process/emit thread stopped before the batch could be placed.
+        """
+        while not self.ingest_stop.is_set():
+            try:
+                self.ingest_queue.put(streaming_records, timeout=EdnaDefault.POLL_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
 
         
     
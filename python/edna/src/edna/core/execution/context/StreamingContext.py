@@ -13,7 +13,10 @@ from edna.core.plans.streamgraph import StreamGraphFlattener
 from edna.core.plans.physicalgraph import PhysicalGraph
 from edna.core.plans.physicalgraph import PhysicalGraphBuilder
 
-import pdb
+from edna.core.plans.executiongraph import ExecutionGraph
+from edna.core.plans.executiongraph import ExecutionGraphBuilder
+
+from edna.types.enums import ChannelType
 
 class StreamingContext(EdnaContext):
     transformation_id : int = -1 # Running count of transformation ids
@@ -21,13 +24,32 @@ class StreamingContext(EdnaContext):
     datastream_id : int = -1
     stream_collection : Dict[int, DataStream] = {}
     stream_graph: StreamGraph = None
+    chaining_enabled : bool = True
+    channel_type : ChannelType = None
+    projection_enabled : bool = False
 
     logical_stream_graph : StreamGraph
     physical_graph : PhysicalGraph
-    # physical_stream_graph
-    # execution_graph
-
-    def __init__(self, dir : str = ".", confpath : str = "ednaconf.yaml", confclass: StreamingConfiguration = StreamingConfiguration):
+    execution_graph : ExecutionGraph
+
+    def __init__(self, dir : str = ".", confpath : str = "ednaconf.yaml", confclass: StreamingConfiguration = StreamingConfiguration,
+            enable_chaining: bool = True, channel_type: ChannelType = None, enable_projection: bool = False):
+        """Initialize the StreamingContext to accept DataStreams and configuration.
+
+        Args:
+            dir (str, optional): The directory for the job configuration. Defaults to the current directory "."
+            confpath (str, optional): A YAML configuration file for the job. Defaults to "ednaconf.yaml".
+            confclass (StreamingConfiguration, optional): Object to store and interact with the Configuration. 
+                Defaults to edna.core.configuration.StreamingConfiguration.
+            enable_chaining (bool, optional): Whether the planner fuses 1-to-1 operators into a single task. 
+                Defaults to True.
+            channel_type (ChannelType, optional): The channel used between tasks. Defaults to None, which lets 
+                the ExecutionGraphBuilder pick in-memory channels, since all tasks run in this process.
+            enable_projection (bool, optional): Whether the planner restricts JSON parsing to the fields that
+                downstream operators read. The planner projects copies of the JSON parsers, so the processes 
+                passed to the streams are not modified. Only the simdjson backend skips the other fields while 
+                parsing; the other backends parse each document in full and then drop them. Defaults to False.
+        """
         super().__init__(dir=dir, confpath=confpath, confclass=confclass)
 
         self.transformation_id = -1
@@ -35,6 +57,9 @@ class StreamingContext(EdnaContext):
         self.datastream_id = -1
         self.stream_collection = {}
         self.stream_graph = None
+        self.chaining_enabled = enable_chaining
+        self.channel_type = channel_type
+        self.projection_enabled = enable_projection
 
 
     def getTransformationId(self):
@@ -49,6 +74,31 @@ class StreamingContext(EdnaContext):
         self.physical_node_id += 1
         return self.physical_node_id
 
+    def enableChaining(self):
+        """Allow the planner to fuse 1-to-1 operators into a single task."""
+        self.chaining_enabled = True
+
+    def disableChaining(self):
+        """Prevent the planner from fusing operators. Each operator then runs as its own task."""
+        self.chaining_enabled = False
+
+    def isChainingEnabled(self):
+        return self.chaining_enabled
+
+    def enableProjection(self):
+        """Allow the planner to parse only the JSON fields that downstream operators read."""
+        self.projection_enabled = True
+
+    def disableProjection(self):
+        """Prevent the planner from projecting JSON records. Records are then always parsed in full."""
+        self.projection_enabled = False
+
+    def isProjectionEnabled(self):
+        return self.projection_enabled
+
+    def getChannelType(self) -> ChannelType:
+        return self.channel_type
+
     def addStream(self, stream: DataStream):
         if not stream.verifyStreamGraph():
             # TODO handle wanring
@@ -63,30 +113,26 @@ class StreamingContext(EdnaContext):
 
         1. First flatten the streams
         2. Then convert the streamgraph to a physicalgraph
-        3. Then convert the physicalgraph to an executiongraph, and start an executioncontext
-        4. Execute the executioncontext (I Guess)
+        3. Then convert the physicalgraph to an executiongraph of task primitives
+        4. Start the task primitives and wait for them to finish
         """
-        
-        #pdb.set_trace()
         self.logical_stream_graph = self.flattenStream()
-        pdb.set_trace()
+        # Converts to the physical graph. The 1-1 chains of nodes (ingest-process, process-process, process-emit) 
+        # are fused into single nodes with a ChainedProcess -- see PhysicalGraphBuilder
         self.physical_graph = self.buildPhysicalGraph()
+        # Each physical node becomes a task primitive. Each edge becomes a connection between a write buffer and a reader.
+        self.execution_graph = self.buildExecutionGraph()
 
+        self.execution_graph.start()
+        try:
+            self.execution_graph.join()
+        except KeyboardInterrupt:
+            self.shutdown()
 
-        # TODO
-        # Then convert to physical graph
-        # Convert the chained nodes that are 1-1 into a single node (we will deal with specifics later)
-        # Add buffer nodes between single nodes -- basically replace each edge with a write buffer and a read buffer.
-        # A write buffer and a read buffer next to each other have the same port
-
-        # Physical graph conversion -- take all edges where the source and target are process nodes and source is a MAP process
-            # replace with a ChainedProcess, which is a BaseProcess that takes an outer and inner, and does outer(inner())
-            # Also need to handle ingest-process pairs, and process-emit pairs
-            # Then we need to handle serializers serializers
-
-        
-        # So we will use breadth first.
-        # We need a PhysicalPrimitive.
+    def shutdown(self):
+        """Stops the source tasks and waits for the remaining tasks to drain and shut down."""
+        self.execution_graph.stop()
+        self.execution_graph.join()
 
 
     def flattenStream(self) -> StreamGraph:
@@ -99,4 +145,7 @@ class StreamingContext(EdnaContext):
         # First add each node to the flattenedStreamGraph
     
     def buildPhysicalGraph(self) -> PhysicalGraph:
-        return PhysicalGraphBuilder.convertStreamGraph(self.logical_stream_graph, self)
\ No newline at end of file
+        return PhysicalGraphBuilder.convertStreamGraph(self.logical_stream_graph, self)
+
+    def buildExecutionGraph(self) -> ExecutionGraph:
+        return ExecutionGraphBuilder.convertPhysicalGraph(self.physical_graph, self)
\ No newline at end of file
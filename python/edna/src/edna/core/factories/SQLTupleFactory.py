@@ -1,5 +1,6 @@
 import abc
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
+import operator
 
 class SQLTupleFactory(abc.ABC):
     def __init__(self, tuple_fields: List[str], upsert_fields: List[str] = None):
@@ -17,6 +18,26 @@ class SQLTupleFactory(abc.ABC):
         else:
             self.upsert_tuple = None
             self.upsert_len = 0
+        self.value_getter = self.compileValueGetter()
+
+    def compileValueGetter(self) -> Callable[[Dict], Tuple]:
+        """Compiles the extraction of `field_tuple`'s values into an `operator.itemgetter`, which 
+        looks up all fields in C instead of a Python loop.
+
+        Returns:
+            (Callable[[Dict], Tuple]): A callable that returns the tuple of values of a message.
+        """
+        if self.field_len == 0:
+            return self._getNoValues
+        if self.field_len == 1:
+            return self._getSingleValue  # itemgetter returns the bare value for a single field
+        return operator.itemgetter(*self.field_tuple)
+
+    def _getNoValues(self, message: Dict) -> Tuple:
+        return ()
+
+    def _getSingleValue(self, message: Dict) -> Tuple:
+        return (message[self.field_tuple[0]],)
 
 
     def getFields(self):
@@ -39,10 +60,21 @@ class SQLTupleFactory(abc.ABC):
         Returns:
             (Tuple): A Tuple of all values corresponding to the `field_tuple`
         """
-        values_list = [None]*self.field_len
-        for idx,field in enumerate(self.field_tuple):
-            values_list[idx] = message[field]
-        return tuple(values_list)
+        return self.value_getter(message)
+
+    def getValuesMany(self, messages: List[Dict]) -> List[Tuple]:
+        """Extracts the tuples of values from a batch of messages, e.g. for a SQL `executemany()`. 
+        This uses `getValues()` if a subclass overrides it.
+
+        Args:
+            messages (List[obj]): The records to process
+        Returns:
+            (List[Tuple]): The Tuples of values corresponding to the `field_tuple`, in order
+        """
+        if type(self).getValues is not SQLTupleFactory.getValues:
+            get_values = self.getValues
+            return [get_values(message) for message in messages]
+        return list(map(self.value_getter, messages))
 
     def getFieldCount(self):
         return self.field_len
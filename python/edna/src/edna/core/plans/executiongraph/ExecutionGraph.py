@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import List, Dict
+from edna.core.tasks import TaskPrimitive
+import threading
+
+
+class ExecutionGraph:
+    """ExecutionGraph holds the TaskPrimitives that execute a PhysicalGraph. Each PhysicalGraphNode is 
+    executed by one TaskPrimitive thread.
+
+    Tasks are started in dependency order, i.e. a task is started before any of the tasks that send records 
+    to it, so that receivers are ready before senders write. Tasks are stopped from the sources: each source 
+    task flushes its buffer and closes its connection, and each downstream task shuts down once its 
+    upstream connection is closed.
+
+    If a task fails, its error is recorded, the source tasks are stopped so that the rest of the job drains, and 
+    `join()` re-raises the error once all tasks have finished.
+
+    Attributes:
+        task_list (List[TaskPrimitive]): The tasks, in start order.
+        source_task_list (List[TaskPrimitive]): The tasks that ingest records from outside the job.
+        task_map (Dict[int, TaskPrimitive]): Maps each PhysicalGraphNode id to its task.
+        error (BaseException): The first error raised by a task, or None.
+    """
+    task_list: List[TaskPrimitive]
+    source_task_list: List[TaskPrimitive]
+    task_map: Dict[int, TaskPrimitive]
+    error: BaseException
+
+    def __init__(self):
+        self.task_list = []
+        self.source_task_list = []
+        self.task_map = {}
+        self.error = None
+        self.error_lock = threading.Lock()
+
+    def addTask(self, node_id: int, task: TaskPrimitive, is_source: bool = False):
+        """Add a task to the ExecutionGraph. Tasks must be added in start order.
+
+        Args:
+            node_id (int): The id of the PhysicalGraphNode the task executes.
+            task (TaskPrimitive): The task.
+            is_source (bool, optional): Whether the task ingests records from outside the job. Defaults to False.
+        """
+        if node_id in self.task_map:
+            raise RuntimeError("PhysicalGraphNode {node_id} already has a task.".format(node_id=node_id))
+        task.failure_callback = self.reportFailure
+        self.task_list.append(task)
+        self.task_map[node_id] = task
+        if is_source:
+            self.source_task_list.append(task)
+
+    def getTaskByNodeId(self, node_id: int):
+        return self.task_map[node_id]
+
+    def start(self):
+        """Start all tasks in dependency order."""
+        for task in self.task_list:
+            task.start()
+
+    def stop(self):
+        """Stop the source tasks. The remaining tasks shut down once their upstream tasks close."""
+        for task in self.source_task_list:
+            task.stop()
+
+    def reportFailure(self, task: TaskPrimitive, error: BaseException):
+        """Record the first error raised by a task and stop the job. Called from the failing task's thread, 
+        before the task aborts, so that errors caused by the abort in other tasks are not recorded first.
+
+        Args:
+            task (TaskPrimitive): The failed task.
+            error (BaseException): The error raised by the task.
+        """
+        with self.error_lock:
+            if self.error is None:
+                self.error = error
+        self.stop()
+
+    def join(self, timeout: float = None):
+        """Wait for all tasks to finish, starting with the most upstream tasks.
+
+        Args:
+            timeout (float, optional): Maximum time to wait for each task. Defaults to None.
+
+        Raises:
+            BaseException: The first error raised by a task, once all tasks have finished.
+        """
+        for task in reversed(self.task_list):
+            task.join(timeout=timeout)
+        if self.error is not None and not self.isAlive():
+            raise self.error
+
+    def isAlive(self):
+        return any(task.is_alive() for task in self.task_list)
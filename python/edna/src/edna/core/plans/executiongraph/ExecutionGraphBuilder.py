@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from edna.core.execution.context import StreamingContext
+
+from edna.core.plans.physicalgraph import PhysicalGraph
+from edna.core.plans.physicalgraph import PhysicalGraphNode
+from edna.core.plans.executiongraph import ExecutionGraph
+
+from edna.core.tasks.SourceTask import StreamingSourceTaskPrimitive
+from edna.core.tasks.ProcessTask import ProcessTaskPrimitive
+from edna.core.tasks.SinkTask import SinkTaskPrimitive
+from edna.core.tasks.ChainedTask import ChainedTaskPrimitive
+
+from edna.channel import MemoryChannel
+from edna.channel import SocketChannel
+from edna.channel import UnixSocketChannel
+from edna.channel import SharedMemoryChannel
+from edna.types.enums import ChannelType
+from edna.serializers import BufferedSerializable
+
+
+class ExecutionGraphBuilder:
+    """Converts a PhysicalGraph into an ExecutionGraph of TaskPrimitives. 
+
+    Each PhysicalGraphNode becomes one task:
+        - ingest ... emit -> ChainedTaskPrimitive
+        - ingest ... -> StreamingSourceTaskPrimitive
+        - process ... -> ProcessTaskPrimitive
+        - ... emit -> SinkTaskPrimitive
+
+    Each edge in the PhysicalGraph becomes a channel between the two tasks. Since all tasks are threads of the 
+    same process, edges use a `MemoryChannel` by default, which hands batches of records over without serializing 
+    them. The context can select a byte transport instead through `channel_type`: `ChannelType.SOCKET` (TCP),
+    `ChannelType.UNIX_SOCKET` (AF_UNIX) or `ChannelType.SHARED_MEMORY` (a shared-memory ring buffer). The 
+    `PhysicalGraphBuilder` records the channel type of each edge.
+    """
+
+    @staticmethod
+    def convertPhysicalGraph(physical_graph: PhysicalGraph, context: StreamingContext) -> ExecutionGraph:
+        execution_graph = ExecutionGraph()
+        in_channels = {}   # Physical node id -> channel its task reads from
+        # Build the tasks in reverse topological order, so each channel exists before its sending task is created.
+        for physical_graph_node in reversed(physical_graph.getTopologicalOrder()):
+            node_id = physical_graph_node.getNodeId()
+            target_nodes = physical_graph.getTargetNodes(node_id)
+            source_nodes = physical_graph.getSourceNodes(node_id)
+            if len(target_nodes) > 1 or len(source_nodes) > 1:
+                raise NotImplementedError("Split and join streams are not supported by the ExecutionGraphBuilder yet.")
+            process = physical_graph_node.getProcess() if physical_graph_node.hasProcess() else None
+
+            if physical_graph_node.hasIngest() and physical_graph_node.hasEmit():
+                task = ChainedTaskPrimitive(ingest_primitive=physical_graph_node.getIngest(),
+                            emit_primitive=physical_graph_node.getEmit(),
+                            process_primitive=process)
+            elif physical_graph_node.hasEmit():
+                in_channels[node_id] = ExecutionGraphBuilder._buildChannel(physical_graph, source_nodes[0], physical_graph_node)
+                task = SinkTaskPrimitive(emit_primitive=physical_graph_node.getEmit(), 
+                            in_channel=in_channels[node_id].getReader(), process_primitive=process)
+            else:
+                if not target_nodes:
+                    raise RuntimeError("PhysicalGraphNode {node_id} does not lead to an emit.".format(node_id=node_id))
+                out_channel = in_channels[target_nodes[0].getNodeId()].getWriter()
+                if physical_graph_node.hasIngest():
+                    task = StreamingSourceTaskPrimitive(ingest_primitive=physical_graph_node.getIngest(), 
+                                out_channel=out_channel, process_primitive=process)
+                else:
+                    in_channels[node_id] = ExecutionGraphBuilder._buildChannel(physical_graph, source_nodes[0], physical_graph_node)
+                    task = ProcessTaskPrimitive(process_primitive=process, 
+                                in_channel=in_channels[node_id].getReader(), out_channel=out_channel)
+            execution_graph.addTask(node_id, task, is_source=physical_graph_node.hasIngest())
+        return execution_graph
+
+    @staticmethod
+    def _buildChannel(physical_graph: PhysicalGraph, source_node: PhysicalGraphNode, target_node: PhysicalGraphNode):
+        """Builds the channel for an edge, with the channel type the `PhysicalGraphBuilder` assigned to it. Byte 
+        channels use the serializers of the process primitives at either end of the edge, if they are 
+        BufferedSerializables (see `PhysicalGraphBuilder._elideSerializers()`), and msgpack otherwise. Both ends 
+        must agree on the wire format, so the writer's serializer sets it, and the reader keeps its own serializer
+        only if it is of the same type. A serializer from one end is shared by both ends, which is safe for the 
+        built-in BufferedSerializables since their writing and reading state are separate.
+        """
+        channel_type = physical_graph.getEdgeChannelType(source_node.getNodeId(), target_node.getNodeId())
+        if channel_type == ChannelType.MEMORY:
+            return MemoryChannel()
+        source_process_list, target_process_list = source_node.getProcessList(), target_node.getProcessList()
+        out_serializer = ExecutionGraphBuilder._wireSerializer(source_process_list[-1].out_serializer if source_process_list else None)
+        in_serializer = ExecutionGraphBuilder._wireSerializer(target_process_list[0].in_serializer if target_process_list else None)
+        if out_serializer is None:
+            out_serializer = in_serializer
+        if in_serializer is None or type(in_serializer) is not type(out_serializer):
+            in_serializer = out_serializer
+        if channel_type == ChannelType.SOCKET:
+            return SocketChannel(in_serializer=in_serializer, out_serializer=out_serializer)
+        elif channel_type == ChannelType.UNIX_SOCKET:
+            return UnixSocketChannel(in_serializer=in_serializer, out_serializer=out_serializer)
+        elif channel_type == ChannelType.SHARED_MEMORY:
+            return SharedMemoryChannel(in_serializer=in_serializer, out_serializer=out_serializer)
+        raise ValueError("Unsupported channel type {channel_type}".format(channel_type=channel_type))
+
+    @staticmethod
+    def _wireSerializer(serializer):
+        """Returns the serializer if it can frame batches of records for a byte channel, i.e. if it is a 
+        BufferedSerializable, or None to use the default. Record serializers such as `MsgPackSerializer` 
+        cannot decode a batch payload with `read_many(payload, record_count)`."""
+        if isinstance(serializer, BufferedSerializable):
+            return serializer
+        return None
\ No newline at end of file
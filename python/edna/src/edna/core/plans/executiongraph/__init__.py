@@ -0,0 +1,2 @@
+from .ExecutionGraph import ExecutionGraph
+from .ExecutionGraphBuilder import ExecutionGraphBuilder
\ No newline at end of file
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from edna.core.plans.physicalgraph import PhysicalGraphNode
+from edna.core.plans.streamgraph import StreamGraphNode
 from edna.exception import PhysicalGraphNodeDoesNotExistException
+from edna.types.enums import ChannelType
 
 
 class PhysicalGraph:
-    
-
+    """PhysicalGraph represents the physical plan for an Edna Job. Each PhysicalGraphNode is a chain of 
+    fused StreamGraphNodes, and each edge is a boundary between tasks where records must be passed 
+    through a buffer.
+
+    Attributes:
+        node_list (List[PhysicalGraphNode]): This is the list of nodes in the PhysicalGraph.
+        node_map (Dict[int, List[int]]): The edges of the PhysicalGraph. Each key is the index of a source 
+            node in `node_list`, and each value is the list of indices of the target nodes.
+        stream_nodes_map (Dict[int, int]): Maps each StreamGraphNode id to the id of the PhysicalGraphNode containing it.
+        edge_channel_types (Dict[Tuple[int, int], ChannelType]): The channel type of each edge, keyed by the 
+            ids of its source and target PhysicalGraphNodes.
+    """
     # This will store the list of nodes
     node_list : List[PhysicalGraphNode]
     # Each time we add a connection, the node_map is updated for the current context
@@ -16,12 +28,13 @@ class PhysicalGraph:
     node_head : int = None
     # this will store the mapping of streeamgraphnodes to physicalgraphnodes. Stream graph node ids are mapped to physical node id
     stream_nodes_map: Dict[int, int]
-
+    edge_channel_types: Dict[Tuple[int, int], ChannelType]
 
     def __init__(self):
         self.node_list = []
         self.node_map = {}
         self.stream_nodes_map = {}
+        self.edge_channel_types = {}
 
     def addPhysicalGraphNode(self, node: PhysicalGraphNode):
         self.node_list.append(node)
@@ -32,9 +45,103 @@ class PhysicalGraph:
                 raise RuntimeError("Stream graph node already exists in stream nodes map...")
             
             self.stream_nodes_map[stream_graph_node.node_id] = node.node_id
-            
-
 
+    def addStreamGraphNode(self, node_id: int, stream_graph_node: StreamGraphNode):
+        """Fuses a StreamGraphNode into an existing PhysicalGraphNode.
+
+        Args:
+            node_id (int): The id of the PhysicalGraphNode.
+            stream_graph_node (StreamGraphNode): The StreamGraphNode to add to the end of the PhysicalGraphNode's chain.
+        """
+        if stream_graph_node.node_id in self.stream_nodes_map:
+            raise RuntimeError("Stream graph node already exists in stream nodes map...")
+        self.getPhysicalGraphNodeById(node_id).addNode(stream_graph_node)
+        self.stream_nodes_map[stream_graph_node.node_id] = node_id
+
+    def addEdge(self, source_node_id: int, target_node_id: int, channel_type: ChannelType = ChannelType.MEMORY):
+        """Add an edge between two PhysicalGraphNodes.
+
+        Args:
+            source_node_id (int): The id of the source PhysicalGraphNode.
+            target_node_id (int): The id of the target PhysicalGraphNode.
+            channel_type (ChannelType, optional): The channel that will carry records along the edge. 
+                Defaults to ChannelType.MEMORY.
+        """
+        source_node_idx = self.getPhysicalGraphNodeIndexById(source_node_id)
+        target_node_idx = self.getPhysicalGraphNodeIndexById(target_node_id)
+        if source_node_idx not in self.node_map:
+            self.node_map[source_node_idx] = []
+        if target_node_idx in self.node_map[source_node_idx]:
+            raise ValueError("Edge from PhysicalGraphNode {source_node_id} to {target_node_id} already exists"
+                .format(source_node_id=source_node_id, target_node_id=target_node_id))
+        self.node_map[source_node_idx].append(target_node_idx)
+        self.edge_channel_types[(source_node_id, target_node_id)] = channel_type
+
+    def getEdgeChannelType(self, source_node_id: int, target_node_id: int) -> ChannelType:
+        return self.edge_channel_types[(source_node_id, target_node_id)]
+
+    def getPhysicalGraphNodeById(self, node_id: int):
+        return self.node_list[self.getPhysicalGraphNodeIndexById(node_id)]
+
+    def getPhysicalGraphNodeByStreamGraphNodeId(self, stream_graph_node_id: int):
+        """Get the PhysicalGraphNode that contains the StreamGraphNode with the given id.
+
+        Args:
+            stream_graph_node_id (int): The id of the StreamGraphNode.
+
+        Returns:
+            PhysicalGraphNode: The PhysicalGraphNode containing the StreamGraphNode.
+        """
+        if stream_graph_node_id not in self.stream_nodes_map:
+            raise PhysicalGraphNodeDoesNotExistException(node_id=stream_graph_node_id)
+        return self.getPhysicalGraphNodeById(self.stream_nodes_map[stream_graph_node_id])
+
+    def getTargetNodes(self, node_id: int):
+        """Get the PhysicalGraphNodes that the given PhysicalGraphNode sends records to.
+
+        Args:
+            node_id (int): The id of the source PhysicalGraphNode.
+
+        Returns:
+            List[PhysicalGraphNode]: The target PhysicalGraphNodes.
+        """
+        node_idx = self.getPhysicalGraphNodeIndexById(node_id)
+        return [self.node_list[target_idx] for target_idx in self.node_map.get(node_idx, [])]
+
+    def getSourceNodes(self, node_id: int):
+        """Get the PhysicalGraphNodes that send records to the given PhysicalGraphNode.
+
+        Args:
+            node_id (int): The id of the target PhysicalGraphNode.
+
+        Returns:
+            List[PhysicalGraphNode]: The source PhysicalGraphNodes.
+        """
+        node_idx = self.getPhysicalGraphNodeIndexById(node_id)
+        return [self.node_list[source_idx] for source_idx in self.node_map if node_idx in self.node_map[source_idx]]
+
+    def getTopologicalOrder(self):
+        """Orders the PhysicalGraphNodes so that each node comes after all nodes that send records to it.
+
+        Returns:
+            List[PhysicalGraphNode]: The PhysicalGraphNodes in topological order.
+        """
+        in_degree = [0]*len(self.node_list)
+        for source_idx in self.node_map:
+            for target_idx in self.node_map[source_idx]:
+                in_degree[target_idx] += 1
+        ready = [node_idx for node_idx, degree in enumerate(in_degree) if degree == 0]
+        ordered_nodes = []
+        while ready:
+            node_idx = ready.pop(0)
+            ordered_nodes.append(self.node_list[node_idx])
+            for target_idx in self.node_map.get(node_idx, []):
+                in_degree[target_idx] -= 1
+                if in_degree[target_idx] == 0:
+                    ready.append(target_idx)
+        if len(ordered_nodes) != len(self.node_list):
+            raise RuntimeError("PhysicalGraph contains a cycle.")
+        return ordered_nodes
 
     def getPhysicalGraphNodeIndexById(self, node_id: int):
         node_idx = None
@@ -1,12 +1,21 @@
 
 
 
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import copy
+
 from edna.core.execution.context import StreamingContext
 
 from edna.core.plans.physicalgraph import PhysicalGraph
 from edna.core.plans.physicalgraph import PhysicalGraphNode
 from edna.core.plans.streamgraph import StreamGraph
 
+from edna.types.enums import ChannelType
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+from edna.process.map import JsonToObject
+from edna.process.filter import RobustJsonToObject
+
 
 class PhysicalGraphBuilder:
 
@@ -33,21 +42,189 @@ class PhysicalGraphBuilder:
 
     @staticmethod
     def convertStreamGraph(stream_graph: StreamGraph, context: StreamingContext) -> PhysicalGraph:
-        # For each stream graph node
+        """Converts a flattened StreamGraph into a PhysicalGraph. If operator chaining is enabled in the context,
+        each StreamGraphNode that has a single input, whose input has a single output, is fused into the 
+        PhysicalGraphNode of its input if possible (see `PhysicalGraphNode.canChain()`). This fuses chains of
+        MAP and FILTER nodes, as well as ingest-process and process-emit pairs, into a single task.
+
+        If projection is enabled in the context, JSON parsers are first restricted to the fields that their
+        downstream processes read (see `_projectJsonFields()`).
+
+        Each edge is assigned a channel type (see `_selectChannelType()`), and serializers are then elided 
+        wherever records stay in memory (see `_elideSerializers()`).
+
+        Args:
+            stream_graph (StreamGraph): The flattened StreamGraph.
+            context (StreamingContext): The context, used for physical node ids and chaining configuration.
+
+        Returns:
+            PhysicalGraph: The PhysicalGraph.
+        """
         physical_graph = PhysicalGraph()
-        for stream_graph_node in stream_graph.node_list:
+        predecessor_map = PhysicalGraphBuilder._buildPredecessorMap(stream_graph)
+        if context.isProjectionEnabled():
+            PhysicalGraphBuilder._projectJsonFields(stream_graph)
+        # For each stream graph node. Nodes are stored after their inputs in the flattened StreamGraph.
+        for stream_graph_node_idx, stream_graph_node in enumerate(stream_graph.node_list):
             # Check if node is an ingest. If it is an ingest, we directly create a physical graph node and add it. 
             if stream_graph_node.isIngest():
-                physical_graph_node = PhysicalGraphNode(node_id=context.getDatastreamId())
+                physical_graph_node = PhysicalGraphNode(node_id=context.getPhysicalNodeId())
                 physical_graph_node.addNode(stream_graph_node=stream_graph_node)
                 physical_graph.addPhysicalGraphNode(physical_graph_node)
 
             elif stream_graph_node.isProcess() or stream_graph_node.isEmit():
-                # If process or emit, we 
-                pass
+                # If process or emit, we fuse it with its input if it is a 1-to-1 connection
+                predecessor_physical_nodes = [physical_graph.getPhysicalGraphNodeByStreamGraphNodeId(
+                                                    stream_graph.getNodeByIndex(predecessor_idx).getNodeId())
+                                                for predecessor_idx in predecessor_map.get(stream_graph_node_idx, [])]
+                if context.isChainingEnabled() and PhysicalGraphBuilder._isChainable(stream_graph, predecessor_map, stream_graph_node_idx, predecessor_physical_nodes):
+                    physical_graph.addStreamGraphNode(predecessor_physical_nodes[0].getNodeId(), stream_graph_node)
+                else:
+                    physical_graph_node = PhysicalGraphNode(node_id=context.getPhysicalNodeId())
+                    physical_graph_node.addNode(stream_graph_node=stream_graph_node)
+                    physical_graph.addPhysicalGraphNode(physical_graph_node)
+                    for predecessor_physical_node in predecessor_physical_nodes:
+                        physical_graph.addEdge(predecessor_physical_node.getNodeId(), physical_graph_node.getNodeId(),
+                                channel_type=PhysicalGraphBuilder._selectChannelType(context))
+        PhysicalGraphBuilder._elideSerializers(physical_graph)
+        return physical_graph
+
+    @staticmethod
+    def _selectChannelType(context: StreamingContext) -> ChannelType:
+        """Selects the channel type for an edge. Every task runs as a thread of this process, so edges 
+        use in-memory channels unless the context asks for something else."""
+        channel_type = context.getChannelType()
+        if channel_type is None:
+            return ChannelType.MEMORY
+        return channel_type
 
-            
+    @staticmethod
+    def _elideSerializers(physical_graph: PhysicalGraph):
+        """Replaces the serializers of process primitives with pass-through serializers wherever records are 
+        handed over as objects: between fused primitives, and across MEMORY edges. A process keeps its 
+        `out_serializer` only if it ends a PhysicalGraphNode with an outgoing byte channel, and its 
+        `in_serializer` only if it starts a PhysicalGraphNode with an incoming byte channel. There, they
+        set the wire format of the channel.
+
+        Args:
+            physical_graph (PhysicalGraph): The PhysicalGraph.
+        """
+        for physical_graph_node in physical_graph.node_list:
+            process_list = physical_graph_node.getProcessList()
+            if not process_list:
+                continue
+            node_id = physical_graph_node.getNodeId()
+            keep_in_serializer = any(physical_graph.getEdgeChannelType(source_node.getNodeId(), node_id) != ChannelType.MEMORY
+                                    for source_node in physical_graph.getSourceNodes(node_id))
+            keep_out_serializer = any(physical_graph.getEdgeChannelType(node_id, target_node.getNodeId()) != ChannelType.MEMORY
+                                    for target_node in physical_graph.getTargetNodes(node_id))
+            for process_idx, process in enumerate(process_list):
+                if not (keep_in_serializer and process_idx == 0):
+                    process.in_serializer = EmptyObjectSerializer
+                if not (keep_out_serializer and process_idx == len(process_list) - 1):
+                    process.out_serializer = EmptyObjectSerializer
 
+    @staticmethod
+    def _projectJsonFields(stream_graph: StreamGraph):
+        """Sets the projection of each `JsonToObject` and `RobustJsonToObject` without one to the keys that 
+        the processes after it read. This is only possible if every path from the parser passes through 
+        processes that declare the keys they read (see `BaseProcess.getReferencedFields()`), up to one
+        that does not output the parsed records (e.g. `ObjectToSQL`). Otherwise, records are parsed in full.
+
+        The projection is set on a copy of the parser, which replaces it in the flattened StreamGraph, so the 
+        parser passed to the stream is left as is. Only the simdjson backend skips the other fields while parsing 
+        (see `edna.utils.JsonBackend`).
+
+        Args:
+            stream_graph (StreamGraph): The flattened StreamGraph.
+        """
+        for stream_graph_node_idx, stream_graph_node in enumerate(stream_graph.node_list):
+            if not stream_graph_node.isProcess():
+                continue
+            json_parser = stream_graph_node.node_callable
+            if not isinstance(json_parser, (JsonToObject, RobustJsonToObject)) or json_parser.getProjection() is not None:
+                continue
+            referenced_fields = PhysicalGraphBuilder._collectReferencedFields(stream_graph, stream_graph_node_idx)
+            if referenced_fields is not None:
+                json_parser = copy.copy(json_parser)
+                json_parser.setProjection(referenced_fields)
+                # The flattened StreamGraph shares its nodes with the DataStreams, so the node is copied as well
+                stream_graph_node = copy.copy(stream_graph_node)
+                stream_graph_node.node_callable = json_parser
+                stream_graph.node_list[stream_graph_node_idx] = stream_graph_node
 
+    @staticmethod
+    def _collectReferencedFields(stream_graph: StreamGraph, stream_graph_node_idx: int) -> Tuple[str]:
+        """Collects the keys read from the output records of a StreamGraphNode by the processes after it.
+
+        Args:
+            stream_graph (StreamGraph): The StreamGraph.
+            stream_graph_node_idx (int): Index of the StreamGraphNode.
+
+        Returns:
+            Tuple[str]: The keys, in the order they are first read, or None if some process may read the whole record.
+        """
+        target_node_idxs = stream_graph.node_map.get(stream_graph_node_idx, [])
+        if not target_node_idxs:
+            return None
+        referenced_fields = {}
+        for target_node_idx in target_node_idxs:
+            if target_node_idx is None:
+                return None     # Placeholder edge, so the consumer is unknown
+            target_node = stream_graph.getNodeByIndex(target_node_idx)
+            if not target_node.isProcess():
+                return None     # Emits write out the whole record
+            target_fields = target_node.node_callable.getReferencedFields()
+            if target_fields is None:
+                return None
+            referenced_fields.update(dict.fromkeys(target_fields))
+            if target_node.node_callable.isRecordPreserving():
+                downstream_fields = PhysicalGraphBuilder._collectReferencedFields(stream_graph, target_node_idx)
+                if downstream_fields is None:
+                    return None
+                referenced_fields.update(dict.fromkeys(downstream_fields))
+        return tuple(referenced_fields)
 
-        
\ No newline at end of file
+    @staticmethod
+    def _buildPredecessorMap(stream_graph: StreamGraph) -> Dict[int, List[int]]:
+        """Inverts the `node_map` of the StreamGraph.
+
+        Args:
+            stream_graph (StreamGraph): The StreamGraph.
+
+        Returns:
+            Dict[int, List[int]]: Map of each node index to the indices of the nodes that connect to it.
+        """
+        predecessor_map = {}
+        for source_node_idx in stream_graph.node_map:
+            for target_node_idx in stream_graph.node_map[source_node_idx]:
+                if target_node_idx is None:
+                    continue    # Placeholder edge
+                predecessor_map.setdefault(target_node_idx, []).append(source_node_idx)
+        return predecessor_map
+
+    @staticmethod
+    def _isChainable(stream_graph: StreamGraph, predecessor_map: Dict[int, List[int]], 
+            stream_graph_node_idx: int, predecessor_physical_nodes: List[PhysicalGraphNode]) -> bool:
+        """Checks whether a StreamGraphNode can be fused into the PhysicalGraphNode of its input.
+
+        Args:
+            stream_graph (StreamGraph): The StreamGraph.
+            predecessor_map (Dict[int, List[int]]): Map of node indices to the indices of their inputs.
+            stream_graph_node_idx (int): Index of the StreamGraphNode to fuse.
+            predecessor_physical_nodes (List[PhysicalGraphNode]): The PhysicalGraphNodes of the node's inputs.
+
+        Returns:
+            bool: True if the StreamGraphNode can be fused.
+        """
+        if len(predecessor_physical_nodes) != 1:
+            return False
+        predecessor_idx = predecessor_map[stream_graph_node_idx][0]
+        predecessor_targets = [target for target in stream_graph.node_map.get(predecessor_idx, []) if target is not None]
+        if len(predecessor_targets) != 1:
+            return False
+        predecessor_physical_node = predecessor_physical_nodes[0]
+        # The input must be the end of its chain, otherwise we would skip over the rest of the chain
+        if predecessor_physical_node.getHeadNode() is not stream_graph.getNodeByIndex(predecessor_idx):
+            return False
+        return predecessor_physical_node.canChain(stream_graph.getNodeByIndex(stream_graph_node_idx))
@@ -4,10 +4,24 @@ from typing import List, Dict
 
 from edna.core.plans.streamgraph import StreamGraphNode
 from edna.types.enums import PhysicalGraphNodeType
+from edna.types.enums import SingleOutputStreamGraphNodeProcessType
 from edna.types.builtin import GraphNode
 from edna.utils.NameUtils import NameUtils
+from edna.ingest import BaseIngest
+from edna.process import BaseProcess
+from edna.process.ChainedProcess import ChainedProcess
+from edna.emit import BaseEmit
 
 class PhysicalGraphNode(GraphNode):
+    """A PhysicalGraphNode is a chain of StreamGraphNodes that execute together as a single task.
+    The chain starts with an optional ingest node, continues with any number of process nodes,
+    and ends with an optional emit node. All process nodes in the chain are fused into a single
+    `edna.process.ChainedProcess`, so records are only serialized at the boundaries of the PhysicalGraphNode.
+
+    Attributes:
+        stream_graph_node_list (List[StreamGraphNode]): The StreamGraphNodes in this chain, in execution order.
+        node_head (int): Index of the last StreamGraphNode in the chain.
+    """
     physical_graph_node_type : PhysicalGraphNodeType
     stream_graph_node_list: List[StreamGraphNode]
     empty_graph : bool = True
@@ -21,11 +35,89 @@ class PhysicalGraphNode(GraphNode):
     def addNode(self, stream_graph_node: StreamGraphNode):
         self.stream_graph_node_list.append(stream_graph_node)
         self.node_head = len(self.stream_graph_node_list) - 1
-    
-        
-        
-    
+        self.empty_graph = False
+
+    def getHeadNode(self):
+        """Get the last StreamGraphNode in the chain.
+
+        Returns:
+            StreamGraphNode: The last StreamGraphNode in the chain.
+        """
+        return self.stream_graph_node_list[self.node_head]
+
+    def canChain(self, stream_graph_node: StreamGraphNode):
+        """Checks whether the provided StreamGraphNode can be fused to the end of this chain. Only 1-to-1
+        process nodes (MAP and FILTER) and emit nodes can be fused, and nothing can be fused after an emit.
+
+        Args:
+            stream_graph_node (StreamGraphNode): The StreamGraphNode to fuse.
+
+        Returns:
+            bool: True if the StreamGraphNode can be fused into this PhysicalGraphNode.
+        """
+        if self.physical_graph_node_type != PhysicalGraphNodeType.SINGLE_OUTPUT_NODE:
+            return False
+        if self.empty_graph or self.getHeadNode().isEmit():
+            return False
+        if stream_graph_node.isEmit():
+            return True
+        if stream_graph_node.isProcess():
+            return stream_graph_node.getProcessNodeType() in (SingleOutputStreamGraphNodeProcessType.MAP,
+                                                            SingleOutputStreamGraphNodeProcessType.FILTER)
+        return False
+
+    def hasIngest(self):
+        return not self.empty_graph and self.stream_graph_node_list[0].isIngest()
+
+    def hasEmit(self):
+        return not self.empty_graph and self.getHeadNode().isEmit()
+
+    def hasProcess(self):
+        return any(stream_graph_node.isProcess() for stream_graph_node in self.stream_graph_node_list)
+
+    def getIngest(self) -> BaseIngest:
+        """Get the ingest primitive at the start of the chain.
+
+        Returns:
+            BaseIngest: The ingest primitive, or None if the chain does not start with an ingest.
+        """
+        if not self.hasIngest():
+            return None
+        return self.stream_graph_node_list[0].node_callable
+
+    def getEmit(self) -> BaseEmit:
+        """Get the emit primitive at the end of the chain.
+
+        Returns:
+            BaseEmit: The emit primitive, or None if the chain does not end with an emit.
+        """
+        if not self.hasEmit():
+            return None
+        return self.getHeadNode().node_callable
+
+    def getProcessList(self) -> List[BaseProcess]:
+        """Get the process primitives in the chain, in execution order.
+
+        Returns:
+            List[BaseProcess]: The process primitives.
+        """
+        return [stream_graph_node.node_callable for stream_graph_node in self.stream_graph_node_list if stream_graph_node.isProcess()]
 
+    def getProcess(self) -> BaseProcess:
+        """Fuses the process primitives in the chain into a single process primitive.
 
-    
-    
\ No newline at end of file
+        Returns:
+            BaseProcess: A `ChainedProcess` of all process primitives in the chain, the process primitive
+                itself if there is only one, or an identity `BaseProcess` if there are none.
+        """
+        chained_process = None
+        for stream_graph_node in self.stream_graph_node_list:
+            if not stream_graph_node.isProcess():
+                continue
+            if chained_process is None:
+                chained_process = stream_graph_node.node_callable
+            else:
+                chained_process = ChainedProcess(outer_process=stream_graph_node.node_callable, inner_process=chained_process)
+        if chained_process is None:
+            return BaseProcess()
+        return chained_process
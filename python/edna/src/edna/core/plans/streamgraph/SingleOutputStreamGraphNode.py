@@ -10,9 +10,9 @@ class SingleOutputStreamGraphNode(StreamGraphNode):
     process_node_type: SingleOutputStreamGraphNodeProcessType # This is map, filter, etc
     node_callable: Callable
 
-    ingest_node_type: bool = False
-    process_node_type: bool = False
-    emit_node_type: bool = False
+    is_ingest_node: bool = False
+    is_process_node: bool = False
+    is_emit_node: bool = False
 
     def __init__(self, node_type: SingleOutputStreamGraphNodeType, node_id: int, name: str = None, node_callable: Callable = None, process_node_type: SingleOutputStreamGraphNodeProcessType = None):
         super().__init__(node_id=node_id, name=name)
@@ -25,22 +25,25 @@ class SingleOutputStreamGraphNode(StreamGraphNode):
 
     def setNodeType(self):
         if self.node_type == SingleOutputStreamGraphNodeType.INGEST:
-            self.ingest_node_type = True
+            self.is_ingest_node = True
         elif self.node_type == SingleOutputStreamGraphNodeType.PROCESS:
-            self.process_node_type = True
+            self.is_process_node = True
         elif self.node_type == SingleOutputStreamGraphNodeType.EMIT:
-            self.emit_node_type = True
+            self.is_emit_node = True
         else:
             raise RuntimeError("Incorrect node_type for StreamGraphNode.")
 
 
     def isIngest(self):
-        return self.ingest_node_type
+        return self.is_ingest_node
 
     def isProcess(self):
-        return self.process_node_type
+        return self.is_process_node
 
     def  isEmit(self):
-        return self.emit_node_type
+        return self.is_emit_node
+
+    def getProcessNodeType(self):
+        return self.process_node_type
 
     
\ No newline at end of file
@@ -1,17 +1,18 @@
 from edna.core.tasks import TaskPrimitive
 from edna.defaults import EdnaDefault
-from edna.buffer import ByteBuffer
-import time
+from edna.channel import ChannelWriter
+from edna.utils import CoarseClock
 
 
 class BufferedTaskPrimitive(TaskPrimitive):
-    buffer: ByteBuffer
-    def __init__(self, max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE, 
+    out_channel: ChannelWriter
+    def __init__(self, out_channel: ChannelWriter, 
+            max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE, 
             max_buffer_timeout : float = EdnaDefault.BUFFER_MAX_TIMEOUT_S):
         super().__init__(max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
-        self.buffer = ByteBuffer(self.sender, max_buffer_size=self.MAX_BUFFER_SIZE, max_buffer_timeout=self.MAX_BUFFER_TIMEOUT_S)
+        self.out_channel = out_channel
          
     def checkBufferTimeout(self):
-        if (time.time() - self.timer) > self.MAX_BUFFER_TIMEOUT_S:
-            self.buffer.sendBufferAndReset()
-            self.timer = time.time()
\ No newline at end of file
+        if (CoarseClock.now - self.timer) > self.MAX_BUFFER_TIMEOUT_S:
+            self.out_channel.flush()
+            self.timer = CoarseClock.now
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from edna.defaults import EdnaDefault
+from edna.core.tasks import TaskPrimitive
+from edna.ingest.streaming import BaseStreamingIngest
+from edna.process import BaseProcess
+from edna.emit import BaseEmit
+from edna.types.enums.IngestPattern import IngestPattern
+
+import concurrent.futures
+
+
+class ChainedTaskPrimitive(TaskPrimitive):
+    """A ChainedTaskPrimitive runs a fully fused ingest-process-emit chain in a single task. The next batch
+    is fetched from the ingest while the current batch is processed and emitted.
+    """
+    primitive: BaseStreamingIngest
+    process: BaseProcess
+    emit: BaseEmit
+    def __init__(self, ingest_primitive: BaseStreamingIngest,
+            emit_primitive: BaseEmit,
+            process_primitive: BaseProcess = None,
+            max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE,
+            max_buffer_timeout : float = EdnaDefault.BUFFER_MAX_TIMEOUT_S,
+            ingest_batch_size : int = EdnaDefault.INGEST_BATCH_MAX_RECORDS):
+        """Initializes the task with the primitives of the chain.
+
+        Args:
+            ingest_primitive (BaseStreamingIngest): The ingest primitive to fetch records from.
+            emit_primitive (BaseEmit): The emit primitive to write records with.
+            process_primitive (BaseProcess, optional): The fused process primitive. Defaults to None.
+            max_buffer_size (int, optional): Unused; kept for consistency with other tasks. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            max_buffer_timeout (float, optional): Maximum time to wait for a batch from the ingest. Defaults to EdnaDefault.BUFFER_MAX_TIMEOUT_S.
+            ingest_batch_size (int, optional): Maximum number of records to fetch at once. Defaults to EdnaDefault.INGEST_BATCH_MAX_RECORDS.
+        """
+        super().__init__(max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
+        self.primitive = ingest_primitive
+        self.process = process_primitive
+        self.emit = emit_primitive
+        self.ingest_batch_size = ingest_batch_size
+        self.ingest_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def runTask(self):
+        if self.primitive.execution_mode != IngestPattern.CLIENT_SIDE_STREAM:
+            raise NotImplementedError
+        record_future = self.ingest_executor.submit(self.primitive.fetch_batch, self.ingest_batch_size, self.MAX_BUFFER_TIMEOUT_S)
+        while self.running():
+            concurrent.futures.wait([record_future], timeout=self.MAX_BUFFER_TIMEOUT_S)
+            self.flushProcess(expired_only=True)
+            if not record_future.done():
+                continue
+            try:
+                streaming_records = record_future.result()
+            except StopIteration:   # The ingest is exhausted
+                break
+            # Fetch the next batch while we process this one
+            record_future = self.ingest_executor.submit(self.primitive.fetch_batch, self.ingest_batch_size, self.MAX_BUFFER_TIMEOUT_S)
+            if self.process is not None:
+                streaming_records = self.process(streaming_records)
+            self.emit(streaming_records)
+        self.flushProcess()
+        self.shutdown()
+
+    def flushProcess(self, expired_only: bool = False):
+        """Emits the records that the fused process primitive held back.
+
+        Args:
+            expired_only (bool, optional): Only emit records held back for too long. Defaults to False.
+        """
+        if self.process is None:
+            return
+        released_records = self.process.flush(expired_only=expired_only)
+        if released_records:
+            self.emit(released_records)
+
+    def shutdown(self):
+        self.emit.flush()
+        self.ingest_executor.shutdown(wait=False)
+
+    def abort(self):
+        self.ingest_executor.shutdown(wait=False)
@@ -0,0 +1 @@
+from .ChainedTaskPrimitive import ChainedTaskPrimitive
\ No newline at end of file
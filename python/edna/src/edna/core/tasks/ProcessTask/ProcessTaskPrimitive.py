@@ -1,63 +1,61 @@
 from __future__ import annotations
 
-from edna.buffer import ByteBuffer
+from edna.channel import ChannelReader, ChannelWriter
 from edna.process import BaseProcess
 from edna.defaults import EdnaDefault
 from edna.core.tasks import BufferedTaskPrimitive
 
-import socket
-
 
 
 
 class ProcessTaskPrimitive(BufferedTaskPrimitive):
-    buffer: ByteBuffer
-    sender: socket.socket
-    receiver: socket.socket
+    in_channel: ChannelReader
+    out_channel: ChannelWriter
     primitive: BaseProcess
     def __init__(self, process_primitive: BaseProcess,
-            ingest_port : int,
-            emit_port : int, 
-            max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE, 
+            in_channel : ChannelReader,
+            out_channel : ChannelWriter,
+            max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE,
             max_buffer_timeout : float = EdnaDefault.BUFFER_MAX_TIMEOUT_S):
-
-        super().__init__(max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
-        self.ingest_port = ingest_port
-        self.emit_port = emit_port
+        """Initializes a task that reads records from `in_channel`, processes them, and writes
+        them to `out_channel`.
+
+        Args:
+            process_primitive (BaseProcess): The process primitive to apply to records.
+            in_channel (ChannelReader): Channel from the upstream task.
+            out_channel (ChannelWriter): Channel to the downstream task.
+            max_buffer_size (int, optional): Unused; the buffer size is set on the channels. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            max_buffer_timeout (float, optional): Maximum time between flushes of `out_channel`. Defaults to EdnaDefault.BUFFER_MAX_TIMEOUT_S.
+        """
+        super().__init__(out_channel=out_channel, max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
         self.primitive = process_primitive
-        self.ip = EdnaDefault.TASK_PRIMITIVE_HOST
+        self.in_channel = in_channel
 
-        self.sender = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sender.connect((self.ip, self.emit_port))
-        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.receiver.bind((self.ip, self.ingest_port))
-        self.receiver.listen(1)
 
-        
 
-    def run(self):
-        client, _ = self.receiver.accept()
+    def runTask(self):
         while self.running():
-            try:
-                client.settimeout(self.MAX_BUFFER_TIMEOUT_S)
-                message = client.recv(self.MAX_BUFFER_SIZE)
-                self.primitive.in_serializer.feed(message)
-            except socket.timeout as e:
-                # We check if the buffers have timed out.
-                self.checkBufferTimeout()
-
-            # Now we have a buunch of buffered messages in the out_serializer. We will process them all 
-            # immediately and write them to the output buffer.
-            for record in self.primitive.in_serializer:
-                completed_records = self.primitive([record])
-                for processed_record in completed_records:  # Completed records are lists
-                    # TODO possible this with nogil???
-                    self.buffer.write(self.primitive.out_serializer.write(processed_record))
-                    self.checkBufferTimeout()
-                self.checkBufferTimeout()
-
+            records = self.in_channel.read(self.MAX_BUFFER_TIMEOUT_S)
+            if records is None: # The upstream task closed the channel, so the stream has ended
+                break
+            # Process the whole batch at once and hand the results to the downstream task.
+            if records:
+                self.out_channel.write(self.primitive(records))
+            # Records the process held back for too long, e.g. in a partially filled batch
+            released_records = self.primitive.flush(expired_only=True)
+            if released_records:
+                self.out_channel.write(released_records)
+            self.checkBufferTimeout()
+
+        released_records = self.primitive.flush()
+        if released_records:
+            self.out_channel.write(released_records)
         self.shutdown()
 
     def shutdown(self):
-        self.receiver.close()
-        self.sender.close()
\ No newline at end of file
+        self.out_channel.close()
+        self.in_channel.close()
+
+    def abort(self):
+        self.in_channel.close()
+        self.out_channel.close()
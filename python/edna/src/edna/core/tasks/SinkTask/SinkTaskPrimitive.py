@@ -1,49 +1,67 @@
 from __future__ import annotations
 
+from edna.channel import ChannelReader
 from edna.emit import BaseEmit
+from edna.process import BaseProcess
 from edna.defaults import EdnaDefault
 from edna.core.tasks import TaskPrimitive
 
-import socket
-
 
 
 
 class SinkTaskPrimitive(TaskPrimitive):
-    receiver: socket.socket
+    in_channel: ChannelReader
+    primitive: BaseEmit
+    process: BaseProcess
     def __init__(self, emit_primitive: BaseEmit,
-            ingest_port: int,
-            max_buffer_size = EdnaDefault.BUFFER_MAX_SIZE, 
-            max_buffer_timeout = EdnaDefault.BUFFER_MAX_TIMEOUT_S):
+            in_channel: ChannelReader,
+            max_buffer_size = EdnaDefault.BUFFER_MAX_SIZE,
+            max_buffer_timeout = EdnaDefault.BUFFER_MAX_TIMEOUT_S,
+            process_primitive : BaseProcess = None):
+        """Initializes a task that reads records from `in_channel` and emits them.
+
+        Args:
+            emit_primitive (BaseEmit): The emit primitive to write records with.
+            in_channel (ChannelReader): Channel from the upstream task.
+            max_buffer_size (int, optional): Unused; the buffer size is set on the channel. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            max_buffer_timeout (float, optional): Maximum time to wait on `in_channel`. Defaults to EdnaDefault.BUFFER_MAX_TIMEOUT_S.
+            process_primitive (BaseProcess, optional): A process primitive fused with the emit. Defaults to None.
+        """
         super().__init__(max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
-        
-        self.port = ingest_port
-        self.primitive = emit_primitive
-        self.ip = EdnaDefault.TASK_PRIMITIVE_HOST
 
-        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.receiver.bind((self.ip, self.port))
-        self.receiver.listen(1)
+        self.primitive = emit_primitive
+        self.process = process_primitive
+        self.in_channel = in_channel
 
-    def run(self):
-        client, _ = self.receiver.accept()
+    def runTask(self):
         while self.running():
-            try:
-                client.settimeout(self.MAX_BUFFER_TIMEOUT_S)
-                message = client.recv(self.MAX_BUFFER_SIZE)
-                self.primitive.in_serializer.feed(message)
-            except socket.timeout as e:
-                # We check if the buffers have timed out.
-                pass
-
-            for record in self.primitive.in_serializer:
-                self.primitive([record])
-        
+            records = self.in_channel.read(self.MAX_BUFFER_TIMEOUT_S)
+            if records is None: # The upstream task closed the channel, so the stream has ended
+                break
+            if records:
+                if self.process is not None:
+                    records = self.process(records)
+                self.primitive(records)
+            self.flushProcess(expired_only=True)
+
+        self.flushProcess()
         self.shutdown()
 
+    def flushProcess(self, expired_only: bool = False):
+        """Emits the records that the fused process primitive held back.
+
+        Args:
+            expired_only (bool, optional): Only emit records held back for too long. Defaults to False.
+        """
+        if self.process is None:
+            return
+        released_records = self.process.flush(expired_only=expired_only)
+        if released_records:
+            self.primitive(released_records)
+
     def shutdown(self):
-        self.receiver.close()
+        self.primitive.flush()
+        self.in_channel.close()
 
-        
-        
-    
\ No newline at end of file
+    def abort(self):
+        self.in_channel.close()
@@ -1,55 +1,89 @@
 from __future__ import annotations
 
-from edna.buffer import ByteBuffer
+from edna.channel import ChannelWriter
 from edna.defaults import EdnaDefault
 from edna.core.tasks import BufferedTaskPrimitive
 from edna.ingest.streaming import BaseStreamingIngest
+from edna.process import BaseProcess
 from edna.types.enums.IngestPattern import IngestPattern
 
 import concurrent.futures
-import socket
-import time
 
 
 class StreamingSourceTaskPrimitive(BufferedTaskPrimitive):
-    buffer: ByteBuffer
-    sender: socket.socket
+    out_channel: ChannelWriter
     primitive: BaseStreamingIngest
+    process: BaseProcess
     def __init__(self, ingest_primitive: BaseStreamingIngest,
-            emit_port : int, 
-            max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE, 
-            max_buffer_timeout : float = EdnaDefault.BUFFER_MAX_TIMEOUT_S):
+            out_channel : ChannelWriter,
+            max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE,
+            max_buffer_timeout : float = EdnaDefault.BUFFER_MAX_TIMEOUT_S,
+            ingest_batch_size : int = EdnaDefault.INGEST_BATCH_MAX_RECORDS,
+            process_primitive : BaseProcess = None):
+        """Initializes a task that ingests records and writes them to `out_channel`.
 
-        super().__init__(max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
-        self.port = emit_port
+        Args:
+            ingest_primitive (BaseStreamingIngest): The ingest primitive to fetch records from.
+            out_channel (ChannelWriter): Channel to the downstream task.
+            max_buffer_size (int, optional): Unused; the buffer size is set on the channel. Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+            max_buffer_timeout (float, optional): Maximum time between flushes of `out_channel`. Defaults to EdnaDefault.BUFFER_MAX_TIMEOUT_S.
+            ingest_batch_size (int, optional): Maximum number of records to fetch at once. Defaults to EdnaDefault.INGEST_BATCH_MAX_RECORDS.
+            process_primitive (BaseProcess, optional): A process primitive fused with the ingest. Defaults to None.
+        """
+        super().__init__(out_channel=out_channel, max_buffer_size=max_buffer_size, max_buffer_timeout=max_buffer_timeout)
         self.primitive = ingest_primitive
-        self.ip = EdnaDefault.TASK_PRIMITIVE_HOST
-        self.sender = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sender.connect((self.ip, self.port))
-        
+        self.process = process_primitive
+        self.ingest_batch_size = ingest_batch_size
+
         self.ingest_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
         #packer = msgpack.Packer()
         #self.serialize = packer.pack
-        
 
-    def run(self):
+
+    def runTask(self):
         # Okay, so basically, we will have a wrapper loop that checks timeout and flushes the buffer, then polls the ingest primitive...
         record_future = None
-        if self.ingest.execution_mode == IngestPattern.CLIENT_SIDE_STREAM:
+        if self.primitive.execution_mode == IngestPattern.CLIENT_SIDE_STREAM:
             while self.running(): # loop
                 if record_future is None:   # Not set
-                    record_future = self.ingest_executor.submit(next, self.primitive)
+                    record_future = self.ingest_executor.submit(self.primitive.fetch_batch,
+                                        self.ingest_batch_size, self.MAX_BUFFER_TIMEOUT_S)
+                # Block on the batch, but wake up in time to flush the buffer if it times out
+                concurrent.futures.wait([record_future], timeout=self.MAX_BUFFER_TIMEOUT_S)
                 if record_future.done():
-                    streaming_records = record_future.result()
-                    for record in streaming_records:    # Because ingest returns a List (usually singleton)
-                        self.buffer.write(self.ingest.out_serializer.write(record))
+                    try:
+                        streaming_records = record_future.result()
+                    except StopIteration:   # The ingest is exhausted
+                        break
+                    if self.process is not None:
+                        streaming_records = self.process(streaming_records)
+                    self.out_channel.write(streaming_records)
                     record_future = None
+                self.flushProcess(expired_only=True)
                 self.checkBufferTimeout()
         else:
             raise NotImplementedError
+        self.flushProcess()
         self.shutdown()
 
+    def flushProcess(self, expired_only: bool = False):
+        """Writes the records that the fused process primitive held back to `out_channel`.
+
+        Args:
+            expired_only (bool, optional): Only write records held back for too long. Defaults to False.
+        """
+        if self.process is None:
+            return
+        released_records = self.process.flush(expired_only=expired_only)
+        if released_records:
+            self.out_channel.write(released_records)
+
     def shutdown(self):
-        self.sender.close()
-        # TODO --> saving to disk with a checkpoint??
\ No newline at end of file
+        self.out_channel.close()    # Closing the channel signals the end of the stream to the downstream task
+        self.ingest_executor.shutdown(wait=False)
+        # TODO --> saving to disk with a checkpoint??
+
+    def abort(self):
+        self.ingest_executor.shutdown(wait=False)
+        self.out_channel.close()
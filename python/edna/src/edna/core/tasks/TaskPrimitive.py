@@ -1,24 +1,67 @@
+from __future__ import annotations
+
+from typing import Callable
 import threading
-import time
 from edna.defaults import EdnaDefault
+from edna.utils import CoarseClock
 
 
 class TaskPrimitive(threading.Thread):
+    """A TaskPrimitive runs one PhysicalGraphNode of a job on its own thread.
+
+    Child classes must:
+
+    - Implement the `runTask()` method with the task's loop
+
+    - Implement the `shutdown()` method to flush and close the task's channels when the stream ends
+
+    Child classes can:
+
+    - Override the `abort()` method to release the task's channels after a failure
+
+    An exception raised by `runTask()` is stored in `error` and reported to `failure_callback`, and the task is
+    aborted, so that the tasks it exchanges records with do not block on it.
+    """
+    error: BaseException
+    failure_callback: Callable[[TaskPrimitive, BaseException], None]
     def __init__(self, max_buffer_size : int = EdnaDefault.BUFFER_MAX_SIZE, 
             max_buffer_timeout : float = EdnaDefault.BUFFER_MAX_TIMEOUT_S):
         super().__init__()
         self.thread_stop = threading.Event()
         self.MAX_BUFFER_SIZE = max_buffer_size
         self.MAX_BUFFER_TIMEOUT_S = max_buffer_timeout
-        self.BUFFER_POLL_TIMEOUT_S = EdnaDefault.POLL_TIMEOUT_S
-        self.timer = time.time()
+        self.BUFFER_POLL_TIMEOUT_S = EdnaDefault.POLL_TIMEOUT
+        CoarseClock.start()
+        self.timer = CoarseClock.now
+        self.error = None
+        self.failure_callback = None
+
+    def run(self):
+        try:
+            self.runTask()
+        except BaseException as e:
+            self.error = e
+            if self.failure_callback is not None:
+                self.failure_callback(self, e)
+            try:
+                self.abort()
+            except Exception:   # The channels may already be broken by the failure
+                pass
+
+    def runTask(self):
+        raise NotImplementedError
+
+    def abort(self):
+        """Releases the task's channels after `runTask()` failed. Closing the reading end of a channel makes the
+        upstream task's writes fail instead of blocking, and closing the writing end ends the stream downstream."""
+        pass
 
     # function using _stop function 
     def stop(self): 
         self.thread_stop.set() 
   
     def stopped(self): 
-        return self.thread_stop.isSet() 
+        return self.thread_stop.is_set() 
 
     def running(self):
         return not self.stopped()
@@ -7,4 +7,19 @@ class EdnaDefault(ABC):
     BUFFER_NAME : str = "default"
 
     TASK_PRIMITIVE_HOST : str = "0.0.0.0"
-    POLL_TIMEOUT : float = 0.1
\ No newline at end of file
+    POLL_TIMEOUT : float = 0.1
+
+    INGEST_PREFETCH_DEPTH : int = 64
+    INGEST_BATCH_MAX_RECORDS : int = 256
+    INGEST_BATCH_MAX_WAIT_S : float = 0.1
+
+    KAFKA_CONSUME_BATCH_SIZE : int = 1024
+    KAFKA_CONSUME_TIMEOUT_S : float = 1.0
+
+    CHANNEL_MAX_BATCHES : int = 64
+    CHANNEL_SOCKET_PREFIX : str = "edna-channel-"
+    CHANNEL_SHARED_MEMORY_SIZE : int = 1048576
+    CHANNEL_POLL_MIN_S : float = 0.00005
+    CHANNEL_POLL_MAX_S : float = 0.001
+
+    CLOCK_RESOLUTION_S : float = 0.005
\ No newline at end of file
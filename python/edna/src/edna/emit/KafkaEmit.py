@@ -37,8 +37,8 @@ class KafkaEmit(BaseEmit):
         `write()` sends messages one by one from the emit_buffer
         """
 
-        for buffer_idx in range(self.emit_buffer_index+1):
-            self.producer.produce(self.kafka_topic, value = self.emit_buffer[buffer_idx])    # Already serialized.
+        for message in self.buffered_messages():
+            self.producer.produce(self.kafka_topic, value = message)    # Already serialized.
 
     def create_topic(self, topic_name: str, conf: Dict):
         """Creates a kafka topic using the admin-client api from confluent.
@@ -17,9 +17,14 @@ class SQLEmit(BaseEmit):
     def __init__(self, serializer: Serializable, host: str, database: str, 
         user: str, password: str, table: str,
         tuple_factory: SQLTupleFactory,
-        emit_buffer_batch_size: int = 10, emit_buffer_timeout_ms: int = 100, *args, **kwargs):
+        emit_buffer_batch_size: int = 10, emit_buffer_timeout_ms: int = 100, 
+        extract_values: bool = False, *args, **kwargs):
         """Connects to a MySQL Table and commits the incoming stream record-at-a-time
 
+        Args:
+            extract_values (bool, optional): If True, the incoming records are objects instead of SQLTuples, and 
+                their values are extracted with `tuple_factory.getValuesMany()` right before they are written. 
+                This replaces a separate `edna.process.map.ObjectToSQL`. Defaults to False.
         """
 
         self.host = host
@@ -30,6 +35,7 @@ class SQLEmit(BaseEmit):
         self.conn = None
         self.query_base = None  # lazily created
         self.tuple_factory = tuple_factory
+        self.extract_values = extract_values
         # TODO possibly add a try catch block here?
         self.build_connection()
         super().__init__(serializer=serializer, emit_buffer_batch_size=emit_buffer_batch_size, emit_buffer_timeout_ms=emit_buffer_timeout_ms, *args, **kwargs)
@@ -43,10 +49,20 @@ class SQLEmit(BaseEmit):
         if not self.conn.is_connected():    # TODO Replace with a forced timeout?
             self.renew_connection()
         cursor = self.conn.cursor()
-        cursor.executemany(self.query_base, self.emit_buffer[:self.emit_buffer_index+1])
+        records = self.buffered_messages()
+        if self.extract_values:
+            records = self.tuple_factory.getValuesMany(records)
+        cursor.executemany(self.query_base, records)
         self.conn.commit()
         cursor.close()
         
+    def message_size(self, message) -> int:
+        """Estimates the size of a record in an INSERT statement, for `emit_buffer_max_bytes`: the length of 
+        its string and bytes values, and 8 bytes for any other value. With `extract_values`, only the values
+        extracted by the `tuple_factory` are counted, since the other fields of the record are not written."""
+        values = self.tuple_factory.getValues(message) if self.extract_values else message
+        return sum(len(value) if isinstance(value, (str, bytes)) else 8 for value in values)
+
     def build_statement(self):
         if self.query_base is None:
         # TODO protect againsnt inject
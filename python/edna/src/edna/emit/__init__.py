@@ -1,5 +1,11 @@
 from __future__ import annotations
 from edna.serializers import Serializable, BufferedSerializable
+from edna.utils import TimerService, CoarseClock
+from edna.buffer import AdaptiveBatchController, BufferView
+from typing import List
+import queue
+import sys
+import threading
 import time
 
 class BaseEmit(object):
@@ -17,15 +23,39 @@ class BaseEmit(object):
 
     - modify the `__call__()` method
 
+    A partially filled buffer is written once it has been idle for `emit_buffer_timeout_ms`. The shared 
+    `edna.utils.TimerService` hands it to a writer thread, so that a slow sink never blocks the timer thread. 
+    `write()` may therefore be called from the writer thread, but never at the same time as another `write()` 
+    of the same emit; a full buffer is only written once the timed-out buffer before it has been written.
+
+    With `async_write`, full buffers are handed to a writer thread that calls `write()`, while the next buffer 
+    is filled. Inside `write()`, `emit_buffer` and `emit_buffer_index` then refer to the buffer being written. 
+    At most `max_inflight_writes` buffers are handed off at once; after that, emitting blocks until a write 
+    finishes. An error raised by `write()` is re-raised by the next call to the emit, or by `flush()`.
+
+    Buffers are written once they hold `emit_buffer_batch_size` messages, or, with `emit_buffer_max_bytes`, 
+    before they would exceed that many bytes (see `message_size()`). With `target_write_latency_ms`, the batch 
+    size and timeout are tuned after every write by an `edna.buffer.AdaptiveBatchController`.
+
+    Buffers are preallocated once and reused: two buffers, so that the next buffer fills while a timed-out buffer 
+    is written, or a ring of `max_inflight_writes + 1` buffers with `async_write`. `write()` can read the filled part of the buffer without copying it through 
+    `buffered_messages()`, but must not keep references to the buffer after it returns. Timeouts are 
+    checked against the shared `edna.utils.CoarseClock`.
     """
     serializer: Serializable
     in_serializer: BufferedSerializable
     out_serializer: Serializable  
+    _WRITER_STOP = object()     # Sentinel placed in `write_queue` to stop the writer thread
     def __init__(self, serializer: Serializable, 
             in_serializer: Serializable = None, 
             out_serializer: Serializable = None, 
             emit_buffer_batch_size: int = 10, 
             emit_buffer_timeout_ms: int = 100, 
+            async_write: bool = False,
+            max_inflight_writes: int = 2,
+            emit_buffer_max_bytes: int = None,
+            target_write_latency_ms: float = None,
+            emit_buffer_max_batch_size: int = None,
             *args, **kwargs):
         """Initializes the BaseEmit. This must be called by any inheriting classes using `super().__init__()`
 
@@ -33,9 +63,19 @@ class BaseEmit(object):
             serializer (Serializable): Serializer to use during emitting a record.
             emit_batch_size (int): How many items to emit at a time. Emit will collect 
                 records until it has at least `emit_batch` records, then perform a write. 
-                TODO Update this to byte size, instead
             emit_timeout_ms (int): How many ms to wait before emitting. This is to prevent 
                 blocking on unfilled `emit_batch` if incoming stream is slow.
+            async_write (bool, optional): Write buffers on a separate writer thread, so that processing continues 
+                while a write is blocked, e.g. on a database commit. Defaults to False.
+            max_inflight_writes (int, optional): Maximum number of buffers handed to the writer thread that are 
+                not yet written. Defaults to 2.
+            emit_buffer_max_bytes (int, optional): Maximum size of a buffer in bytes. A single message larger than this
+                is written on its own. Defaults to None, which limits buffers by message count only.
+            target_write_latency_ms (float, optional): Target latency of a single `write()`. If set, the batch size and 
+                timeout grow while writes are faster than this, and shrink when they are slower. Defaults to None, 
+                which keeps them fixed.
+            emit_buffer_max_batch_size (int, optional): Largest batch size the adaptive batching may grow to. Defaults to 
+                None, which is 16 times `emit_buffer_batch_size`.
         """
         self.serializer = serializer
         if self.serializer is None:
@@ -52,42 +92,264 @@ class BaseEmit(object):
 
         if emit_buffer_batch_size <= 0:
             raise ValueError("emit_buffer_batch_size must be positive; received {emit_buffer_batch_size}".format(emit_buffer_batch_size = emit_buffer_batch_size))
+        if max_inflight_writes <= 0:
+            raise ValueError("max_inflight_writes must be positive; received {max_inflight_writes}".format(max_inflight_writes = max_inflight_writes))
+        if emit_buffer_max_bytes is not None and emit_buffer_max_bytes <= 0:
+            raise ValueError("emit_buffer_max_bytes must be positive; received {emit_buffer_max_bytes}".format(emit_buffer_max_bytes = emit_buffer_max_bytes))
         self.emit_buffer_batch_size = emit_buffer_batch_size
-        self.emit_buffer = [None]*self.emit_buffer_batch_size
+        self.emit_buffer_max_bytes = emit_buffer_max_bytes
+        self.emit_buffer_bytes = 0
+        self.batch_controller = None
+        if target_write_latency_ms is not None:
+            self.batch_controller = AdaptiveBatchController(target_latency_s=float(target_write_latency_ms) / 1000., 
+                                        batch_size=emit_buffer_batch_size, timeout_s=float(emit_buffer_timeout_ms) / 1000., 
+                                        max_batch_size=emit_buffer_max_batch_size)
+        self.writer_buffer = threading.local()  # The buffer being written, as seen from the writer thread
+        # With asynchronous writes, up to `max_inflight_writes` buffers are being written while the next one fills
+        self.emit_buffer_ring = [[None]*self.emit_buffer_batch_size for _ in range(max_inflight_writes + 1 if async_write else 2)]
+        self.emit_buffer_ring_index = 0
+        self.emit_buffer = self.emit_buffer_ring[0]
         self.emit_buffer_timeout_s = float(emit_buffer_timeout_ms) / 1000.
         self.emit_buffer_index = -1
-        self.timer = time.time()
+        CoarseClock.start()
+        self.timer = CoarseClock.now
+        self.emit_lock = threading.RLock()
+        self.write_error = None     # An error raised by a timed or asynchronous write, re-raised on the next call
+        self.async_write = async_write
+        self.max_inflight_writes = max_inflight_writes
+        self.write_queue = queue.Queue()
+        # Without `async_write`, only timed-out buffers are handed to the writer thread, one at a time
+        self.write_slots = threading.BoundedSemaphore(self.max_inflight_writes if self.async_write else 1)
+        self.writer_thread = None
+        self.timer_handle = TimerService.getInstance().schedule(self.timer + self.emit_buffer_timeout_s, self.check_buffer_timeout)
         
 
+    @property
+    def emit_buffer(self) -> List[object]:
+        """The buffer of serialized messages. In the writer thread, this is the buffer being written."""
+        return getattr(self.writer_buffer, "emit_buffer", self._emit_buffer)
+
+    @emit_buffer.setter
+    def emit_buffer(self, emit_buffer: List[object]):
+        self._emit_buffer = emit_buffer
+
+    @property
+    def emit_buffer_index(self) -> int:
+        """Index of the last message in `emit_buffer`. In the writer thread, this is the index of the buffer being written."""
+        return getattr(self.writer_buffer, "emit_buffer_index", self._emit_buffer_index)
+
+    @emit_buffer_index.setter
+    def emit_buffer_index(self, emit_buffer_index: int):
+        self._emit_buffer_index = emit_buffer_index
+
+    def buffered_messages(self) -> BufferView:
+        """Get the messages in `emit_buffer`, without copying them. In `write()`, these are the messages to write.
+
+        Returns:
+            (BufferView): A view of the filled part of `emit_buffer`.
+        """
+        return BufferView(self.emit_buffer, self.emit_buffer_index + 1)
+
     def __call__(self, message):
         """Wrapper for emitting a record using the emitter's logic. This is the entry point for emitting and should not be modified.
 
         Args:
             message (List[object]): A list of messagse that should be Serializable to bytes with `serializer`
         """
-        for item in message:
-            self.call(item)
+        with self.emit_lock:
+            self.raise_write_error()
+            if isinstance(self.out_serializer, BufferedSerializable):
+                # Buffered serializers pack a batch into one buffer, but the emit buffer holds one message per record
+                serialized_messages = [self.out_serializer.write(item) for item in message]
+            else:
+                serialized_messages = self.out_serializer.write_many(message)
+            message_sizes = None
+            if self.emit_buffer_max_bytes is not None:
+                message_size = self.message_size
+                message_sizes = [message_size(item) for item in serialized_messages]
+            # Copy the serialized messages into the buffer in slices, writing the buffer each time it fills
+            message_index, message_count = 0, len(serialized_messages)
+            while message_index < message_count:
+                buffer_start = self.emit_buffer_index + 1
+                slice_length = min(self.emit_buffer_batch_size - buffer_start, message_count - message_index)
+                bytes_full = False
+                if message_sizes is not None:
+                    slice_length, bytes_full = self.fit_bytes(message_sizes, message_index, slice_length, buffer_start)
+                self.emit_buffer[buffer_start:buffer_start + slice_length] = serialized_messages[message_index:message_index + slice_length]
+                self.emit_buffer_index += slice_length
+                message_index += slice_length
+                if (CoarseClock.now - self.timer) > self.emit_buffer_timeout_s:    # Buffer timeout reached
+                    self.write_buffer()
+                elif bytes_full or self.emit_buffer_index+1 >= self.emit_buffer_batch_size: # Buffer too large
+                    self.write_buffer()
+
+    def fit_bytes(self, message_sizes: List[int], message_index: int, slice_length: int, buffer_start: int):
+        """Shortens a slice of messages to fit into the remaining bytes of the buffer, and counts its bytes.
+
+        Args:
+            message_sizes (List[int]): Sizes of the messages, in bytes.
+            message_index (int): Index of the first message of the slice.
+            slice_length (int): Number of messages that fit into the remaining buffer by count.
+            buffer_start (int): Number of messages already in the buffer.
+
+        Returns:
+            (Tuple[int, bool]): The number of messages that fit, and whether the buffer is full.
+        """
+        buffer_bytes, max_bytes = self.emit_buffer_bytes, self.emit_buffer_max_bytes
+        for fitted_length in range(slice_length):
+            message_bytes = message_sizes[message_index + fitted_length]
+            if buffer_bytes + message_bytes > max_bytes and buffer_start + fitted_length > 0:
+                self.emit_buffer_bytes = buffer_bytes
+                return fitted_length, True
+            buffer_bytes += message_bytes
+        self.emit_buffer_bytes = buffer_bytes
+        return slice_length, buffer_bytes >= max_bytes
+
+    def message_size(self, message: object) -> int:
+        """Estimates the size of a serialized message for `emit_buffer_max_bytes`. This is the length of bytes and 
+        strings, and the in-memory size of other objects. Subclasses can override this to match their sink.
+
+        Args:
+            message (obj): A serialized message.
+
+        Returns:
+            (int): The size of the message, in bytes.
+        """
+        if isinstance(message, (bytes, bytearray, str)):
+            return len(message)
+        if isinstance(message, memoryview):
+            return message.nbytes
+        return sys.getsizeof(message)
         
     def call(self, message):
-        self.emit_buffer_index += 1
-        self.emit_buffer[self.emit_buffer_index] = self.out_serializer.write(message)
-        # Write buffer and clear if throughput barriers are met
-        if (time.time() - self.timer) > self.emit_buffer_timeout_s:    # Buffer timeout reached
-            self.write_buffer()
-        if self.emit_buffer_index+1 == self.emit_buffer_batch_size: # Buffer too large
-            self.write_buffer()
+        """Emits a single record. This is kept for compatibility, and is the same as calling the emit with `[message]`.
 
+        Args:
+            message (obj): A message that should be Serializable to bytes with `serializer`
+        """
+        self([message])
 
-    def write_buffer(self):
-        """Calls `write()` to write the buffer and resets the buffer"""
-        self.write()
+
+    def write_buffer(self, blocking: bool = True, hand_off: bool = False) -> bool:
+        """Calls `write()` to write the buffer and resets the buffer. With `async_write` or `hand_off`, the buffer is 
+        handed to the writer thread instead, after waiting while `max_inflight_writes` buffers are in flight.
+
+        Args:
+            blocking (bool, optional): Wait for the writer thread if too many buffers are in flight. Defaults to True.
+            hand_off (bool, optional): Hand the buffer to the writer thread even without `async_write`. Defaults to False.
+
+        Returns:
+            (bool): False if the buffer was not handed off because `blocking` is False.
+        """
+        if self.async_write or hand_off:
+            if not self.write_slots.acquire(blocking=blocking):
+                return False
+            if self.writer_thread is None:
+                self.writer_thread = threading.Thread(target=self.run_writer, name="edna-emit-writer", daemon=True)
+                self.writer_thread.start()
+            self.write_queue.put((self._emit_buffer, self._emit_buffer_index))
+        else:
+            if self.writer_thread is not None:  # Keep writes in order behind a timed-out buffer
+                self.write_queue.join()
+                self.raise_write_error()
+            self.timed_write()
         self.reset_buffer()
+        return True
+
+    def timed_write(self):
+        """Calls `write()`, and reports its latency to the adaptive batching, if enabled."""
+        if self.batch_controller is None:
+            self.write()
+            return
+        write_start = time.time()
+        self.write()
+        self.batch_controller.observeWrite(time.time() - write_start)
+
+    def run_writer(self):
+        """Runs on the writer thread. Writes the buffers handed off by `write_buffer()` in order, until it is 
+        stopped by `flush()`. Once a write fails, the remaining buffers are dropped."""
+        while True:
+            handed_off = self.write_queue.get()
+            if handed_off is self._WRITER_STOP:
+                self.write_queue.task_done()
+                return
+            self.writer_buffer.emit_buffer, self.writer_buffer.emit_buffer_index = handed_off
+            try:
+                if self.write_error is None:
+                    self.timed_write()
+            except Exception as e:
+                self.write_error = e
+            finally:
+                del self.writer_buffer.emit_buffer, self.writer_buffer.emit_buffer_index
+                self.write_slots.release()
+                self.write_queue.task_done()
+
+    def flush(self):
+        """Writes any records remaining in a partially filled buffer. This is called when the stream ends. 
+        With `async_write`, this also waits for the writer thread to write all buffers, and stops it. The buffer 
+        timeout is cancelled, so the TimerService no longer calls the emit."""
+        if self.timer_handle is not None:
+            TimerService.getInstance().cancel(self.timer_handle)
+            self.timer_handle = None
+        with self.emit_lock:
+            self.raise_write_error()
+            if self.emit_buffer_index >= 0:
+                self.write_buffer()
+            if self.writer_thread is not None:
+                self.write_queue.put(self._WRITER_STOP)
+                self.write_queue.join()
+                self.writer_thread.join()
+                self.writer_thread = None
+            self.raise_write_error()
+
+    def check_buffer_timeout(self):
+        """Hands a partially filled buffer to the writer thread if it has not been written for `emit_buffer_timeout_s`. 
+        This is called by the `TimerService`, so it never writes or waits itself.
+
+        Returns:
+            (float): The time at which the buffer times out next, or None if handing off the buffer failed.
+        """
+        if not self.emit_lock.acquire(blocking=False):
+            # The emit is busy in another thread, which writes the buffer if needed; check again later
+            return time.time() + self.emit_buffer_timeout_s
+        try:
+            # The TimerService also refreshes the CoarseClock, so it may lag here. Use the real time instead.
+            if (time.time() - self.timer) >= self.emit_buffer_timeout_s:
+                if self.emit_buffer_index >= 0:
+                    try:
+                        if not self.write_buffer(blocking=False, hand_off=True):
+                            # The writer thread is busy, and the timer thread must not wait for it
+                            return time.time() + self.emit_buffer_timeout_s
+                    except Exception as e:
+                        self.write_error = e
+                        return None
+                self.timer = time.time()
+            return self.timer + self.emit_buffer_timeout_s
+        finally:
+            self.emit_lock.release()
+
+    def raise_write_error(self):
+        """Re-raises an error from a timed or asynchronous write in the caller's thread."""
+        if self.write_error is not None:
+            write_error, self.write_error = self.write_error, None
+            raise write_error
     
     def reset_buffer(self):
-        """Resets the internal buffer."""
+        """Resets the internal buffer. The batch size and timeout chosen by the adaptive batching take effect here.
+        
+        The buffer is not reallocated. The next buffer of the ring is used, which is free since at most 
+        `max_inflight_writes` buffers, or one timed-out buffer, are in flight."""
+        if self.batch_controller is not None:
+            self.emit_buffer_batch_size = self.batch_controller.batch_size
+            self.emit_buffer_timeout_s = self.batch_controller.timeout_s
+        self.emit_buffer_bytes = 0
         self.emit_buffer_index = -1
-        self.emit_buffer = [None]*self.emit_buffer_batch_size
-        self.timer = time.time()
+        self.emit_buffer_ring_index = (self.emit_buffer_ring_index + 1) % len(self.emit_buffer_ring)
+        emit_buffer = self.emit_buffer_ring[self.emit_buffer_ring_index]
+        if len(emit_buffer) < self.emit_buffer_batch_size:  # The adaptive batching grew the batch size
+            emit_buffer.extend([None]*(self.emit_buffer_batch_size - len(emit_buffer)))
+        self.emit_buffer = emit_buffer
+        self.timer = CoarseClock.now
 
 
     def write(self):        # For Java, need Emit to be a templated function for message type
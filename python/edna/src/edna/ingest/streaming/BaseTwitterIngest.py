@@ -3,6 +3,7 @@ from edna.ingest.streaming import BaseStreamingIngest
 from edna.process import BaseProcess
 from edna.emit import BaseEmit
 from edna.serializers.EmptySerializer import EmptyStringSerializer
+from edna.utils import CoarseClock
 
 from urllib.parse import urlencode
 import requests
@@ -86,6 +87,40 @@ class BaseTwitterIngest(BaseStreamingIngest):
             self.response = self.build_response()
             self.running = True
         return next(self.response)
+
+    def next_batch(self, max_records: int, max_wait_s: float):
+        """Retrieves up to `max_records` records from the Twitter stream. Empty keep-alive 
+        lines sent by the Twitter API are skipped instead of being returned as records.
+
+        Reading the stream blocks until the next line arrives, so `max_wait_s` is only checked between lines.
+        The Twitter API sends a keep-alive line at least every 20 seconds, which bounds how long a quiet stream 
+        can hold back a partial batch.
+
+        Args:
+            max_records (int): Maximum number of records to return.
+            max_wait_s (float): Maximum time to wait for the batch to fill.
+
+        Raises:
+            StopIteration: Raised if the stream was closed and no records were retrieved.
+
+        Returns:
+            (List[obj]): Records from the Twitter stream
+        """
+        if not self.running:
+            self.response = self.build_response()
+            self.running = True
+        records = []
+        CoarseClock.start()
+        deadline = CoarseClock.now + max_wait_s
+        for record in self.response:
+            if record:
+                records.append(record)
+            if len(records) == max_records or CoarseClock.now >= deadline:
+                break
+        else:
+            if not records:
+                raise StopIteration
+        return records
             
     def build_response(self):
         """Builds a response object to connect to the Twitter stream and returns a generator to yield records.
@@ -1,16 +1,30 @@
 from edna.serializers import Serializable
 from edna.ingest.streaming import BaseStreamingIngest
+from edna.defaults import EdnaDefault
 
-from typing import Dict
+from typing import Dict, List
+from collections import deque
+import concurrent.futures
 import confluent_kafka, confluent_kafka.admin
-from time import sleep
 import socket
 
 
 class KafkaIngest(BaseStreamingIngest):
     """KafkaIngest streams records from a provided kafka topic into the Job. Records are deserialized with the provided serializer.
+
+    Messages that are ready in the consumer are drained in batches with non-blocking `consume()` calls into an
+    internal prefetch buffer, so `next()` only reaches the consumer when the buffer is empty. If no message is 
+    ready, a single message is awaited with `poll()`, which returns as soon as it arrives. The consumer's fetch behavior can be tuned from the
+    job configuration with `fetch_min_bytes`, `fetch_wait_max_ms`, and `queued_max_messages_kbytes`.
     """
-    def __init__(self, serializer: Serializable, kafka_topic: str,  bootstrap_server: str = "localhost", bootstrap_port: int = 9092, default_group: str ="default-group", *args, **kwargs):
+    def __init__(self, serializer: Serializable, kafka_topic: str,  bootstrap_server: str = "localhost", bootstrap_port: int = 9092, default_group: str ="default-group", 
+            consume_batch_size: int = EdnaDefault.KAFKA_CONSUME_BATCH_SIZE,
+            consume_timeout: float = EdnaDefault.KAFKA_CONSUME_TIMEOUT_S,
+            fetch_min_bytes: int = None,
+            fetch_wait_max_ms: int = None,
+            queued_max_messages_kbytes: int = None,
+            consumer_config: Dict = None,
+            *args, **kwargs):
         """Connects to a kafka topic and sets up the ingest
 
         Args:
@@ -19,8 +33,21 @@ class KafkaIngest(BaseStreamingIngest):
             bootstrap_server (str, optional): Address of the Kafka bootstrap server. Defaults to "localhost".
             bootstrap_port (int, optional): Bootstrap server port on which the topic is listening for messages. Defaults to 9092.
             default_group (str, optional): Group name for this consumer group. Defaults to "default-group".
+            consume_batch_size (int, optional): Maximum number of ready messages to prefetch with a single `consume()` call. 
+                Defaults to EdnaDefault.KAFKA_CONSUME_BATCH_SIZE.
+            consume_timeout (float, optional): Maximum time, in seconds, that `next()` blocks on a single `poll()` call. 
+                Defaults to EdnaDefault.KAFKA_CONSUME_TIMEOUT_S.
+            fetch_min_bytes (int, optional): The `fetch.min.bytes` consumer property. Defaults to None, which keeps the client default.
+            fetch_wait_max_ms (int, optional): The `fetch.wait.max.ms` consumer property. Defaults to None, which keeps the client default.
+            queued_max_messages_kbytes (int, optional): The `queued.max.messages.kbytes` consumer property. Defaults to None, 
+                which keeps the client default.
+            consumer_config (Dict, optional): Additional consumer properties. These take precedence over the other arguments. 
+                Defaults to None.
         """
         self.kafka_topic = kafka_topic
+        self.consume_batch_size = consume_batch_size
+        self.consume_timeout = consume_timeout
+        self.prefetch_buffer = deque()
         conf = {
             "bootstrap.servers": bootstrap_server + ":" + str(bootstrap_port),
             "client.id":socket.gethostname(),
@@ -28,13 +55,44 @@ class KafkaIngest(BaseStreamingIngest):
         }
 
         self.create_topic(topic_name=kafka_topic, conf=conf)    # TODO is this safe?
-        self.consumer = confluent_kafka.Consumer(conf)
+        self.consumer = confluent_kafka.Consumer(self.buildConsumerConfig(conf, 
+                                fetch_min_bytes=fetch_min_bytes, 
+                                fetch_wait_max_ms=fetch_wait_max_ms, 
+                                queued_max_messages_kbytes=queued_max_messages_kbytes, 
+                                consumer_config=consumer_config))
         self.consumer.subscribe([self.kafka_topic])
         self.running = True
         super().__init__(serializer=serializer, *args, **kwargs)
 
+    def buildConsumerConfig(self, conf: Dict, fetch_min_bytes: int = None, fetch_wait_max_ms: int = None, 
+            queued_max_messages_kbytes: int = None, consumer_config: Dict = None) -> Dict:
+        """Adds the fetch tuning properties to the consumer configuration. Properties left as None are not set.
+
+        Args:
+            conf (Dict): The connection configuration.
+            fetch_min_bytes (int, optional): The `fetch.min.bytes` consumer property. Defaults to None.
+            fetch_wait_max_ms (int, optional): The `fetch.wait.max.ms` consumer property. Defaults to None.
+            queued_max_messages_kbytes (int, optional): The `queued.max.messages.kbytes` consumer property. Defaults to None.
+            consumer_config (Dict, optional): Additional consumer properties. Defaults to None.
+
+        Returns:
+            (Dict): The consumer configuration.
+        """
+        consumer_conf = dict(conf)
+        fetch_conf = {
+            "fetch.min.bytes": fetch_min_bytes,
+            "fetch.wait.max.ms": fetch_wait_max_ms,
+            "queued.max.messages.kbytes": queued_max_messages_kbytes
+        }
+        for key, value in fetch_conf.items():
+            if value is not None:
+                consumer_conf[key] = int(value)
+        if consumer_config is not None:
+            consumer_conf.update(consumer_config)
+        return consumer_conf
+
     def next(self):
-        """Sets up a Kafka Consumer poll to the topic and yields records one by one.
+        """Returns the next record from the prefetch buffer, refilling it from the topic when it is empty.
 
         Raises:
             KafkaException: Propagated from Kafka.
@@ -42,23 +100,68 @@ class KafkaIngest(BaseStreamingIngest):
         Returns:
             (obj): A record.
         """
-        kafka_message = None
-        while kafka_message is None:
-            kafka_message = self.consumer.poll(timeout=1.0)
-            if kafka_message is None:
-                # There is no message to retrieve (methinks)    TODO
-                sleep(0.1)
-                continue
+        while not self.prefetch_buffer:
+            self.fillPrefetchBuffer(self.consume_timeout)
+        return self.prefetch_buffer.popleft()
+
+    def next_batch(self, max_records: int, max_wait_s: float) -> List[bytes]:
+        """Returns up to `max_records` records. Records already in the prefetch buffer are returned first; 
+        the consumer is only read from if the buffer is empty. This returns as soon as any record is available.
+
+        Args:
+            max_records (int): Maximum number of records to return.
+            max_wait_s (float): Maximum time to wait for the batch to fill.
+
+        Raises:
+            KafkaException: Propagated from Kafka.
+
+        Returns:
+            (List[bytes]): The consumed records. This can be empty if no records arrived within `max_wait_s`.
+        """
+        if not self.prefetch_buffer:
+            self.fillPrefetchBuffer(max_wait_s)
+        if len(self.prefetch_buffer) <= max_records:
+            records = list(self.prefetch_buffer)
+            self.prefetch_buffer.clear()
+            return records
+        return [self.prefetch_buffer.popleft() for _ in range(max_records)]
+
+    def fillPrefetchBuffer(self, timeout: float):
+        """Moves the messages that are ready in the consumer into the prefetch buffer. If none are ready, waits
+        up to `timeout` for the next message, and returns as soon as it arrives.
+
+        Args:
+            timeout (float): Maximum time to wait for a message.
+
+        Raises:
+            KafkaException: Propagated from Kafka.
+        """
+        # A blocking consume() would wait for a full batch, so only drain what is ready without waiting
+        self.readMessages(self.consumer.consume(num_messages=self.consume_batch_size, timeout=0))
+        if self.prefetch_buffer:
+            return
+        kafka_message = self.consumer.poll(timeout=timeout)
+        if kafka_message is None:
+            return
+        self.readMessages([kafka_message])
+        # Messages that arrived together with it are fetched now rather than one poll() at a time
+        self.readMessages(self.consumer.consume(num_messages=self.consume_batch_size, timeout=0))
+
+    def readMessages(self, kafka_messages: List[confluent_kafka.Message]):
+        """Appends the values of consumed messages to the prefetch buffer.
+
+        Args:
+            kafka_messages (List[Message]): The consumed messages.
+
+        Raises:
+            KafkaException: Propagated from Kafka. End-of-partition events are skipped.
+        """
+        for kafka_message in kafka_messages:
             if kafka_message.error():
                 if kafka_message.error().code() == confluent_kafka.KafkaError._PARTITION_EOF:
-                    kafka_message = None
-                    pass # TODO will need to add exception handling at some point
-                    # End of partition event
-                    #sys.stderr.write('%% %s [%d] reached end at offset %d\n' %
-                    #                    (kafka_message.topic(), kafka_message.partition(), kafka_message.offset()))
-                elif kafka_message.error():
-                    raise confluent_kafka.KafkaException(kafka_message.error())
-        return kafka_message.value()
+                    continue    # End of partition event
+                raise confluent_kafka.KafkaException(kafka_message.error())
+            self.prefetch_buffer.append(kafka_message.value())
 
     def create_topic(self, topic_name: str, conf: Dict):
         """Helper function to create a topic. Blocks until topic is created.
@@ -70,6 +173,5 @@ class KafkaIngest(BaseStreamingIngest):
         adminclient = confluent_kafka.admin.AdminClient(conf=conf)
         topic = confluent_kafka.admin.NewTopic(topic=topic_name, num_partitions=1)
         response = adminclient.create_topics([topic])
-        while not response[topic_name].done():
-            sleep(0.1)    # TODO this is super hacky. There is bound to be a better way to do this.
-        del adminclient
+        concurrent.futures.wait([response[topic_name]])     # The topic may already exist, so errors are ignored
+        del adminclient
\ No newline at end of file
@@ -11,6 +11,8 @@ class SimulatedIngestCallable:
     Child classes should:
     
     - Implement the `compute_stream` method to return a stream element given an index value
+
+    - Optionally override the `compute_batch` method to return several stream elements at once
     
     - Call `super().__init__()` if the interface constructor is overwritten
 
@@ -42,6 +44,29 @@ class SimulatedIngestCallable:
         """
         raise NotImplementedError()
 
+    def compute_batch(self, index: int, max_records: int):
+        """Returns up to `max_records` consecutive stream elements, starting from `index`. 
+        The default implementation calls `compute_stream` for each index.
+
+        Args:
+            index (int): The index of the first element in the batch.
+            max_records (int): Maximum number of elements to return.
+
+        Raises:
+            StopIteration: Raised if the stream is exhausted and no elements were generated.
+
+        Returns:
+            (List[obj]): The generated records.
+        """
+        records = []
+        try:
+            for offset in range(max_records):
+                records.append(self.compute_stream(index + offset))
+        except StopIteration:
+            if not records:
+                raise
+        return records
+
 class SimulatedIngest(BaseStreamingIngest):
     """The SimulatedIngest is used for testing EDNA Jobs. 
     Given a list of Serializable items, it will provide them when `__next__()` is called.
@@ -53,7 +78,8 @@ class SimulatedIngest(BaseStreamingIngest):
             serializer (Serializable): Serializer to convert a message if needed.
             stream_list (List): List of stream elements to emit. Can be omitted if a 
                 callable is used Defaults to None.
-            stream_callback (Callable): A callback to generate new elements based on the index.
+            stream_callback (Callable): A callback to generate new elements based on the index. This can be a 
+                `SimulatedIngestCallable` or any callable that takes the index.
         """
 
         if stream_list is None and stream_callback is None:
@@ -75,6 +101,32 @@ class SimulatedIngest(BaseStreamingIngest):
         """
         self.index+=1
         return self.stream_callback(self.index)
+
+    def next_batch(self, max_records: int, max_wait_s: float):
+        """Yields a batch of records from the `stream_callback` based on the current index. Uses the callback's
+        `compute_batch` method if it has one, and otherwise calls it once per index. If no records are available, waits for `max_wait_s` and returns an empty batch.
+
+        Args:
+            max_records (int): Maximum number of records to return.
+            max_wait_s (float): Time to wait if no records are available.
+
+        Returns:
+            (List[obj]): A list of records.
+        """
+        if hasattr(self.stream_callback, "compute_batch"):
+            records = self.stream_callback.compute_batch(self.index + 1, max_records)
+        else:   # A plain callable, so generate the batch one index at a time
+            records = []
+            try:
+                for offset in range(max_records):
+                    records.append(self.stream_callback(self.index + 1 + offset))
+            except StopIteration:
+                if not records:
+                    raise
+        self.index += len(records)
+        if not records:
+            sleep(max_wait_s)
+        return records
     
     class _ListCallable(SimulatedIngestCallable):
         def __init__(self, stream_list: List):
@@ -100,6 +152,19 @@ class SimulatedIngest(BaseStreamingIngest):
                 sleep(1)
             return self.stream_list[index]
 
+        def compute_batch(self, index: int, max_records: int):
+            """Returns a slice of `self.stream_list` starting at the current index. Once the list
+            is exhausted, the slice is empty.
+
+            Args:
+                index (int): The index of the first record in the batch.
+                max_records (int): Maximum number of records to return.
+
+            Returns:
+                (List[obj]): A slice of `stream_list`
+            """
+            return self.stream_list[index:index + max_records]
+
 
 
 
@@ -2,10 +2,12 @@ from edna.serializers import Serializable
 from edna.process import BaseProcess
 from edna.emit import BaseEmit
 from edna.ingest import BaseIngest
-from edna.serializers import Serializable
+from edna.serializers import Serializable, BufferedSerializable
 from edna.types.enums import IngestPattern
+from edna.defaults import EdnaDefault
+from edna.utils import CoarseClock
 
-from typing import Iterator
+from typing import Iterator, List
 
 class BaseStreamingIngest(BaseIngest, Iterator):
     """BaseStreamingIngest is the base class for generating records from a streaming source, e.g. Kafka.
@@ -16,6 +18,11 @@ class BaseStreamingIngest(BaseIngest, Iterator):
     
     - Implement the `next()` method. This should be done as a generator that 
             fetches records in the background and yields them when it is called.
+
+    Child classes can:
+
+    - Override the `next_batch()` method to fetch several records from the source at once. 
+            The default implementation calls `next()` repeatedly.
     
     Child classes should NOT:
 
@@ -23,6 +30,8 @@ class BaseStreamingIngest(BaseIngest, Iterator):
     
     - modify the `__iter__()` method
 
+    - modify the `fetch_batch()` method
+
     Attributes:
         execution_mode (IngestPattern): Sets this primitive as a `CLIENT_SIDE_STREAM`. 
             The logic for execution is set up in `edna.core.execution.context.SimpleStreamingContext`.
@@ -60,6 +69,59 @@ class BaseStreamingIngest(BaseIngest, Iterator):
         """
         raise NotImplementedError
 
+    def fetch_batch(self, max_records: int = EdnaDefault.INGEST_BATCH_MAX_RECORDS, 
+            max_wait_s: float = EdnaDefault.INGEST_BATCH_MAX_WAIT_S) -> List[object]:
+        """Fetches a batch of records from the source. This is the batched counterpart of `__next__()`.
+        Each record from `next_batch()` is a complete message, so a `BufferedSerializable`, whose `read_many()` 
+        reads a byte stream, deserializes them one at a time with `read()`.
+
+        Args:
+            max_records (int, optional): Maximum number of records in the batch. 
+                Defaults to `EdnaDefault.INGEST_BATCH_MAX_RECORDS`.
+            max_wait_s (float, optional): Maximum time to wait for the batch to fill. 
+                Defaults to `EdnaDefault.INGEST_BATCH_MAX_WAIT_S`.
+
+        Raises:
+            StopIteration: Raised once the source is exhausted.
+
+        Returns:
+            (List[obj]): The fetched records. This can be empty if no records arrived within `max_wait_s`.
+        """
+        records = self.next_batch(max_records, max_wait_s)
+        if isinstance(self.in_serializer, BufferedSerializable):
+            read = self.in_serializer.read
+            return [read(record) for record in records]
+        return self.in_serializer.read_many(records)
+
+    def next_batch(self, max_records: int, max_wait_s: float) -> List[object]:
+        """Method that encapsulates batched record fetching logic. Child classes should override this 
+        if the source can return several records in one call. The default implementation calls `next()` 
+        until `max_records` records are collected or `max_wait_s` has elapsed. Since `next()` blocks, 
+        `max_wait_s` is only checked between records.
+
+        Args:
+            max_records (int): Maximum number of records to return.
+            max_wait_s (float): Maximum time to wait for the batch to fill.
+
+        Raises:
+            StopIteration: Raised if the source is exhausted and no records were fetched.
+
+        Returns:
+            (List[obj]): Records that have not been deserialized yet.
+        """
+        records = []
+        CoarseClock.start()
+        deadline = CoarseClock.now + max_wait_s
+        try:
+            while len(records) < max_records:
+                records.append(self.next())
+                if CoarseClock.now >= deadline:
+                    break
+        except StopIteration:
+            if not records:
+                raise
+        return records
+
 from .TwitterStreamingIngest import TwitterStreamingIngest
 from .TwitterFilteredIngest import TwitterFilteredIngest
 from .KafkaIngest import KafkaIngest
@@ -4,10 +4,22 @@ from edna.process import BaseProcess
 
 
 class ChainedProcess(BaseProcess):
+    """A ChainedProcess applies the `outer_process` to the output of the `inner_process`, i.e. `outer(inner())`.
+    Both processes receive entire batches of messages.
+
+    Args:
+        BaseProcess (BaseProcess): The interface this process implements
+    """
     process_name : str = "ChainedProcess"
     def __init__(self, outer_process: BaseProcess, inner_process: BaseProcess, *args, **kwargs) -> BaseProcess:
         super().__init__(process=inner_process,  *args, **kwargs)
         self.outer_process = outer_process
 
     def process(self, message):
-        return self.outer_process(message)
+        return self.outer_process([message])
+
+    def process_batch(self, records):
+        return self.outer_process(records)
+
+    def release_batch(self, expired_only: bool = False):
+        return self.outer_process.flush(expired_only=expired_only)
@@ -1,8 +1,13 @@
 from __future__ import annotations
+from typing import Tuple
 
 from edna.serializers import BufferedSerializable
 
 
+def _identity(records):
+    return records
+
+
 class BaseProcess(object):
     """BaseProcess is the base class for performing operations on streaming messages.
 
@@ -11,6 +16,14 @@ class BaseProcess(object):
     - Implement the `process()` method
     
     - Call `super().__init__()` at the end of initialization
+
+    Child classes can:
+
+    - Override the `process_batch()` method to process a batch of messages at once, if the 
+        logic has a more efficient batched implementation than calling `process()` per message
+
+    - Override the `release_batch()` method if `process_batch()` holds back messages across calls, 
+        e.g. to accumulate larger batches
     
     Child classes should NOT:
 
@@ -22,6 +35,7 @@ class BaseProcess(object):
     serializer: BufferedSerializable
     in_serializer: BufferedSerializable
     out_serializer: BufferedSerializable
+    chained: bool
     def __init__(self, process: BaseProcess = None, 
             serializer: BufferedSerializable = None, 
             in_serializer : BufferedSerializable = None, 
@@ -31,13 +45,22 @@ class BaseProcess(object):
 
         Args:
             process (BaseProcess, optional): A process primitive for functional chaining.
+            serializer (BufferedSerializable, optional): Serializer for both the input and output of this process.
+            in_serializer (BufferedSerializable, optional): Serializer for records this process receives 
+                from another task. Used if `serializer` is None.
+            out_serializer (BufferedSerializable, optional): Serializer for records this process sends 
+                to another task. Used if `serializer` is None.
+
+            The serializers are only used where records cross a byte transport between tasks. The 
+            `PhysicalGraphBuilder` replaces them with pass-through serializers on fused and in-memory edges.
 
         Returns:
             BaseProcess: A chained process primitive.
         """
-        self.chained_process = process if process is not None else lambda x: x
+        self.chained_process = process if process is not None else _identity
+        self.chained = process is not None
         self.serializer = serializer
-        if self.serializer is not None:
+        if self.serializer is None:
             self.in_serializer = in_serializer
             self.out_serializer = out_serializer
         else:
@@ -56,16 +79,64 @@ class BaseProcess(object):
             message (List[obj]): A list of messages to process with this primitive. Usually Singleton unless the preceding is a 1-N mapping
 
         Returns:
-            (obj): A processed message
+            (List[obj]): A list of processed messages
         """
-        complete_results = []   # TODO Update this to a RecordCollecton
         intermediate_result = self.chained_process(message)    # Returns a list
-        #if self.process_name == "ObjectToJson":
-        for item in intermediate_result:    # is a list
-            complete_results += self.process(item)
+        return self.process_batch(intermediate_result)
+
+    def process_batch(self, records):
+        """Logic for processing a batch of messages. The default implementation calls `process()` on 
+        each message and concatenates the results. Inheriting classes can override this with a batched implementation.
+
+        Args:
+            records (List[obj]): The messages to process with this logic
+
+        Returns:
+            (Sequence[obj]): The processed messages. This may be a `Sequence` other than a `list`, e.g. an
+                `edna.types.builtin.FeatureBatch`, so callers should not modify it in place.
+        """
+        complete_results = []
+        for item in records:
+            complete_results.extend(self.process(item))
         return complete_results
 
 
+    def flush(self, expired_only: bool = False):
+        """Releases the messages held back by this process and by the processes chained into it. Tasks call
+        this periodically with `expired_only`, and once without it when the stream ends.
+
+        This should NOT be modified.
+
+        Args:
+            expired_only (bool, optional): Only release messages that have been held back for too long. Defaults to False.
+
+        Returns:
+            (Sequence[obj]): The processed messages that were held back, in order.
+        """
+        complete_results = []
+        if isinstance(self.chained_process, BaseProcess):
+            released_records = self.chained_process.flush(expired_only=expired_only)
+            if released_records:
+                complete_results = self.process_batch(released_records)   # Not necessarily a list
+        released_results = self.release_batch(expired_only=expired_only)
+        if not released_results:
+            return complete_results
+        if not complete_results:
+            return released_results
+        return list(complete_results) + list(released_results)
+
+    def release_batch(self, expired_only: bool = False):
+        """Logic for releasing messages that `process_batch()` held back. Processes that hold back messages
+        need to implement this. The default implementation holds back nothing.
+
+        Args:
+            expired_only (bool, optional): Only release messages that have been held back for too long. Defaults to False.
+
+        Returns:
+            (List[obj]): The processed messages that were held back, in order.
+        """
+        return []
+
     def process(self, message):
         """Logic for message processing. Inheriting classes should implement this. We return a singleton to work with Emit
 
@@ -79,6 +150,25 @@ class BaseProcess(object):
 
     def replaceChainedProcess(self, process: BaseProcess):
         self.chained_process = process
+        self.chained = True
+
+    def getReferencedFields(self) -> Tuple[str]:
+        """Get the fields of a record that this process reads. The planner uses this to project records
+        down to the fields that downstream processes need (see `edna.process.map.JsonToObject`).
+
+        Returns:
+            (Tuple[str]): The keys this process reads from each record, or None if it may read the whole record.
+        """
+        return None
+
+    def isRecordPreserving(self) -> bool:
+        """Checks whether this process outputs its input records unchanged (e.g. a filter), so that processes
+        after it read the same records.
+
+        Returns:
+            bool: True if the output records are a subset of the input records.
+        """
+        return False
 
 from .map import Map
 
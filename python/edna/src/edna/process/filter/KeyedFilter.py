@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Tuple
 from edna.process.filter import Filter
 from edna.process import BaseProcess
 
@@ -21,4 +21,17 @@ class KeyedFilter(Filter):
         self.filter_callable = filter_callable
     
     def filter(self, message: str):
-        return [message] if self.filter_callable(message[self.key]) else []
\ No newline at end of file
+        return [message] if self.filter_callable(message[self.key]) else []
+
+    def process_batch(self, records):
+        key = self.key
+        filter_callable = self.filter_callable
+        return [message for message in records if filter_callable(message[key])]
+
+    def getReferencedFields(self) -> Tuple[str]:
+        if self.chained:
+            return None
+        return (self.key,)
+
+    def isRecordPreserving(self) -> bool:
+        return not self.chained
\ No newline at end of file
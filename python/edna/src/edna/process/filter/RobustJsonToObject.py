@@ -1,16 +1,59 @@
 from __future__ import annotations
+from typing import List, Tuple
+from edna.process import BaseProcess
 from edna.process.filter import Filter
-import ujson
+from edna.utils import JsonBackend
 
 class RobustJsonToObject(Filter):
-    """Maps a json formatted string to a Dictionary, and discard malformed jsons
+    """Maps a json formatted string or bytes to a Dictionary, and discard malformed jsons
 
     Args:
         Map (BaseProcess): The interface this process implements
     """
     process_name : str = "RobustJsonToObject"
+    def __init__(self, process: BaseProcess = None, json_backend: str = None, projection: List[str] = None, *args, **kwargs) -> BaseProcess:
+        """Initializes the RobustJsonToObject Filter Operator.
+
+        Args:
+            process (BaseProcess, optional): A process primitive for functional chaining. Defaults to None.
+            json_backend (str, optional): Name of the JSON library to parse with. Defaults to None, which
+                selects the fastest installed one (see `edna.utils.JsonBackend`).
+            projection (List[str], optional): Top-level keys to keep from each record. Defaults to None, which 
+                keeps the whole record. If it is None, the planner sets it to the keys read by the downstream
+                processes, when they declare them (see `BaseProcess.getReferencedFields()`).
+
+        Returns:
+            BaseProcess: A chained process primitive.
+        """
+        self.json_backend = JsonBackend.getBackend(json_backend)
+        self.projection = None
+        if projection is not None:
+            self.setProjection(projection)
+        super().__init__(process=process, *args, **kwargs)
+
+    def setProjection(self, projection: List[str]):
+        self.projection = tuple(projection)
+
+    def getProjection(self) -> Tuple[str]:
+        return self.projection
+
+    def loads(self, record: str):
+        if self.projection is not None:
+            return self.json_backend.loads_projected(record, self.projection)
+        return self.json_backend.loads(record)
+
     def filter(self, record: str):
         try:
-            return [ujson.loads(record)]
+            return [self.loads(record)]
         except ValueError:
-            return []
\ No newline at end of file
+            return []
+
+    def process_batch(self, records):
+        loads = self.loads
+        complete_results = []
+        for record in records:
+            try:
+                complete_results.append(loads(record))
+            except ValueError:
+                pass
+        return complete_results
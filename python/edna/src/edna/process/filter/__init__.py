@@ -9,6 +9,10 @@ class Filter(BaseProcess):
     - Implement the `filter()` method
     
     - Call `super().__init__()` at the end of initialization
+
+    Child classes can:
+
+    - Override the `process_batch()` method to filter a batch of messages at once
     
     Child classes should NOT:
 
@@ -44,6 +48,20 @@ class Filter(BaseProcess):
         """
         return self.filter(message)
 
+    def process_batch(self, records):
+        """Filters each message in a batch with the `filter()` method.
+
+        Args:
+            records (List[obj]): The messages to process with this primitive
+
+        Returns:
+            (List[obj]): The messages retained by the filter, in order.
+        """
+        complete_results = []
+        for message in records:
+            complete_results.extend(self.filter(message))
+        return complete_results
+
     def filter(self, message: object):
         """Logic for mapping. Subclasses need to implement this.
 
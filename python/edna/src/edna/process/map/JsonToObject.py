@@ -1,12 +1,47 @@
+from typing import List, Tuple
+from edna.process import BaseProcess
 from edna.process.map import Map
-import ujson
+from edna.utils import JsonBackend
 
 class JsonToObject(Map):
-    """Maps a json formatted string to a Dictionary.
+    """Maps a json formatted string or bytes to a Dictionary.
 
     Args:
         Map (BaseProcess): The interface this process implements
     """
     process_name : str = "JsonToObject"
+    def __init__(self, process: BaseProcess = None, json_backend: str = None, projection: List[str] = None, *args, **kwargs) -> BaseProcess:
+        """Initializes the JsonToObject Map Operator.
+
+        Args:
+            process (BaseProcess, optional): A process primitive for functional chaining. Defaults to None.
+            json_backend (str, optional): Name of the JSON library to parse with. Defaults to None, which
+                selects the fastest installed one (see `edna.utils.JsonBackend`).
+            projection (List[str], optional): Top-level keys to keep from each record. Defaults to None, which 
+                keeps the whole record. If it is None, the planner sets it to the keys read by the downstream
+                processes, when they declare them (see `BaseProcess.getReferencedFields()`).
+
+        Returns:
+            BaseProcess: A chained process primitive.
+        """
+        self.json_backend = JsonBackend.getBackend(json_backend)
+        self.projection = None
+        if projection is not None:
+            self.setProjection(projection)
+        super().__init__(process=process, *args, **kwargs)
+
+    def setProjection(self, projection: List[str]):
+        self.projection = tuple(projection)
+
+    def getProjection(self) -> Tuple[str]:
+        return self.projection
+
     def map(self, message: str):
-        return ujson.loads(message)
\ No newline at end of file
+        if self.projection is not None:
+            return self.json_backend.loads_projected(message, self.projection)
+        return self.json_backend.loads(message)
+
+    def process_batch(self, records):
+        if self.projection is not None:
+            return self.json_backend.loads_projected_many(records, self.projection)
+        return self.json_backend.loads_many(records)
@@ -1,12 +1,37 @@
+from edna.process import BaseProcess
 from edna.process.map import Map
-import ujson
+from edna.utils import JsonBackend
 
 class ObjectToJson(Map):
-    """Maps an object to a json string.
+    """Maps an object to a json string, or to UTF-8 encoded json bytes.
 
     Args:
         Map (BaseProcess): The interface this process implements
     """
     process_name : str = "ObjectToJson"
-    def map(self, message: str):
-        return ujson.dumps(message)
\ No newline at end of file
+    def __init__(self, process: BaseProcess = None, json_backend: str = None, as_bytes: bool = False, *args, **kwargs) -> BaseProcess:
+        """Initializes the ObjectToJson Map Operator.
+
+        Args:
+            process (BaseProcess, optional): A process primitive for functional chaining. Defaults to None.
+            json_backend (str, optional): Name of the JSON library to serialize with. Defaults to None, which
+                selects the fastest installed one (see `edna.utils.JsonBackend`).
+            as_bytes (bool, optional): Output UTF-8 encoded bytes instead of strings, e.g. for a `KafkaEmit` 
+                with an `EmptyByteSerializer`. Defaults to False.
+
+        Returns:
+            BaseProcess: A chained process primitive.
+        """
+        self.json_backend = JsonBackend.getBackend(json_backend)
+        self.as_bytes = as_bytes
+        super().__init__(process=process, *args, **kwargs)
+
+    def map(self, message: object):
+        if self.as_bytes:
+            return self.json_backend.dumps_bytes(message)
+        return self.json_backend.dumps(message)
+
+    def process_batch(self, records):
+        if self.as_bytes:
+            return self.json_backend.dumps_bytes_many(records)
+        return self.json_backend.dumps_many(records)
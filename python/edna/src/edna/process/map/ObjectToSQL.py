@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from edna.process import BaseProcess
 from edna.process.map import Map
 from edna.core.factories import SQLTupleFactory
@@ -60,5 +60,13 @@ class ObjectToSQL(Map):
         """
         return self.tuple_factory.getValues(message=message)
 
-        
+    def process_batch(self, records):
+        return self.tuple_factory.getValuesMany(records)
 
+    def getReferencedFields(self) -> Tuple[str]:
+        if self.chained:
+            return None
+        # A custom factory, or one that overrides getValues(), may read keys other than its fields
+        if not isinstance(self.tuple_factory, SQLTupleFactory) or type(self.tuple_factory).getValues is not SQLTupleFactory.getValues:
+            return None
+        return tuple(self.tuple_factory.getFields())
\ No newline at end of file
@@ -1,7 +1,14 @@
 from os import PathLike
+from typing import List, Tuple
 from edna.process import BaseProcess
 from edna.process.map import Map
+from edna.utils import TimerService
+from edna.types.builtin import FeatureBatch
+import os
+import threading
+import time
 import warnings
+import weakref
 
 
 sklearn = None
@@ -9,25 +16,240 @@ try:
     import sklearn
     import joblib
     import numpy
+    import scipy.sparse
 except ImportError:
     warnings.warn("scikit-learn module is not installed. edna.process.map.SklearnClassifier might not work properly.", category=ImportWarning)
 
 
 
 class SklearnClassifier(Map):
+    """Classifies feature vectors with a scikit-learn estimator loaded with `joblib`.
+
+    Each batch of records is stacked into a single NumPy array and classified with one `predict()` (or
+    `predict_proba()`) call. If `max_batch_size` is set, records are also accumulated across batches until
+    `max_batch_size` records are available or the oldest record has waited `max_batch_wait_ms`. The 
+    predictions are always returned in the order of the records.
+
+    Each record must be a single sample: a feature vector, or a single-row array (dense or sparse). Each 
+    record produces the estimator's output for that one sample, as `predict()` (or `predict_proba()`) on 
+    a single-row array returns it: an array with one label, or with one row of class probabilities. This 
+    is the same whether the record is classified on its own with `map()` or in a batch.
+
+    The estimator is loaded with `joblib.load(mmap_mode=...)`, so the NumPy arrays of an uncompressed model
+    file are memory-mapped instead of copied. Replicas on the same host share these pages through the page
+    cache, and SklearnClassifiers of the same file in one process share the estimator itself.
+
+    If `reload_interval_ms` is set, the model file is checked for changes in the background. A changed file
+    is loaded on a separate thread while the stream continues with the current estimator, which is then
+    replaced in a single assignment. Each batch is classified with a single estimator. Replace the model file 
+    atomically (e.g. write a temporary file and `os.replace()` it), so a partially written file is never loaded.
+
+    Args:
+        Map (BaseProcess): The interface this process implements
+    """
     process_name : str = "SklearnClassifier"
     classifier : sklearn.base.BaseEstimator
+    _classifier_cache : weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+    _classifier_cache_lock : threading.Lock = threading.Lock()
     def __init__(self, process: BaseProcess = None, 
         classifier_path: PathLike = None, 
+        max_batch_size: int = None,
+        max_batch_wait_ms: int = 100,
+        predict_proba: bool = False,
+        mmap_mode: str = "r",
+        reload_interval_ms: int = None,
         *args, **kwargs) -> BaseProcess:
+        """Initializes the SklearnClassifier Map Operator.
+
+        Args:
+            process (BaseProcess, optional): A process primitive for functional chaining. Defaults to None.
+            classifier_path (PathLike): Path to the estimator, saved with `joblib.dump()`.
+            max_batch_size (int, optional): Number of records to classify at once. Defaults to None, which 
+                classifies each incoming batch as is, without holding records back.
+            max_batch_wait_ms (int, optional): Maximum time a record is held back for a batch to fill. Defaults to 100.
+            predict_proba (bool, optional): Output class probabilities with `predict_proba()` instead of
+                labels. Defaults to False.
+            mmap_mode (str, optional): `mmap_mode` for `joblib.load()`. Defaults to "r", which maps the model's
+                arrays read-only. None loads a private copy.
+            reload_interval_ms (int, optional): How often to check the model file for changes. Defaults to None,
+                which never reloads the model.
+
+        Raises:
+            ValueError: If `classifier_path` is None or `max_batch_size` is not positive.
+
+        Returns:
+            BaseProcess: A chained process primitive.
+        """
         if classifier_path is None:
             raise ValueError("Must provide valid `classifier_path` for SklearnClassifier, got None")
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive; received {max_batch_size}".format(max_batch_size=max_batch_size))
         self.classifier_path = classifier_path
-        self.classifier = joblib.load(classifier_path)
+        self.mmap_mode = mmap_mode
+        self.classifier, self.classifier_version = self.load_classifier(classifier_path, mmap_mode)
+        self.reload_interval_s = None if reload_interval_ms is None else float(reload_interval_ms) / 1000.
+        self.reload_thread = None
+        self.timer_handle = None
+        if self.reload_interval_s is not None:
+            self.timer_handle = TimerService.getInstance().schedule(time.time() + self.reload_interval_s, self.check_classifier_update)
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait_s = float(max_batch_wait_ms) / 1000.
+        self.predict_proba = predict_proba
+        self.pending_records = []
+        self.pending_timer = None   # When the oldest pending record arrived
         super().__init__(process=process, *args, **kwargs)
 
+    def __getstate__(self):
+        # Copies of this process (e.g. in the workers of a SimpleStreamingContext) load the estimator themselves, 
+        # so that it is memory-mapped instead of copied, and start their own reload checks
+        state = self.__dict__.copy()
+        for unpicklable_key in ("classifier", "reload_thread", "timer_handle"):
+            state[unpicklable_key] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.classifier, self.classifier_version = self.load_classifier(self.classifier_path, self.mmap_mode)
+        if self.reload_interval_s is not None:
+            self.timer_handle = TimerService.getInstance().schedule(time.time() + self.reload_interval_s, self.check_classifier_update)
+
+    @staticmethod
+    def load_classifier(classifier_path: PathLike, mmap_mode: str = "r") -> Tuple[sklearn.base.BaseEstimator, Tuple]:
+        """Loads an estimator, or reuses the one already loaded in this process from the same version of the file.
+
+        Args:
+            classifier_path (PathLike): Path to the estimator, saved with `joblib.dump()`.
+            mmap_mode (str, optional): `mmap_mode` for `joblib.load()`. Defaults to "r".
+
+        Returns:
+            (Tuple[BaseEstimator, Tuple]): The estimator, and the version of the file it was loaded from.
+        """
+        classifier_version = SklearnClassifier.get_classifier_version(classifier_path)
+        cache_key = (os.path.realpath(classifier_path), classifier_version, mmap_mode)
+        with SklearnClassifier._classifier_cache_lock:
+            classifier = SklearnClassifier._classifier_cache.get(cache_key)
+            if classifier is None:
+                classifier = joblib.load(classifier_path, mmap_mode=mmap_mode)
+                try:
+                    SklearnClassifier._classifier_cache[cache_key] = classifier
+                except TypeError:   # The estimator does not support weak references, so it is not shared
+                    pass
+        return classifier, classifier_version
+
+    @staticmethod
+    def get_classifier_version(classifier_path: PathLike) -> Tuple:
+        """Identifies the current version of a model file. Replacing the file changes its inode, and 
+        rewriting it changes its modification time or size."""
+        classifier_stat = os.stat(classifier_path)
+        return (classifier_stat.st_ino, classifier_stat.st_mtime_ns, classifier_stat.st_size)
+
+    def check_classifier_update(self):
+        """Starts loading the model file on a background thread if it changed. This is called by the `TimerService`.
+
+        Returns:
+            (float): The time of the next check.
+        """
+        if self.reload_thread is None or not self.reload_thread.is_alive():
+            try:
+                classifier_version = self.get_classifier_version(self.classifier_path)
+            except OSError:     # The file is being replaced
+                classifier_version = self.classifier_version
+            if classifier_version != self.classifier_version:
+                self.reload_thread = threading.Thread(target=self.reload_classifier, name="edna-classifier-reload", daemon=True)
+                self.reload_thread.start()
+        return time.time() + self.reload_interval_s
+
+    def reload_classifier(self):
+        """Loads the model file and swaps it in for the current estimator. If the file cannot be loaded, the
+        current estimator is kept, and the file is loaded again once it changes."""
+        classifier_version = None
+        try:
+            classifier_version = self.get_classifier_version(self.classifier_path)
+            classifier, classifier_version = self.load_classifier(self.classifier_path, self.mmap_mode)
+        except Exception as e:
+            warnings.warn("Could not reload classifier from {classifier_path}: {error}".format(classifier_path=self.classifier_path, error=e))
+            if classifier_version is not None:
+                self.classifier_version = classifier_version    # Do not retry until the file changes again
+            return
+        self.classifier, self.classifier_version = classifier, classifier_version
+
+    def predict(self, features):
+        classifier = self.classifier    # A reload may swap the estimator at any time
+        if self.predict_proba:
+            return classifier.predict_proba(features)
+        return classifier.predict(features)
+
     def map(self,message : object):
-        return self.classifier.predict(message)
+        return self.predict_batch([message])[0]
+
+    def predict_batch(self, records: List[object]) -> List[object]:
+        """Stacks the feature vectors of the records and classifies them with a single call.
+
+        Args:
+            records (List[obj]): Feature vectors (or single-row feature arrays, dense or sparse) to classify, 
+                or a `FeatureBatch`.
+
+        Raises:
+            ValueError: If a record holds more than one row of features.
+
+        Returns:
+            (List[obj]): One prediction per record, in order. Each is a one-row slice of the batch's predictions, 
+                i.e. the same as the estimator's output for the record on its own.
+        """
+        if not records:
+            return []
+        if isinstance(records, FeatureBatch):
+            features = records.matrix
+        elif scipy.sparse.issparse(records[0]):
+            features = scipy.sparse.vstack(records, format="csr")
+        else:
+            features = numpy.vstack(records)
+        if features.shape[0] != len(records):
+            raise ValueError("Each record must hold a single row of features; received {row_count} rows for {record_count} records".format(
+                                row_count=features.shape[0], record_count=len(records)))
+        predictions = self.predict(features)
+        return [predictions[index:index + 1] for index in range(len(records))]
+
+    def process_batch(self, records):
+        """Classifies the records in batches of `max_batch_size`. Records that do not fill a batch are held
+        back until more records arrive, or until they time out (see `release_batch()`).
+
+        Args:
+            records (List[obj]): Feature vectors (or single-row feature arrays) to classify.
+
+        Returns:
+            (List[obj]): The predictions for all records in completed batches, in order.
+        """
+        if self.max_batch_size is None:
+            return self.predict_batch(records)
+        if not records:
+            return self.release_batch(expired_only=True)
+        if not self.pending_records:
+            self.pending_timer = time.time()
+        self.pending_records.extend(records)
+        complete_results = []
+        pending_count = len(self.pending_records)
+        if pending_count >= self.max_batch_size:
+            batch_end = pending_count - pending_count % self.max_batch_size
+            for batch_start in range(0, batch_end, self.max_batch_size):
+                complete_results.extend(self.predict_batch(self.pending_records[batch_start:batch_start + self.max_batch_size]))
+            del self.pending_records[:batch_end]
+            self.pending_timer = time.time()    # The remaining records arrived with this batch
+        complete_results.extend(self.release_batch(expired_only=True))
+        return complete_results
+
+    def release_batch(self, expired_only: bool = False):
+        """Classifies the records held back by `process_batch()`.
 
+        Args:
+            expired_only (bool, optional): Only classify them if the oldest has waited `max_batch_wait_ms`. Defaults to False.
 
-        
+        Returns:
+            (List[obj]): The predictions for the held back records, in order.
+        """
+        if not self.pending_records:
+            return []
+        if expired_only and (time.time() - self.pending_timer) < self.max_batch_wait_s:
+            return []
+        pending_records, self.pending_records = self.pending_records, []
+        return self.predict_batch(pending_records)
@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from edna.process import BaseProcess
+from edna.process.map import Map
+from edna.types.builtin import FeatureBatch
+import warnings
+
+
+sklearn = None
+try:
+    import sklearn
+    import numpy
+    import scipy.sparse
+    from sklearn.feature_extraction.text import HashingVectorizer
+except ImportError:
+    warnings.warn("scikit-learn module is not installed. edna.process.map.TextToFeatures might not work properly.", category=ImportWarning)
+
+
+class TextToFeatures(Map):
+    """Maps text to sparse feature vectors with a scikit-learn `HashingVectorizer`, which tokenizes the
+    text and hashes the tokens into a fixed number of features. It needs no fitting, so it can run on any stream.
+
+    Each batch is vectorized with a single `transform()` call, and returned as an `edna.types.builtin.FeatureBatch`
+    backed by one CSR matrix. A batched `SklearnClassifier` after it classifies this matrix directly. Texts 
+    repeated within a batch are vectorized once. If `cache_size` is set, the vectors of the most recently 
+    seen texts are also kept across batches, so retweets and duplicates are not vectorized again.
+
+    The feature vectors are not serializable with EDNA's serializers, so the next process should be chained to
+    this one, or connected with an in-memory channel.
+
+    Example usage:
+
+        ```
+        >> text_to_features = TextToFeatures(text_key="text", vectorizer_params={"n_features": 2**18})
+        >> classifier = SklearnClassifier(classifier_path="model.joblib", max_batch_size=256)
+        >> stream.map(map_process=text_to_features).map(map_process=classifier)
+        ```
+
+    Args:
+        Map (BaseProcess): The interface this process implements
+    """
+    process_name : str = "TextToFeatures"
+    def __init__(self, process: BaseProcess = None, 
+            text_key: str = None,
+            vectorizer_params: Dict = None,
+            cache_size: int = None,
+            *args, **kwargs) -> BaseProcess:
+        """Initializes the TextToFeatures Map Operator.
+
+        Args:
+            process (BaseProcess, optional): A process primitive for functional chaining. Defaults to None.
+            text_key (str, optional): Key of the text in each record. Defaults to None, for records that are the text itself.
+            vectorizer_params (Dict, optional): Parameters for the `HashingVectorizer`, e.g. `n_features` or
+                `ngram_range`. Defaults to None, which uses scikit-learn's defaults.
+            cache_size (int, optional): Number of recent texts to cache the vectors of. Defaults to None, which 
+                disables the cache.
+
+        Raises:
+            ValueError: If `cache_size` is not positive.
+
+        Returns:
+            BaseProcess: A chained process primitive.
+        """
+        if cache_size is not None and cache_size <= 0:
+            raise ValueError("cache_size must be positive; received {cache_size}".format(cache_size=cache_size))
+        self.text_key = text_key
+        self.vectorizer = HashingVectorizer(**(vectorizer_params or {}))
+        self.n_features = self.vectorizer.n_features
+        self.cache_size = cache_size
+        self.feature_cache = OrderedDict()  # text -> (indices, data) of its vector, least recently used first
+        super().__init__(process=process, *args, **kwargs)
+
+    def getReferencedFields(self) -> Tuple[str]:
+        if self.chained or self.text_key is None:
+            return None
+        return (self.text_key,)
+
+    def get_text(self, message: object) -> str:
+        if self.text_key is None:
+            return message
+        return message[self.text_key]
+
+    def map(self, message: object):
+        return self.vectorizer.transform([self.get_text(message)])
+
+    def process_batch(self, records):
+        """Vectorizes a batch of records into a single CSR matrix.
+
+        Args:
+            records (List[obj]): The texts, or records containing them under `text_key`.
+
+        Returns:
+            (FeatureBatch): One row of features per record, in order.
+        """
+        if not records:
+            return []
+        text_key = self.text_key
+        texts = records if text_key is None else [message[text_key] for message in records]
+        # Position of each text among the distinct texts of the batch
+        text_index = {}
+        positions = [text_index.setdefault(text, len(text_index)) for text in texts]
+        distinct_texts = list(text_index)
+        if self.cache_size is None:
+            matrix = self.vectorizer.transform(distinct_texts)
+        else:
+            matrix = self.transform_cached(distinct_texts)
+        if len(distinct_texts) < len(texts):
+            matrix = matrix[positions]
+        return FeatureBatch(matrix)
+
+    def transform_cached(self, texts: List[str]):
+        """Vectorizes distinct texts, reusing the vectors of cached texts and caching the rest.
+
+        Args:
+            texts (List[str]): The distinct texts.
+
+        Returns:
+            (scipy.sparse.csr_matrix): One row of features per text, in order.
+        """
+        feature_cache = self.feature_cache
+        missing_texts = [text for text in texts if text not in feature_cache]
+        if missing_texts:
+            missing_matrix = self.vectorizer.transform(missing_texts)
+            indptr, indices, data = missing_matrix.indptr, missing_matrix.indices, missing_matrix.data
+            for row, text in enumerate(missing_texts):
+                feature_cache[text] = (indices[indptr[row]:indptr[row+1]].copy(), data[indptr[row]:indptr[row+1]].copy())
+        rows = []
+        for text in texts:
+            feature_cache.move_to_end(text)
+            rows.append(feature_cache[text])
+        while len(feature_cache) > self.cache_size:
+            feature_cache.popitem(last=False)
+        row_lengths = numpy.fromiter((len(row_indices) for row_indices, _ in rows), dtype=numpy.int64, count=len(rows))
+        indptr = numpy.zeros(len(rows) + 1, dtype=numpy.int64)
+        numpy.cumsum(row_lengths, out=indptr[1:])
+        indices = numpy.concatenate([row_indices for row_indices, _ in rows])
+        data = numpy.concatenate([row_data for _, row_data in rows])
+        return scipy.sparse.csr_matrix((data, indices, indptr), shape=(len(rows), self.n_features))
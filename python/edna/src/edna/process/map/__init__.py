@@ -10,6 +10,10 @@ class Map(BaseProcess):
     - Implement the `map()` method
     
     - Call `super().__init__()` at the end of initialization
+
+    Child classes can:
+
+    - Override the `process_batch()` method to map a batch of messages at once
     
     Child classes should NOT:
 
@@ -45,6 +49,18 @@ class Map(BaseProcess):
         """
         return [self.map(message)]
 
+    def process_batch(self, records):
+        """Maps each message in a batch with the `map()` method. This avoids building a singleton
+        list for each message.
+
+        Args:
+            records (List[obj]): The messages to process with this primitive
+
+        Returns:
+            (List[obj]): The mapped messages, in order.
+        """
+        return [self.map(message) for message in records]
+
     def map(self, message: object):
         """Logic for mapping. Subclasses need to implement this.
 
@@ -65,3 +81,9 @@ try:
     from .SklearnClassifier import SklearnClassifier
 except (ImportError, AttributeError):
     warnings.warn("scikit-learn module is not installed. edna.process.map.SklearnClassifier might not work properly.", category=ImportWarning)
+
+TextToFeatures = None
+try:
+    from .TextToFeatures import TextToFeatures
+except (ImportError, AttributeError):
+    warnings.warn("scikit-learn module is not installed. edna.process.map.TextToFeatures might not work properly.", category=ImportWarning)
\ No newline at end of file
@@ -18,6 +18,38 @@ class BufferedSerializable(Serializable):
     def feed(self, buffered_message: bytes):
         raise NotImplementedError
 
+    def read_many(self, buffered_message: bytes, record_count: int = None):
+        """Feeds a buffer of serialized records and deserializes them. Unlike `Serializable.read_many()`, 
+        the input is a single buffer, since a BufferedSerializable reads a stream of bytes.
+
+        Args:
+            buffered_message (bytes): The serialized records.
+            record_count (int, optional): Number of records to deserialize. Defaults to None, which 
+                deserializes every complete record that has been fed.
+
+        Returns:
+            (List[obj]): The deserialized records.
+        """
+        self.feed(buffered_message)
+        if record_count is None:
+            return list(self)
+        return [self.next() for _ in range(record_count)]
+
+    def write_many(self, out_streams):
+        """Serializes a batch of records into a single buffer. Unlike `Serializable.write_many()`, the output is
+        one contiguous buffer, since a BufferedSerializable writes a stream of bytes.
+
+        Args:
+            out_streams (List[obj]): The records to serialize.
+
+        Returns:
+            (bytes): The serialized records, back to back.
+        """
+        return b"".join([self.write(out_stream) for out_stream in out_streams])
+
+    def __iter__(self):
+        return self
+
     def __next__(self):
         return self.next()
 
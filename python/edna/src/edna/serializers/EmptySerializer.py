@@ -1,4 +1,5 @@
 from edna.serializers import Serializable
+from typing import List
 
 class EmptyObjectSerializer(Serializable):
     """EmptyObjectSerializer class expects obj and passes it.
@@ -9,6 +10,12 @@ class EmptyObjectSerializer(Serializable):
     @classmethod
     def write(cls, out_stream: object):
         return out_stream
+    @classmethod
+    def read_many(cls, in_streams: List[object]):
+        return in_streams
+    @classmethod
+    def write_many(cls, out_streams: List[object]):
+        return out_streams
 
 class EmptyStringSerializer(Serializable):
     """EmptyStringSerializer class expects str and passes it.
@@ -19,6 +26,12 @@ class EmptyStringSerializer(Serializable):
     @classmethod
     def write(cls, out_stream: str):
         return out_stream
+    @classmethod
+    def read_many(cls, in_streams: List[str]):
+        return in_streams
+    @classmethod
+    def write_many(cls, out_streams: List[str]):
+        return out_streams
 
 class EmptyBoolSerializer(Serializable):
     """EmptyBoolSerializer class expects str and passes it.
@@ -29,6 +42,12 @@ class EmptyBoolSerializer(Serializable):
     @classmethod
     def write(cls, out_stream: bool):
         return out_stream
+    @classmethod
+    def read_many(cls, in_streams: List[bool]):
+        return in_streams
+    @classmethod
+    def write_many(cls, out_streams: List[bool]):
+        return out_streams
 
 class EmptyIntSerializer(Serializable):
     """EmptyIntSerializer class expects str and passes it.
@@ -39,6 +58,12 @@ class EmptyIntSerializer(Serializable):
     @classmethod
     def write(cls, out_stream: int):
         return out_stream
+    @classmethod
+    def read_many(cls, in_streams: List[int]):
+        return in_streams
+    @classmethod
+    def write_many(cls, out_streams: List[int]):
+        return out_streams
 
 class EmptyFloatSerializer(Serializable):
     """EmptyFloatSerializer class expects str and passes it.
@@ -49,6 +74,12 @@ class EmptyFloatSerializer(Serializable):
     @classmethod
     def write(cls, out_stream: float):
         return out_stream
+    @classmethod
+    def read_many(cls, in_streams: List[float]):
+        return in_streams
+    @classmethod
+    def write_many(cls, out_streams: List[float]):
+        return out_streams
 
 class EmptyByteSerializer(Serializable):
     """EmptyByteSerializer class expects str and passes it.
@@ -58,4 +89,10 @@ class EmptyByteSerializer(Serializable):
         return in_stream
     @classmethod
     def write(cls, out_stream: bytes):
-        return out_stream
\ No newline at end of file
+        return out_stream
+    @classmethod
+    def read_many(cls, in_streams: List[bytes]):
+        return in_streams
+    @classmethod
+    def write_many(cls, out_streams: List[bytes]):
+        return out_streams
\ No newline at end of file
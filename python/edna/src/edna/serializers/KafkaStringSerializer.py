@@ -1,4 +1,5 @@
 from edna.serializers import Serializable
+from typing import List
 import codecs
 
 class KafkaStringSerializer(Serializable):
@@ -28,4 +29,26 @@ class KafkaStringSerializer(Serializable):
             (byte): Encoded bytes from utf-8 encoded strings
         """
         return bytes(out_stream, encoding="utf-8")
-        
\ No newline at end of file
+
+    @classmethod
+    def read_many(cls, in_streams: List[bytes]):
+        """Reads a batch of strings from byte inputs.
+
+        Args:
+            in_streams (List[bytes]): Inputs of bytes
+
+        Returns:
+            (List[str]): Decoded bytes into utf-8 encoded strings
+        """
+        return [in_stream.decode("utf-8") for in_stream in in_streams]
+    @classmethod
+    def write_many(cls, out_streams: List[str]):
+        """Writes a batch of strings as byte outputs.
+
+        Args:
+            out_streams (List[str]): Inputs of strings to output
+
+        Returns:
+            (List[bytes]): Encoded bytes from utf-8 encoded strings
+        """
+        return [out_stream.encode("utf-8") for out_stream in out_streams]
\ No newline at end of file
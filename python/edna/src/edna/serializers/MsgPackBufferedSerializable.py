@@ -1,21 +1,90 @@
 from edna.serializers import BufferedSerializable
+from edna.defaults import EdnaDefault
+from typing import List
 import msgpack
 
 class MsgPackBufferedSerializer(BufferedSerializable):
-    serializer = msgpack.Packer().pack
-    deserializer = msgpack.Unpacker()
-    def __init__(self):
-        pass
+    """A BufferedSerializable for msgpack records. Each instance has its own `msgpack.Packer` and 
+    `msgpack.Unpacker`, so tasks never share stream state. Batches are packed into one contiguous buffer with 
+    `write_many()` and unpacked with `read_many()`.
+    """
+    packer: msgpack.Packer
+    batch_packer: msgpack.Packer
+    deserializer: msgpack.Unpacker
+    receive_buffer: bytearray
+    def __init__(self, receive_buffer_size: int = EdnaDefault.BUFFER_MAX_SIZE):
+        """Initializes the serializer.
+
+        Args:
+            receive_buffer_size (int, optional): Size of the preallocated buffer used by `read_into()`. 
+                Defaults to EdnaDefault.BUFFER_MAX_SIZE.
+        """
+        self.packer = msgpack.Packer()
+        self.batch_packer = msgpack.Packer(autoreset=False)
+        self.deserializer = msgpack.Unpacker()   # Each receiving task needs its own stream state
+        self.receive_buffer = bytearray(receive_buffer_size)
+        self.receive_view = memoryview(self.receive_buffer)
 
     def feed(self, buffered_message: bytes):
         self.deserializer.feed(buffered_message)
 
+    def read_into(self, source) -> int:
+        """Receives bytes from `source` directly into the preallocated receive buffer and feeds them to 
+        the unpacker, without creating an intermediate `bytes` object.
+
+        Args:
+            source (socket.socket): An object with a `recv_into()` method, such as a socket, or a `readinto()` 
+                method, such as a file.
+
+        Returns:
+            (int): The number of bytes received. 0 means `source` is closed.
+        """
+        if hasattr(source, "recv_into"):
+            received = source.recv_into(self.receive_view)
+        else:
+            received = source.readinto(self.receive_view)
+        if received:
+            self.deserializer.feed(self.receive_view[:received])
+        return received
+
     def next(self):
         return next(self.deserializer)
 
-    @classmethod
-    def write(cls, out_stream):
-        return cls.serializer(out_stream)
+    def read(self, in_stream: bytes):
+        return msgpack.unpackb(in_stream, raw=False)
+
+    def read_many(self, buffered_message: bytes, record_count: int = None) -> List[object]:
+        """Feeds a buffer of packed records and unpacks them.
+
+        Args:
+            buffered_message (bytes): The packed records.
+            record_count (int, optional): Number of records to unpack. Defaults to None, which unpacks every 
+                complete record that has been fed.
+
+        Returns:
+            (List[obj]): The unpacked records.
+        """
+        self.deserializer.feed(buffered_message)
+        if record_count is None:
+            return list(self.deserializer)
+        unpack = self.deserializer.unpack
+        return [unpack() for _ in range(record_count)]
+
+    def write(self, out_stream):
+        return self.packer.pack(out_stream)
 
+    def write_many(self, out_streams: List[object]) -> bytes:
+        """Packs a batch of records into one contiguous buffer.
 
+        Args:
+            out_streams (List[obj]): The records to pack.
 
+        Returns:
+            (bytes): The packed records, back to back.
+        """
+        pack = self.batch_packer.pack
+        for out_stream in out_streams:
+            pack(out_stream)
+        packed = self.batch_packer.bytes()
+        self.batch_packer.reset()
+        return packed
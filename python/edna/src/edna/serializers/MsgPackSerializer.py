@@ -1,4 +1,5 @@
 from edna.serializers import Serializable
+from typing import List
 import msgpack
 
 class MsgPackSerializer(Serializable):
@@ -28,4 +29,28 @@ class MsgPackSerializer(Serializable):
             (byte): Encoded bytes from utf-8 encoded strings
         """
         return msgpack.packb(out_stream, use_bin_type=True)
-        
\ No newline at end of file
+
+    @classmethod
+    def read_many(cls, in_streams: List[bytes]):
+        """Reads a batch of msgpack byte inputs.
+
+        Args:
+            in_streams (List[bytes]): Inputs of bytes
+
+        Returns:
+            (List[obj]): Decoded inputs
+        """
+        unpackb = msgpack.unpackb
+        return [unpackb(in_stream, raw=False) for in_stream in in_streams]
+    @classmethod
+    def write_many(cls, out_streams: List[object]):
+        """Writes a batch of inputs as msgpack byte outputs.
+
+        Args:
+            out_streams (List[obj]): Inputs to output
+
+        Returns:
+            (List[bytes]): Encoded bytes
+        """
+        packb = msgpack.packb
+        return [packb(out_stream, use_bin_type=True) for out_stream in out_streams]
\ No newline at end of file
@@ -1,4 +1,5 @@
 from edna.serializers import Serializable
+from typing import List
 import msgpack
 
 class StringSerializer(Serializable):
@@ -25,4 +26,29 @@ class StringSerializer(Serializable):
         Returns:
             (byte): Encoded bytes from utf-8 encoded strings
         """
-        return msgpack.packb(out_stream, use_bin_type=True)
\ No newline at end of file
+        return msgpack.packb(out_stream, use_bin_type=True)
+
+    @classmethod
+    def read_many(cls, in_streams: List[bytes]):
+        """Reads a batch of msgpack byte inputs.
+
+        Args:
+            in_streams (List[bytes]): Inputs of bytes
+
+        Returns:
+            (List[str]): Decoded inputs
+        """
+        unpackb = msgpack.unpackb
+        return [unpackb(in_stream, raw=False) for in_stream in in_streams]
+    @classmethod
+    def write_many(cls, out_streams: List[str]):
+        """Writes a batch of inputs as msgpack byte outputs.
+
+        Args:
+            out_streams (List[str]): Inputs to output
+
+        Returns:
+            (List[bytes]): Encoded bytes
+        """
+        packb = msgpack.packb
+        return [packb(out_stream, use_bin_type=True) for out_stream in out_streams]
\ No newline at end of file
@@ -22,7 +22,36 @@ class Serializable:
         """
         raise NotImplementedError
 
+    @classmethod
+    def read_many(cls, in_streams): 
+        """Convert a batch from bytes to Serializable. Serializers should override this with a faster batch 
+        implementation where they can. Serializers with an instance `read()` must override it.
+
+        Args:
+            in_streams (List[bytes]): Inputs of bytes to deserialize
+
+        Returns:
+            (List[obj]): The deserialized inputs, in order.
+        """
+        read = cls.read
+        return [read(in_stream) for in_stream in in_streams]
+
+    @classmethod
+    def write_many(cls, out_streams): 
+        """Convert a batch from Serializable to bytes. Serializers should override this with a faster batch 
+        implementation where they can. Serializers with an instance `write()` must override it.
+
+        Args:
+            out_streams (List[Object]): Inputs of Serializable to serialize
+
+        Returns:
+            (List[bytes]): The serialized inputs, in order.
+        """
+        write = cls.write
+        return [write(out_stream) for out_stream in out_streams]
+
 from .StringSerializer import StringSerializer
 from .KafkaStringSerializer import KafkaStringSerializer
 from .BufferedSerializable import BufferedSerializable
-from .MsgPackSerializer import MsgPackSerializer
\ No newline at end of file
+from .MsgPackSerializer import MsgPackSerializer
+from .ColumnarSerializer import ColumnarSerializer
\ No newline at end of file
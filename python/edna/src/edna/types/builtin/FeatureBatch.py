@@ -0,0 +1,28 @@
+from collections.abc import Sequence
+
+
+class FeatureBatch(Sequence):
+    """A batch of records backed by the rows of a single feature matrix, e.g. a `scipy.sparse.csr_matrix`.
+
+    Processes pass batches of records as lists. A FeatureBatch can stand in for such a list, so a matrix 
+    produced for a whole batch (e.g. by `edna.process.map.TextToFeatures`) reaches the next process 
+    without being split into rows. Processes that understand it (e.g. `edna.process.map.SklearnClassifier`) 
+    use `matrix` directly. Any other process sees a sequence of single-row matrices.
+
+    Attributes:
+        matrix (obj): The feature matrix, with one row per record.
+    """
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FeatureBatch(self.matrix[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FeatureBatch index out of range")
+        return self.matrix[index]
@@ -1,2 +1,3 @@
 from .ConfigurationVariable import ConfigurationVariable
-from .GraphNode import GraphNode
\ No newline at end of file
+from .GraphNode import GraphNode
+from .FeatureBatch import FeatureBatch
\ No newline at end of file
@@ -0,0 +1,9 @@
+import enum
+
+class ChannelType(enum.Enum):
+    """Enum to determine which transport an `edna.channel` channel between two tasks uses.
+    """
+    MEMORY = 1
+    SOCKET = 2
+    UNIX_SOCKET = 3
+    SHARED_MEMORY = 4
\ No newline at end of file
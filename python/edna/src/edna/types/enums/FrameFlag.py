@@ -0,0 +1,8 @@
+import enum
+
+class FrameFlag(enum.IntFlag):
+    """Flags in the header of an `edna.channel.BatchFrame`.
+    """
+    NONE = 0
+    END_OF_STREAM = 1
+    WATERMARK = 2
@@ -4,4 +4,6 @@ from .SingleOutputStreamGraphNodeType import SingleOutputStreamGraphNodeType
 from .SingleOutputStreamGraphNodeProcessType import SingleOutputStreamGraphNodeProcessType
 from .StreamGraphNodeType import StreamGraphNodeType
 
-from .PhysicalGraphNodeType import PhysicalGraphNodeType
\ No newline at end of file
+from .PhysicalGraphNodeType import PhysicalGraphNodeType
+from .ChannelType import ChannelType
+from .FrameFlag import FrameFlag
\ No newline at end of file
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from edna.defaults import EdnaDefault
+from edna.utils.TimerService import TimerService
+
+
+class CoarseClock:
+    """A CoarseClock is a process-wide cached `time.time()`, refreshed every `EdnaDefault.CLOCK_RESOLUTION_S` 
+    by the shared `edna.utils.TimerService`. Primitives read `CoarseClock.now` for buffer timeouts on their 
+    per-record paths instead of calling `time.time()` for every record.
+
+    The cached time lags the real time by up to the resolution (longer if the TimerService is busy), so it
+    only suits checks that tolerate late timeouts, and not measuring durations. In a forked child process,
+    the clock is refreshed by the child's TimerService (see `edna.utils.TimerService`).
+
+    Example usage:
+
+        ```
+        >> CoarseClock.start()
+        >> if CoarseClock.now - self.timer > self.timeout_s: ...
+        ```
+    """
+    now : float = time.time()
+    _started_lock = threading.Lock()
+    _handle : int = None
+
+    @staticmethod
+    def start():
+        """Starts refreshing the clock, if it is not refreshed yet. Primitives that read `now` call this on initialization."""
+        if CoarseClock._handle is not None:
+            return
+        with CoarseClock._started_lock:
+            if CoarseClock._handle is None:
+                CoarseClock.now = time.time()
+                CoarseClock._handle = TimerService.getInstance().schedule(CoarseClock.now + EdnaDefault.CLOCK_RESOLUTION_S, CoarseClock._tick)
+
+    @staticmethod
+    def _tick() -> float:
+        CoarseClock.now = time.time()
+        return CoarseClock.now + EdnaDefault.CLOCK_RESOLUTION_S
+
+    @staticmethod
+    def _reinitAfterFork():
+        # The TimerService is re-initialized first, since it was imported first, and keeps the tick scheduled
+        CoarseClock._started_lock = threading.Lock()
+        CoarseClock.now = time.time()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=CoarseClock._reinitAfterFork)
\ No newline at end of file
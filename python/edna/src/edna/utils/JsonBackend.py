@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Tuple, Union
+import functools
+import json
+
+orjson = None
+try:
+    import orjson
+except ImportError:
+    pass
+simdjson = None
+try:
+    import simdjson
+except ImportError:
+    pass
+ujson = None
+try:
+    import ujson
+except ImportError:
+    pass
+
+
+def _orjsonDumps(message: object) -> str:
+    return orjson.dumps(message).decode("utf-8")
+
+
+def _project(record: object, keys: Tuple[str]) -> object:
+    if not isinstance(record, dict):
+        return record
+    return {key: record[key] for key in keys if key in record}
+
+
+def _simdjsonValue(value: object) -> object:
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _simdjsonProject(parser: simdjson.Parser, message: Union[str, bytes], keys: Tuple[str]) -> object:
+    # Only the projected fields are converted to Python objects. The rest of the document stays in the parser.
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    document = parser.parse(message)
+    if not isinstance(document, simdjson.Object):
+        return _simdjsonValue(document)
+    projected = {}
+    for key in keys:
+        try:
+            projected[key] = _simdjsonValue(document[key])
+        except KeyError:
+            pass
+    return projected
+
+
+class JsonBackend:
+    """A JsonBackend wraps a JSON library behind a common interface. EDNA's JSON operators use it, so they
+    run on the fastest library that is installed: orjson, then simdjson, then ujson, then the standard library.
+
+    `loads()` accepts `str` as well as `bytes`, so raw payloads (e.g. from a `KafkaIngest` with an
+    `EmptyByteSerializer`) can be parsed without decoding them to UTF-8 first. Malformed JSON raises
+    a `ValueError` with every backend.
+
+    `loads_projected()` keeps only some top-level keys of each document. With simdjson, the other fields are 
+    never converted to Python objects. With the other backends the full document is parsed, but discarded 
+    right away, so downstream operators only hold on to the projected fields.
+
+    Example usage:
+
+        ```
+        >> json_backend = JsonBackend.getBackend()
+        >> json_backend.loads_many([b'{"id": 1}', '{"id": 2}'])
+        [{'id': 1}, {'id': 2}]
+        ```
+    """
+    PREFERENCE : List[str] = ["orjson", "simdjson", "ujson", "json"]
+    _backends : Dict[str, JsonBackend] = {}
+    name: str
+    def __init__(self, name: str, loads: Callable[[Union[str, bytes]], object], 
+            dumps: Callable[[object], str], dumps_bytes: Callable[[object], bytes]):
+        """Initializes the JsonBackend. Use `getBackend()` instead of calling this directly.
+
+        Args:
+            name (str): Name of the JSON library.
+            loads (Callable[[Union[str, bytes]], object]): Parses a JSON document.
+            dumps (Callable[[object], str]): Serializes an object to a JSON string.
+            dumps_bytes (Callable[[object], bytes]): Serializes an object to UTF-8 encoded JSON.
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.dumps_bytes = dumps_bytes
+
+    @staticmethod
+    def getAvailableBackends() -> List[str]:
+        """Get the names of the installed JSON libraries, in order of preference.
+
+        Returns:
+            (List[str]): The names of the installed backends.
+        """
+        installed = {"orjson": orjson, "simdjson": simdjson, "ujson": ujson, "json": json}
+        return [name for name in JsonBackend.PREFERENCE if installed[name] is not None]
+
+    @staticmethod
+    def getBackend(name: str = None) -> JsonBackend:
+        """Get a JsonBackend.
+
+        Args:
+            name (str, optional): One of "orjson", "simdjson", "ujson" or "json". Defaults to None, which 
+                selects the first installed backend in `PREFERENCE`.
+
+        Raises:
+            ValueError: If the requested backend is unknown or not installed.
+
+        Returns:
+            JsonBackend: The JsonBackend.
+        """
+        available = JsonBackend.getAvailableBackends()
+        if name is None:
+            name = available[0]
+        if name not in available:
+            raise ValueError("JSON backend '{name}' is not available. Installed backends: {available}".format(name=name, available=available))
+        if name not in JsonBackend._backends:
+            JsonBackend._backends[name] = JsonBackend._buildBackend(name)
+        return JsonBackend._backends[name]
+
+    @staticmethod
+    def _buildBackend(name: str) -> JsonBackend:
+        if name == "orjson":
+            return JsonBackend(name, orjson.loads, _orjsonDumps, orjson.dumps)
+        compact_dumps = functools.partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+        if name == "simdjson":
+            return JsonBackend(name, simdjson.loads, compact_dumps, 
+                    lambda message: compact_dumps(message).encode("utf-8"))
+        if name == "ujson":
+            return JsonBackend(name, ujson.loads, ujson.dumps, 
+                    lambda message: ujson.dumps(message).encode("utf-8"))
+        return JsonBackend(name, json.loads, compact_dumps, 
+                    lambda message: compact_dumps(message).encode("utf-8"))
+
+    def __reduce__(self):
+        # Backends wrap module functions, so they are pickled by name, e.g. to send operators to worker processes
+        return (JsonBackend.getBackend, (self.name,))
+
+    def loads_many(self, messages: List[Union[str, bytes]]) -> List[object]:
+        """Parses a batch of JSON documents.
+
+        Args:
+            messages (List[Union[str, bytes]]): The JSON documents.
+
+        Returns:
+            (List[obj]): The parsed documents, in order.
+        """
+        loads = self.loads
+        return [loads(message) for message in messages]
+
+    def loads_projected(self, message: Union[str, bytes], keys: Tuple[str]) -> object:
+        """Parses a JSON document, keeping only the provided top-level keys. Keys missing from the document
+        are skipped. Documents that are not JSON objects are returned whole.
+
+        Args:
+            message (Union[str, bytes]): The JSON document.
+            keys (Tuple[str]): The keys to keep.
+
+        Returns:
+            (obj): The projected document.
+        """
+        return self.loads_projected_many([message], keys)[0]
+
+    def loads_projected_many(self, messages: List[Union[str, bytes]], keys: Tuple[str]) -> List[object]:
+        """Parses a batch of JSON documents, keeping only the provided top-level keys of each.
+
+        Args:
+            messages (List[Union[str, bytes]]): The JSON documents.
+            keys (Tuple[str]): The keys to keep.
+
+        Returns:
+            (List[obj]): The projected documents, in order.
+        """
+        if self.name == "simdjson":
+            parser = simdjson.Parser()  # Parsers are not thread-safe, so each batch gets its own
+            return [_simdjsonProject(parser, message, keys) for message in messages]
+        loads = self.loads
+        return [_project(loads(message), keys) for message in messages]
+
+    def dumps_many(self, messages: List[object]) -> List[str]:
+        """Serializes a batch of objects to JSON strings.
+
+        Args:
+            messages (List[obj]): The objects.
+
+        Returns:
+            (List[str]): The JSON strings, in order.
+        """
+        dumps = self.dumps
+        return [dumps(message) for message in messages]
+
+    def dumps_bytes_many(self, messages: List[object]) -> List[bytes]:
+        """Serializes a batch of objects to UTF-8 encoded JSON.
+
+        Args:
+            messages (List[obj]): The objects.
+
+        Returns:
+            (List[bytes]): The encoded JSON documents, in order.
+        """
+        dumps_bytes = self.dumps_bytes
+        return [dumps_bytes(message) for message in messages]
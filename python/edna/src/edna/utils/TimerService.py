@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Callable, Dict
+import heapq
+import inspect
+import itertools
+import os
+import threading
+import time
+import warnings
+import weakref
+
+
+class TimerService:
+    """A TimerService runs timed callbacks on a single background thread. EDNA uses the shared instance
+    from `getInstance()` to flush idle `ByteBuffer`s and `BaseEmit` buffers at their deadlines, so a partial
+    batch on a quiet stream is never held longer than its timeout.
+
+    A callback is scheduled for an absolute deadline (in `time.time()` seconds). When the deadline is reached,
+    the callback is called with no arguments and returns the next deadline to call it at, or None to stop.
+    Bound methods are held with weak references, so scheduling a method does not keep its object alive.
+
+    A forked child process inherits the scheduled callbacks, but not the thread. The shared instance is 
+    re-initialized in the child, which restarts the thread, so the callbacks keep running there.
+    """
+    _instance : TimerService = None
+    _instance_lock = threading.Lock()
+    def __init__(self):
+        self.timer_heap = []        # (deadline, handle), ordered by deadline
+        self.callbacks : Dict[int, Callable] = {}   # handle -> callback, for scheduled callbacks only
+        self.handle_counter = itertools.count()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    @staticmethod
+    def getInstance() -> TimerService:
+        """Get the TimerService shared by this process.
+
+        Returns:
+            TimerService: The shared TimerService.
+        """
+        if TimerService._instance is None:
+            with TimerService._instance_lock:
+                if TimerService._instance is None:
+                    TimerService._instance = TimerService()
+        return TimerService._instance
+
+    def schedule(self, deadline: float, callback: Callable[[], float]) -> int:
+        """Schedules `callback` to be called at `deadline`.
+
+        Args:
+            deadline (float): The time to call the callback at, in `time.time()` seconds.
+            callback (Callable[[], float]): The callback. It returns the next deadline, or None to stop.
+
+        Returns:
+            (int): A handle that can be passed to `cancel()`.
+        """
+        if inspect.ismethod(callback):
+            callback = weakref.WeakMethod(callback)
+        else:
+            callback = (lambda callback: lambda: callback)(callback)
+        with self.condition:
+            handle = next(self.handle_counter)
+            self.callbacks[handle] = callback
+            heapq.heappush(self.timer_heap, (deadline, handle))
+            if self.thread is None or not self.thread.is_alive():   # Not started yet
+                self.startThread()
+            self.condition.notify()
+        return handle
+
+    def startThread(self):
+        self.thread = threading.Thread(target=self.run, name="edna-timer-service", daemon=True)
+        self.thread.start()
+
+    def reinitAfterFork(self):
+        """Re-initializes the TimerService in a forked child process. The lock may have been held by a thread 
+        of the parent, which does not exist in the child, so it is replaced, and the thread is restarted. 
+        Callbacks that were running in the parent at the time of the fork are rescheduled right away."""
+        self.condition = threading.Condition()
+        scheduled_handles = set(handle for _, handle in self.timer_heap)
+        for handle in self.callbacks:
+            if handle not in scheduled_handles:
+                heapq.heappush(self.timer_heap, (time.time(), handle))
+        self.thread = None
+        if self.callbacks:
+            self.startThread()
+
+    def cancel(self, handle: int):
+        """Cancels a scheduled callback. A callback that is currently running finishes, but is not called again.
+
+        Args:
+            handle (int): The handle returned by `schedule()`.
+        """
+        with self.condition:
+            self.callbacks.pop(handle, None)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.timer_heap:
+                    self.condition.wait()
+                deadline, handle = self.timer_heap[0]
+                wait_time = deadline - time.time()
+                if wait_time > 0:
+                    self.condition.wait(wait_time)  # Woken early if an earlier deadline is scheduled
+                    continue
+                heapq.heappop(self.timer_heap)
+                callback = self.callbacks.get(handle)
+                if callback is None:    # Cancelled
+                    continue
+                callback = callback()
+            if callback is None:    # The object of a bound method was garbage collected
+                self.cancel(handle)
+                continue
+
+            try:
+                next_deadline = callback()
+            except Exception as e:
+                warnings.warn("TimerService callback {callback} raised {error}; it will not be called again.".format(callback=callback, error=repr(e)))
+                next_deadline = None
+
+            with self.condition:
+                if next_deadline is None:
+                    self.callbacks.pop(handle, None)
+                elif handle in self.callbacks:
+                    heapq.heappush(self.timer_heap, (next_deadline, handle))
+
+
+def _reinitTimerServiceAfterFork():
+    TimerService._instance_lock = threading.Lock()
+    if TimerService._instance is not None:
+        TimerService._instance.reinitAfterFork()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinitTimerServiceAfterFork)
\ No newline at end of file
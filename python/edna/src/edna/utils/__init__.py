@@ -1 +1,4 @@
-from .NameUtils import NameUtils
\ No newline at end of file
+from .NameUtils import NameUtils
+from .TimerService import TimerService
+from .JsonBackend import JsonBackend
+from .CoarseClock import CoarseClock
\ No newline at end of file
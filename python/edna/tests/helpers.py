@@ -0,0 +1,54 @@
+"""Primitives shared by the tests."""
+import threading
+
+from edna.emit import BaseEmit
+from edna.ingest.streaming.SimulatedIngest import SimulatedIngestCallable
+
+
+class RangeCallable(SimulatedIngestCallable):
+    """Generates the records 0..count-1, then ends the stream."""
+    def __init__(self, count: int, record=lambda index: index):
+        self.count = count
+        self.record = record
+        super().__init__()
+
+    def compute_stream(self, index):
+        if index >= self.count:
+            raise StopIteration
+        return self.record(index)
+
+
+class CollectEmit(BaseEmit):
+    """Collects the written records in `records`, and each written batch in `batches`."""
+    def __init__(self, *args, **kwargs):
+        self.records = []
+        self.batches = []
+        self.write_threads = set()
+        super().__init__(*args, **kwargs)
+
+    def write(self):
+        batch = list(self.buffered_messages())
+        self.write_threads.add(threading.current_thread().name)
+        self.batches.append(batch)
+        self.records.extend(batch)
+
+
+def run_with_timeout(target, timeout: float = 30):
+    """Runs `target` on a daemon thread, so a hung job fails the test instead of blocking the run.
+
+    Returns:
+        (obj): The return value of `target`. An exception raised by `target` is re-raised.
+    """
+    outcome = {}
+    def run():
+        try:
+            outcome["result"] = target()
+        except BaseException as e:
+            outcome["error"] = e
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "{target} did not finish within {timeout}s".format(target=target, timeout=timeout)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+
+from helpers import CollectEmit, run_with_timeout
+from test_timeout_flush import wait_for
+
+
+class BlockingEmit(CollectEmit):
+    """Blocks every write until `unblock` is set."""
+    def __init__(self, *args, **kwargs):
+        self.unblock = threading.Event()
+        self.started_writes = 0
+        super().__init__(*args, **kwargs)
+
+    def write(self):
+        self.started_writes += 1
+        self.unblock.wait()
+        super().write()
+
+
+class FailingEmit(CollectEmit):
+    def write(self):
+        raise IOError("sink is down")
+
+
+def test_async_writes_run_on_the_writer_thread_in_order():
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=4, async_write=True)
+    for index in range(0, 100, 5):
+        emit(list(range(index, index + 5)))
+    emit.flush()
+    assert emit.records == list(range(100))
+    assert all(len(batch) == 4 for batch in emit.batches)
+    assert emit.write_threads == {"edna-emit-writer"}
+    assert emit.writer_thread is None
+
+
+def test_emitting_continues_while_writes_are_in_flight():
+    emit = BlockingEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=2, async_write=True, 
+                    max_inflight_writes=2, emit_buffer_timeout_ms=60000)
+    run_with_timeout(lambda: emit([1, 2, 3, 4]), timeout=5)    # Two full buffers are handed off without blocking
+    assert wait_for(lambda: emit.started_writes == 1)
+    third_buffer = threading.Thread(target=emit, args=([5, 6],), daemon=True)
+    third_buffer.start()
+    third_buffer.join(0.2)
+    assert third_buffer.is_alive()  # Blocked until a write finishes
+    emit.unblock.set()
+    third_buffer.join(5)
+    assert not third_buffer.is_alive()
+    emit.flush()
+    assert emit.batches == [[1, 2], [3, 4], [5, 6]]
+
+
+@pytest.mark.parametrize("async_write", [True, False])
+def test_write_error_is_raised_by_the_next_call(async_write):
+    emit = FailingEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=2, async_write=async_write)
+    with pytest.raises(IOError):
+        emit([1, 2])
+        assert wait_for(lambda: emit.write_error is not None)
+        emit([3])
+    emit = FailingEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=2, async_write=async_write)
+    emit([1])
+    with pytest.raises(IOError):
+        emit.flush()
+
+
+def test_invalid_inflight_writes_are_rejected():
+    with pytest.raises(ValueError):
+        CollectEmit(serializer=EmptyObjectSerializer, async_write=True, max_inflight_writes=0)
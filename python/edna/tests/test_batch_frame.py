@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+from edna.channel import SocketChannel
+from edna.channel.BatchFrame import BatchFrame, BatchFrameDecoder, BatchFrameHeader
+from edna.types.enums import FrameFlag
+
+from test_channels import read_all
+
+
+def frame(payload: bytes, record_count: int = 1) -> bytes:
+    return BatchFrame.packHeader(BatchFrameHeader(FrameFlag.NONE, record_count, len(payload))) + payload
+
+
+def test_header_round_trip():
+    header = BatchFrameHeader(FrameFlag.NONE, 3, 42, 1.5, 2.5)
+    packed = BatchFrame.packHeader(header)
+    assert len(packed) == BatchFrame.HEADER_SIZE == 28
+    unpacked = BatchFrame.unpackHeader(packed)
+    assert (unpacked.flags, unpacked.record_count, unpacked.payload_length) == (FrameFlag.NONE, 3, 42)
+    assert (unpacked.min_event_time, unpacked.max_event_time) == (1.5, 2.5)
+
+
+def test_bad_magic_is_rejected():
+    with pytest.raises(ValueError):
+        BatchFrame.unpackHeader(b"\x00" * BatchFrame.HEADER_SIZE)
+
+
+def test_header_carries_the_event_time_range():
+    records = [{"t": 3.0}, {"t": 1.0}, {"t": 2.0}]
+    header = BatchFrame.buildHeader(records, 10, event_time=lambda record: record["t"])
+    assert (header.record_count, header.min_event_time, header.max_event_time) == (3, 1.0, 3.0)
+    header = BatchFrame.buildHeader(records, 10)
+    assert math.isnan(header.min_event_time) and math.isnan(header.max_event_time)
+
+
+def test_control_frames():
+    end = BatchFrame.unpackHeader(BatchFrame.endOfStream())
+    assert end.isEndOfStream() and not end.isWatermark()
+    watermark = BatchFrame.unpackHeader(BatchFrame.watermark(7.0))
+    assert watermark.isWatermark() and watermark.max_event_time == 7.0
+
+
+def test_decoder_reassembles_frames_fed_byte_by_byte():
+    stream = frame(b"first", 1) + frame(b"", 0) + frame(b"second!", 2)
+    decoder = BatchFrameDecoder()
+    decoded = []
+    for index in range(len(stream)):
+        decoder.feed(stream[index:index + 1])
+        decoded.extend((header.record_count, bytes(payload)) for header, payload in decoder.frames())
+    assert decoded == [(1, b"first"), (0, b""), (2, b"second!")]
+    assert len(decoder.buffer) == 0
+
+
+def test_decoder_keeps_a_partial_frame():
+    stream = frame(b"complete") + frame(b"partial")
+    decoder = BatchFrameDecoder()
+    decoder.feed(stream[:-3])
+    assert [bytes(payload) for _, payload in decoder.frames()] == [b"complete"]
+    decoder.feed(stream[-3:])
+    assert [bytes(payload) for _, payload in decoder.frames()] == [b"partial"]
+
+
+def test_channel_carries_watermarks_and_ends_with_an_end_of_stream_frame():
+    channel = SocketChannel()
+    writer, reader = channel.getWriter(), channel.getReader()
+    try:
+        writer.write([1, 2, 3])
+        writer.writeWatermark(10.0)
+        writer.write([4])
+        writer.close()
+        batches = read_all(reader)
+        assert reader.readFrames(0.01) is None
+    finally:
+        reader.close()
+    assert [record for batch in batches for record in batch] == [1, 2, 3, 4]
+    assert reader.getWatermark() == 10.0
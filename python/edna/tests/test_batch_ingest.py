@@ -0,0 +1,75 @@
+import msgpack
+import pytest
+
+from edna.ingest.streaming import BaseStreamingIngest, SimulatedIngest
+from edna.ingest.streaming.BaseTwitterIngest import BaseTwitterIngest
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+from edna.serializers.MsgPackBufferedSerializable import MsgPackBufferedSerializer
+from edna.serializers.MsgPackSerializer import MsgPackSerializer
+
+from helpers import RangeCallable
+
+
+class CountingIngest(BaseStreamingIngest):
+    """Implements only `next()`, so it uses the default `next_batch()`."""
+    def __init__(self, count, *args, **kwargs):
+        self.index = -1
+        self.count = count
+        super().__init__(*args, **kwargs)
+
+    def next(self):
+        self.index += 1
+        if self.index >= self.count:
+            raise StopIteration
+        return self.index
+
+
+def test_default_next_batch_collects_records_until_exhausted():
+    ingest = CountingIngest(5, serializer=EmptyObjectSerializer)
+    assert ingest.fetch_batch(3, 10) == [0, 1, 2]
+    assert ingest.fetch_batch(3, 10) == [3, 4]
+    with pytest.raises(StopIteration):
+        ingest.fetch_batch(3, 10)
+
+
+def test_simulated_ingest_batches_a_stream_list():
+    ingest = SimulatedIngest(serializer=EmptyObjectSerializer, stream_list=list(range(5)))
+    assert ingest.fetch_batch(2, 0) == [0, 1]
+    assert ingest.fetch_batch(10, 0) == [2, 3, 4]
+    assert ingest.fetch_batch(10, 0) == []  # A list stream waits for more records instead of ending
+
+
+def test_simulated_ingest_batches_a_simulated_ingest_callable():
+    ingest = SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=RangeCallable(3))
+    assert ingest.fetch_batch(2, 0) == [0, 1]
+    assert ingest.fetch_batch(2, 0) == [2]
+    with pytest.raises(StopIteration):
+        ingest.fetch_batch(2, 0)
+
+
+def test_simulated_ingest_batches_a_plain_callable():
+    ingest = SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=lambda index: index * 10)
+    assert ingest.fetch_batch(4, 0.01) == [0, 10, 20, 30]
+    assert ingest.next() == 40
+
+
+def test_fetch_batch_deserializes_with_read_many():
+    records = [{"id": index} for index in range(4)]
+    ingest = SimulatedIngest(serializer=MsgPackSerializer, stream_list=[msgpack.packb(record) for record in records])
+    assert ingest.fetch_batch(10, 0) == records
+
+
+def test_fetch_batch_deserializes_messages_with_a_buffered_serializer():
+    records = [{"id": index} for index in range(4)]
+    ingest = SimulatedIngest(serializer=MsgPackBufferedSerializer(), stream_list=[msgpack.packb(record) for record in records])
+    assert ingest.fetch_batch(10, 0) == records
+
+
+def test_twitter_next_batch_skips_keep_alive_lines():
+    ingest = BaseTwitterIngest.__new__(BaseTwitterIngest)
+    ingest.running = True
+    ingest.response = iter([b"a", b"", b"b", b"", b"c"])
+    assert ingest.next_batch(2, 10) == [b"a", b"b"]
+    assert ingest.next_batch(2, 10) == [b"c"]
+    with pytest.raises(StopIteration):
+        ingest.next_batch(2, 10)
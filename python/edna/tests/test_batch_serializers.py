@@ -0,0 +1,52 @@
+import pytest
+
+from edna.serializers import Serializable, KafkaStringSerializer, MsgPackSerializer, StringSerializer
+from edna.serializers.EmptySerializer import EmptyObjectSerializer, EmptyStringSerializer
+
+from helpers import CollectEmit
+
+
+class UpperSerializer(Serializable):
+    """Only implements read() and write(), so it uses the default batch methods."""
+    @classmethod
+    def read(cls, in_stream):
+        return in_stream.lower()
+
+    @classmethod
+    def write(cls, out_stream):
+        return out_stream.upper()
+
+
+@pytest.mark.parametrize("serializer,records", [
+    (MsgPackSerializer, [{"n": 1}, [1, 2], "three", 4.0]),
+    (StringSerializer, ["one", "two", "three"]),
+    (KafkaStringSerializer, ["one", "two", "über"]),
+    (EmptyObjectSerializer, [{"n": 1}, object()]),
+    (EmptyStringSerializer, ["one"]),
+    (UpperSerializer, ["one", "two"]),
+])
+def test_batch_methods_match_the_single_record_methods(serializer, records):
+    written = serializer.write_many(records)
+    assert written == [serializer.write(record) for record in records]
+    assert serializer.read_many(written) == [serializer.read(item) for item in written]
+
+
+def test_empty_serializers_pass_batches_through():
+    records = [{"n": 1}]
+    assert EmptyObjectSerializer.read_many(records) is records
+    assert EmptyObjectSerializer.write_many(records) is records
+
+
+def test_emit_serializes_each_call_as_a_batch():
+    class CountingSerializer(UpperSerializer):
+        batches = []
+        @classmethod
+        def write_many(cls, out_streams):
+            cls.batches.append(len(out_streams))
+            return super().write_many(out_streams)
+
+    emit = CollectEmit(serializer=CountingSerializer, emit_buffer_batch_size=4)
+    emit(["a", "b", "c", "d", "e", "f"])
+    emit.flush()
+    assert CountingSerializer.batches == [6]
+    assert emit.batches == [["A", "B", "C", "D"], ["E", "F"]]
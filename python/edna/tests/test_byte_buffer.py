@@ -0,0 +1,84 @@
+from edna.buffer import ByteBuffer
+
+
+class ScatterGatherSocket:
+    """Records each sendmsg() call, and sends at most `max_send` bytes per call."""
+    def __init__(self, max_send: int = None):
+        self.max_send = max_send
+        self.calls = []
+        self.sent = bytearray()
+
+    def sendmsg(self, buffers):
+        data = b"".join(bytes(buffer) for buffer in buffers)
+        if self.max_send is not None:
+            data = data[:self.max_send]
+        self.calls.append(len(buffers))
+        self.sent.extend(data)
+        return len(data)
+
+
+class StreamSocket:
+    def __init__(self):
+        self.sent = bytearray()
+
+    def sendall(self, data):
+        self.sent.extend(data)
+
+
+def test_messages_are_copied_into_the_preallocated_buffer():
+    sock = ScatterGatherSocket()
+    buffer = ByteBuffer(sock, max_buffer_size=16, max_buffer_timeout=None)
+    preallocated = buffer.buffer
+    buffer.write(b"abcd")
+    buffer.write(b"efgh")
+    assert sock.sent == b""
+    assert buffer.buffer_index == 8
+    assert buffer.buffer is preallocated
+
+
+def test_overflowing_message_is_sent_with_the_buffer_in_one_call():
+    sock = ScatterGatherSocket()
+    buffer = ByteBuffer(sock, max_buffer_size=8, max_buffer_timeout=None)
+    preallocated = buffer.buffer
+    buffer.write(b"abcd")
+    buffer.write(b"0123456789")
+    assert sock.calls == [2]
+    assert sock.sent == b"abcd0123456789"
+    assert buffer.buffer_index == 0
+    assert buffer.buffer is preallocated
+
+
+def test_full_buffer_is_sent():
+    sock = ScatterGatherSocket()
+    buffer = ByteBuffer(sock, max_buffer_size=8, max_buffer_timeout=None)
+    buffer.write(b"abcd")
+    buffer.write(b"efgh")
+    assert sock.sent == b"abcdefgh"
+
+
+def test_partial_sends_are_resumed():
+    sock = ScatterGatherSocket(max_send=3)
+    buffer = ByteBuffer(sock, max_buffer_size=8, max_buffer_timeout=None)
+    buffer.write(b"abcde")
+    buffer.write(b"fghijklmno")
+    assert sock.sent == b"abcdefghijklmno"
+
+
+def test_sockets_without_sendmsg_use_sendall():
+    sock = StreamSocket()
+    buffer = ByteBuffer(sock, max_buffer_size=8, max_buffer_timeout=None)
+    buffer.write(b"abcd")
+    buffer.write(b"0123456789")
+    buffer.write(b"xy")
+    buffer.close()
+    assert sock.sent == b"abcd0123456789xy"
+
+
+def test_close_sends_the_remaining_contents():
+    sock = ScatterGatherSocket()
+    buffer = ByteBuffer(sock, max_buffer_size=64, max_buffer_timeout=None)
+    buffer.write(b"abc")
+    buffer.close()
+    assert sock.sent == b"abc"
+    buffer.close()
+    assert sock.calls == [1]
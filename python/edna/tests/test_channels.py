@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from edna.channel import MemoryChannel, SocketChannel
+from edna.core.execution.context import StreamingContext
+from edna.types.enums import ChannelType
+
+from helpers import run_with_timeout
+from test_planner import add_stream, plan
+
+
+def read_all(reader, timeout=5):
+    """Reads batches from `reader` until the writer closes the channel."""
+    batches = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        records = reader.read(0.1)
+        if records is None:
+            return batches
+        if records:
+            batches.append(records)
+    raise AssertionError("The channel was not closed within {timeout}s".format(timeout=timeout))
+
+
+def test_memory_channel_hands_over_records_without_copying():
+    channel = MemoryChannel()
+    records = [{"n": 1}, {"n": 2}]
+    channel.getWriter().write(records)
+    channel.getWriter().write([])   # Empty batches are not sent
+    channel.getWriter().close()
+    batches = read_all(channel.getReader())
+    assert len(batches) == 1
+    assert batches[0] is records
+
+
+def test_memory_channel_read_times_out_with_an_empty_batch():
+    assert MemoryChannel().getReader().read(0.01) == []
+
+
+def test_memory_channel_writer_blocks_when_full():
+    channel = MemoryChannel(max_batches=1)
+    writer, reader = channel.getWriter(), channel.getReader()
+    writer.write([1])
+    second_write = threading.Thread(target=writer.write, args=([2],), daemon=True)
+    second_write.start()
+    second_write.join(0.3)
+    assert second_write.is_alive()
+    assert reader.read(1) == [1]
+    second_write.join(5)
+    assert not second_write.is_alive()
+    assert reader.read(1) == [2]
+
+
+def test_memory_channel_writer_fails_once_the_reader_is_closed():
+    channel = MemoryChannel(max_batches=1)
+    channel.getWriter().write([1])
+    channel.getReader().close()
+    with pytest.raises(BrokenPipeError):
+        run_with_timeout(lambda: channel.getWriter().write([2]), timeout=5)
+
+
+def test_socket_channel_round_trip():
+    channel = SocketChannel()
+    writer, reader = channel.getWriter(), channel.getReader()
+    records = [{"n": index} for index in range(1000)]
+    try:
+        writer.write(records)
+        writer.close()
+        batches = read_all(reader)
+    finally:
+        reader.close()
+    assert [record for batch in batches for record in batch] == records
+
+
+def test_edges_default_to_memory_channels(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False)
+    add_stream(context)
+    physical_graph = plan(context)
+    channel_types = {physical_graph.getEdgeChannelType(source.getNodeId(), target.getNodeId())
+                        for target in physical_graph.node_list for source in physical_graph.getSourceNodes(target.getNodeId())}
+    assert channel_types == {ChannelType.MEMORY}
+
+
+@pytest.mark.parametrize("channel_type", [ChannelType.MEMORY, ChannelType.SOCKET])
+def test_channel_types_emit_the_same_records(tmp_path, channel_type):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False, channel_type=channel_type)
+    emit = add_stream(context, count=500)
+    run_with_timeout(context.execute)
+    assert emit.records == [{"n": index} for index in range(0, 500, 2)]
@@ -0,0 +1,77 @@
+import pytest
+
+from edna.channel import SocketChannel
+from edna.serializers import ColumnarSerializer
+
+from test_channels import read_all
+
+
+SCHEMA = [("id", "i8"), ("name", "U16"), ("salary", "f8")]
+ROWS = [(index, "employee {index}".format(index=index), 100. + index) for index in range(50)]
+
+def has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+BACKENDS = ["numpy", pytest.param("arrow", marks=pytest.mark.skipif(not has_pyarrow(), reason="pyarrow is not installed"))]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_tuple_round_trip(backend):
+    serializer = ColumnarSerializer(SCHEMA, backend=backend)
+    assert serializer.read_many(serializer.write_many(ROWS)) == ROWS
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dict_round_trip(backend):
+    serializer = ColumnarSerializer(SCHEMA, record_type=dict, backend=backend)
+    records = [dict(zip(("id", "name", "salary"), row)) for row in ROWS]
+    assert serializer.read_many(serializer.write_many(records)) == records
+
+
+def test_single_field_dicts():
+    serializer = ColumnarSerializer([("id", "i8")], record_type=dict, backend="numpy")
+    records = [{"id": index} for index in range(5)]
+    assert serializer.read_many(serializer.write_many(records)) == records
+
+
+def test_batches_split_across_feeds_are_decoded_in_order():
+    writer = ColumnarSerializer(SCHEMA, backend="numpy")
+    reader = ColumnarSerializer(SCHEMA, backend="numpy")
+    stream = writer.write_many(ROWS[:20]) + writer.write_many(ROWS[20:])
+    records = reader.read_many(stream[:100])
+    records += reader.read_many(stream[100:], 25)
+    records += reader.read_many(b"")
+    assert records == ROWS
+
+
+def test_read_columns_feeds_vectorized_operators():
+    serializer = ColumnarSerializer([("x", "f8"), ("y", "f8")], backend="numpy")
+    columns = serializer.read_columns(serializer.write_many([(1., 2.), (3., 4.)]))
+    assert columns["x"].tolist() == [1., 3.]
+    assert ColumnarSerializer.to_matrix(columns).tolist() == [[1., 2.], [3., 4.]]
+
+
+def test_invalid_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        ColumnarSerializer(SCHEMA, record_type=list)
+    with pytest.raises(ValueError):
+        ColumnarSerializer(SCHEMA, backend="parquet")
+
+
+def test_columnar_channel_round_trip():
+    channel = SocketChannel(in_serializer=ColumnarSerializer(SCHEMA, backend="numpy"),
+                            out_serializer=ColumnarSerializer(SCHEMA, backend="numpy"))
+    writer, reader = channel.getWriter(), channel.getReader()
+    try:
+        writer.write(ROWS[:30])
+        writer.write(ROWS[30:])
+        writer.close()
+        batches = read_all(reader)
+    finally:
+        reader.close()
+    assert [record for batch in batches for record in batch] == ROWS
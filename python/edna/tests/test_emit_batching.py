@@ -0,0 +1,108 @@
+import pytest
+
+from edna.buffer import AdaptiveBatchController
+from edna.core.factories import SQLTupleFactory
+from edna.emit import SQLEmit
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+
+from helpers import CollectEmit
+
+
+class FakeCursor:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def executemany(self, query, records):
+        self.statements.append((query, list(records)))
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+
+    def is_connected(self):
+        return True
+
+    def cursor(self):
+        return FakeCursor(self.statements)
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def sql_emit(monkeypatch):
+    monkeypatch.setattr(SQLEmit, "build_connection", lambda self: setattr(self, "conn", FakeConnection()))
+    def build(**kwargs):
+        return SQLEmit(serializer=EmptyObjectSerializer, host="localhost", database="db", user="user", password="",
+                    table="employees", tuple_factory=SQLTupleFactory(["id", "name"]), **kwargs)
+    return build
+
+
+def test_buffers_are_split_before_they_exceed_the_byte_limit():
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=100, emit_buffer_max_bytes=10, 
+                    emit_buffer_timeout_ms=60000)
+    messages = [b"aaa", b"bb", b"cccccc", b"d" * 15, b"e", b"ff", b"ggggggggg", b"h"]
+    emit(messages[:3])
+    emit(messages[3:])
+    emit.flush()
+    assert emit.records == messages
+    assert emit.batches == [[b"aaa", b"bb"], [b"cccccc"], [b"d" * 15], [b"e", b"ff"], [b"ggggggggg", b"h"]]
+
+
+def test_invalid_byte_limit_is_rejected():
+    with pytest.raises(ValueError):
+        CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_max_bytes=0)
+
+
+def test_controller_grows_additively_and_shrinks_multiplicatively():
+    controller = AdaptiveBatchController(target_latency_s=0.05, batch_size=8, timeout_s=0.1, max_batch_size=20)
+    controller.observeWrite(0.01)
+    assert (controller.batch_size, controller.timeout_s) == (10, pytest.approx(0.125))
+    for _ in range(10):
+        controller.observeWrite(0.01)
+    assert controller.batch_size == 20
+    controller.observeWrite(0.2)
+    assert (controller.batch_size, controller.timeout_s) == (10, pytest.approx(0.125))
+    for _ in range(10):
+        controller.observeWrite(0.2)
+    assert controller.batch_size == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"target_latency_s": 0}, {"min_batch_size": 10}, {"decrease_factor": 1}])
+def test_controller_rejects_invalid_arguments(kwargs):
+    arguments = dict(target_latency_s=0.05, batch_size=8, timeout_s=0.1)
+    arguments.update(kwargs)
+    with pytest.raises(ValueError):
+        AdaptiveBatchController(**arguments)
+
+
+def test_emit_batch_size_follows_the_write_latency(monkeypatch):
+    latencies = iter([0.01] * 4 + [1.0] * 2 + [0.01] * 100)
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=4, emit_buffer_timeout_ms=60000,
+                    target_write_latency_ms=50, emit_buffer_max_batch_size=64)
+    monkeypatch.setattr(emit.batch_controller, "observeWrite", 
+                    (lambda observe: lambda latency: observe(next(latencies)))(emit.batch_controller.observeWrite))
+    emit(list(range(100)))
+    emit.flush()
+    assert [len(batch) for batch in emit.batches][:6] == [4, 5, 6, 7, 8, 4]
+    assert emit.records == list(range(100))
+
+
+def test_sql_emit_counts_the_bytes_it_writes(sql_emit):
+    emit = sql_emit()
+    assert emit.message_size((1, "Jonathan")) == 16
+
+
+def test_sql_emit_with_extracted_values_counts_only_the_written_fields(sql_emit):
+    emit = sql_emit(extract_values=True, emit_buffer_max_bytes=40)
+    record = {"id": 1, "name": "Jonathan", "biography": "x" * 1000}
+    assert emit.message_size(record) == 16
+    emit([record] * 5)
+    emit.flush()
+    statements = emit.conn.statements
+    assert [len(records) for _, records in statements] == [2, 2, 1]
+    assert statements[0] == ("INSERT INTO employees (id,name) VALUES (%s,%s) ", [(1, "Jonathan"), (1, "Jonathan")])
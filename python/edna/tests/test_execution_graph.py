@@ -0,0 +1,56 @@
+import pytest
+
+from edna.api import StreamBuilder
+from edna.core.execution.context import StreamingContext
+from edna.ingest.streaming import SimulatedIngest
+from edna.process.map import Map
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+
+from helpers import CollectEmit, RangeCallable, run_with_timeout
+from test_planner import add_stream
+
+
+class FailAt(Map):
+    def __init__(self, index, *args, **kwargs):
+        self.index = index
+        super().__init__(*args, **kwargs)
+
+    def map(self, message):
+        if message == self.index:
+            raise ValueError("bad record {message}".format(message=message))
+        return message
+
+
+def add_failing_stream(context, count, fail_at):
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=8)
+    stream = StreamBuilder().build(ingest=SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=RangeCallable(count)),
+                                    streaming_context=context)
+    context.addStream(stream=stream.map(map_process=FailAt(fail_at)).emit(emit_process=emit))
+    return emit
+
+
+@pytest.mark.parametrize("enable_chaining", [True, False])
+def test_fused_and_unfused_plans_emit_the_same_records(tmp_path, enable_chaining):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=enable_chaining)
+    emits = [add_stream(context, count=500) for _ in range(2)]
+    run_with_timeout(context.execute)
+    for emit in emits:
+        assert emit.records == [{"n": index} for index in range(0, 500, 2)]
+
+
+@pytest.mark.parametrize("enable_chaining", [True, False])
+def test_task_error_is_raised_from_execute(tmp_path, enable_chaining):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=enable_chaining)
+    add_failing_stream(context, count=100000, fail_at=50)
+    with pytest.raises(ValueError, match="bad record 50"):
+        run_with_timeout(context.execute)
+    assert not context.execution_graph.isAlive()
+
+
+def test_failed_stream_stops_the_other_streams(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False)
+    add_failing_stream(context, count=100000, fail_at=50)
+    healthy = add_stream(context, count=10**9)
+    with pytest.raises(ValueError):
+        run_with_timeout(context.execute)
+    assert len(healthy.records) < 10**9 // 2
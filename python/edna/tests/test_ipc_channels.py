@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from edna.channel import SharedMemoryChannel, UnixSocketChannel
+from edna.channel.SharedMemoryChannel import SharedMemoryRingBuffer
+from edna.core.execution.context import StreamingContext
+from edna.types.enums import ChannelType
+
+from helpers import run_with_timeout
+from test_channels import read_all
+from test_planner import add_stream
+
+
+@pytest.fixture
+def ring():
+    reader = SharedMemoryRingBuffer(capacity=4096)
+    writer = SharedMemoryRingBuffer(name=reader.name)
+    yield reader, writer
+    writer.close()
+    reader.close()
+
+
+def test_ring_buffer_round_trip(ring):
+    reader, writer = ring
+    writer.sendall(b"hello")
+    assert reader.recv(0.1) == b"hello"
+    assert reader.recv(0.01) is None
+
+
+def test_ring_buffer_wraps_around_and_splits_large_frames(ring):
+    reader, writer = ring
+    received = []
+    for index in range(20):     # 20 x 3000 bytes through a 4096 byte ring
+        payload = bytes([index]) * 3000
+        writer.sendall(payload)
+        frames = []
+        while sum(len(frame) for frame in frames) < len(payload):
+            frames.append(reader.recv(1))
+        received.append(b"".join(frames))
+        assert len(frames) > 1
+    assert received == [bytes([index]) * 3000 for index in range(20)]
+
+
+def test_ring_buffer_signals_end_of_stream():
+    reader = SharedMemoryRingBuffer(capacity=4096)
+    writer = SharedMemoryRingBuffer(name=reader.name)
+    writer.sendall(b"last")
+    writer.close()
+    assert reader.recv(0.1) == b"last"
+    assert reader.recv(0.1) == b""
+    reader.close()
+
+
+def test_ring_buffer_write_times_out_when_full(ring):
+    _, writer = ring
+    writer.sendall(b"x" * 2000, timeout=0.05)
+    writer.sendall(b"x" * 2000, timeout=0.05)
+    with pytest.raises(TimeoutError):
+        writer.sendall(b"x" * 2000, timeout=0.05)
+
+
+def test_ring_buffer_writer_fails_once_the_reader_is_closed():
+    reader = SharedMemoryRingBuffer(capacity=4096)
+    writer = SharedMemoryRingBuffer(name=reader.name)
+    reader.close()
+    try:
+        with pytest.raises(BrokenPipeError):
+            run_with_timeout(lambda: [writer.sendall(b"y" * 1500) for _ in range(10)], timeout=10)
+    finally:
+        writer.close()
+
+
+def hold_ring_buffer(names):
+    reader = SharedMemoryRingBuffer(capacity=4096)
+    names.put(reader.name)
+    time.sleep(0.2)
+    os._exit(0)     # Exit without closing, as a crashed reader would
+
+
+def test_ring_buffer_writer_fails_once_the_reader_exits():
+    fork = multiprocessing.get_context("fork")
+    names = fork.Queue()
+    process = fork.Process(target=hold_ring_buffer, args=(names,))
+    process.start()
+    writer = SharedMemoryRingBuffer(name=names.get(timeout=10))
+    process.join(10)
+    try:
+        with pytest.raises(BrokenPipeError):
+            run_with_timeout(lambda: [writer.sendall(b"y" * 1500) for _ in range(10)], timeout=10)
+    finally:
+        writer.close()
+        writer.shm.unlink()
+
+
+@pytest.mark.parametrize("channel_class", [UnixSocketChannel, SharedMemoryChannel])
+def test_ipc_channel_round_trip(channel_class):
+    channel = channel_class()
+    writer, reader = channel.getWriter(), channel.getReader()
+    records = [{"n": index, "text": "x" * index} for index in range(500)]
+    try:
+        writer.write(records)
+        writer.close()
+        batches = read_all(reader)
+    finally:
+        reader.close()
+    assert [record for batch in batches for record in batch] == records
+
+
+def test_unix_socket_channel_removes_its_socket_file():
+    channel = UnixSocketChannel()
+    assert os.path.exists(channel.path)
+    channel.getWriter().close()
+    channel.getReader().close()
+    assert not os.path.exists(channel.path)
+    assert not os.path.exists(os.path.dirname(channel.path))
+
+
+@pytest.mark.parametrize("channel_type", [ChannelType.UNIX_SOCKET, ChannelType.SHARED_MEMORY])
+def test_ipc_channel_types_emit_the_same_records(tmp_path, channel_type):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False, channel_type=channel_type)
+    emit = add_stream(context, count=500)
+    run_with_timeout(context.execute)
+    assert emit.records == [{"n": index} for index in range(0, 500, 2)]
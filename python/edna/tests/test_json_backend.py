@@ -0,0 +1,65 @@
+import json
+import pickle
+
+import pytest
+
+from edna.process.filter import RobustJsonToObject
+from edna.process.map import JsonToObject, ObjectToJson
+from edna.utils import JsonBackend
+
+
+BACKENDS = JsonBackend.getAvailableBackends()
+DOCUMENTS = [{"id": 1, "text": "über", "tags": ["a", "b"]}, {"id": 2, "nested": {"x": 1.5}}]
+
+
+def test_default_backend_is_the_first_installed_one():
+    assert JsonBackend.getBackend().name == BACKENDS[0]
+    assert BACKENDS[-1] == "json"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        JsonBackend.getBackend("not-a-json-library")
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_round_trip_str_and_bytes(name):
+    backend = JsonBackend.getBackend(name)
+    encoded = backend.dumps_many(DOCUMENTS)
+    assert all(isinstance(document, str) for document in encoded)
+    assert backend.loads_many(encoded) == DOCUMENTS
+    encoded_bytes = backend.dumps_bytes_many(DOCUMENTS)
+    assert all(isinstance(document, bytes) for document in encoded_bytes)
+    assert backend.loads_many(encoded_bytes) == DOCUMENTS
+    assert [json.loads(document) for document in encoded] == DOCUMENTS
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_malformed_json_raises_value_error(name):
+    with pytest.raises(ValueError):
+        JsonBackend.getBackend(name).loads('{"id": ')
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_are_pickled_by_name(name):
+    backend = JsonBackend.getBackend(name)
+    assert pickle.loads(pickle.dumps(backend)) is backend
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_json_operators_use_the_selected_backend(name):
+    documents = [json.dumps(document) for document in DOCUMENTS]
+    parser = JsonToObject(json_backend=name)
+    assert parser.json_backend.name == name
+    assert parser.process_batch(documents) == DOCUMENTS
+    assert parser.map(documents[0].encode("utf-8")) == DOCUMENTS[0]
+    writer = ObjectToJson(json_backend=name, as_bytes=True)
+    assert [json.loads(document) for document in writer.process_batch(DOCUMENTS)] == DOCUMENTS
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_robust_parser_drops_malformed_documents(name):
+    parser = RobustJsonToObject(json_backend=name)
+    documents = [json.dumps(DOCUMENTS[0]), "{not json", json.dumps(DOCUMENTS[1])]
+    assert parser.process_batch(documents) == DOCUMENTS
+    assert parser.filter("{not json") == []
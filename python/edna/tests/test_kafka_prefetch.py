@@ -0,0 +1,106 @@
+from collections import deque
+
+import pytest
+
+confluent_kafka = pytest.importorskip("confluent_kafka")
+
+from edna.ingest.streaming import KafkaIngest
+
+
+class FakeMessage:
+    def __init__(self, value=None, error=None):
+        self._value = value
+        self._error = error
+
+    def value(self):
+        return self._value
+
+    def error(self):
+        return self._error
+
+
+class FakeConsumer:
+    """Serves the messages in `ready` to `consume()`, and the messages in `arriving` to `poll()`, one at a time."""
+    def __init__(self, ready=(), arriving=()):
+        self.ready = deque(ready)
+        self.arriving = deque(arriving)
+        self.calls = []
+
+    def consume(self, num_messages, timeout):
+        self.calls.append(("consume", num_messages, timeout))
+        return [self.ready.popleft() for _ in range(min(num_messages, len(self.ready)))]
+
+    def poll(self, timeout):
+        self.calls.append(("poll", timeout))
+        if not self.arriving:
+            return None
+        message = self.arriving.popleft()
+        self.ready.extend(self.arriving)    # The rest of the fetch arrives with it
+        self.arriving.clear()
+        return message
+
+
+def make_ingest(consumer, consume_batch_size=4, consume_timeout=0.5):
+    ingest = object.__new__(KafkaIngest)
+    ingest.consumer = consumer
+    ingest.prefetch_buffer = deque()
+    ingest.consume_batch_size = consume_batch_size
+    ingest.consume_timeout = consume_timeout
+    return ingest
+
+
+def messages(*values):
+    return [FakeMessage(value) for value in values]
+
+
+def test_ready_messages_are_prefetched_in_batches():
+    consumer = FakeConsumer(ready=messages(b"a", b"b", b"c", b"d", b"e"))
+    ingest = make_ingest(consumer)
+    assert [ingest.next() for _ in range(4)] == [b"a", b"b", b"c", b"d"]
+    assert consumer.calls == [("consume", 4, 0)]
+    assert ingest.next() == b"e"
+    assert consumer.calls == [("consume", 4, 0), ("consume", 4, 0)]
+
+
+def test_poll_waits_for_a_message_when_none_are_ready():
+    consumer = FakeConsumer(arriving=messages(b"a", b"b", b"c"))
+    ingest = make_ingest(consumer, consume_timeout=0.25)
+    assert ingest.next() == b"a"
+    assert consumer.calls == [("consume", 4, 0), ("poll", 0.25), ("consume", 4, 0)]
+    assert list(ingest.prefetch_buffer) == [b"b", b"c"]
+
+
+def test_next_batch_returns_the_prefetched_records_first():
+    consumer = FakeConsumer(ready=messages(*[bytes([index]) for index in range(4)]))
+    ingest = make_ingest(consumer)
+    assert ingest.next_batch(3, 1.0) == [b"\x00", b"\x01", b"\x02"]
+    assert ingest.next_batch(3, 1.0) == [b"\x03"]
+    assert len(consumer.calls) == 1
+
+
+def test_next_batch_is_empty_when_nothing_arrives():
+    consumer = FakeConsumer()
+    ingest = make_ingest(consumer)
+    assert ingest.next_batch(10, 0.1) == []
+    assert consumer.calls == [("consume", 4, 0), ("poll", 0.1)]
+
+
+def test_partition_eof_is_skipped_and_other_errors_are_raised():
+    end_of_partition = FakeMessage(error=confluent_kafka.KafkaError(confluent_kafka.KafkaError._PARTITION_EOF))
+    consumer = FakeConsumer(ready=[end_of_partition] + messages(b"a"))
+    ingest = make_ingest(consumer)
+    assert ingest.next() == b"a"
+
+    failure = FakeMessage(error=confluent_kafka.KafkaError(confluent_kafka.KafkaError._TRANSPORT))
+    ingest = make_ingest(FakeConsumer(ready=[failure]))
+    with pytest.raises(confluent_kafka.KafkaException):
+        ingest.next()
+
+
+def test_consumer_config_adds_only_the_set_fetch_properties():
+    ingest = object.__new__(KafkaIngest)
+    conf = {"group.id": "default-group"}
+    assert ingest.buildConsumerConfig(conf) == conf
+    assert ingest.buildConsumerConfig(conf, fetch_min_bytes=1024, fetch_wait_max_ms="50", 
+                    consumer_config={"fetch.min.bytes": 1}) == {"group.id": "default-group", "fetch.min.bytes": 1, 
+                    "fetch.wait.max.ms": 50}
@@ -0,0 +1,74 @@
+import os
+import pickle
+import time
+
+import joblib
+import numpy
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from edna.process.map import SklearnClassifier
+
+from test_timeout_flush import wait_for
+
+
+@pytest.fixture(scope="module")
+def training_data():
+    generator = numpy.random.default_rng(1)
+    features = generator.random((100, 4))
+    return features, (features[:, 0] > .5).astype(int)
+
+
+def dump_atomically(estimator, path):
+    temporary_path = path + ".tmp"
+    joblib.dump(estimator, temporary_path)
+    os.replace(temporary_path, path)
+
+
+@pytest.fixture
+def model_path(tmp_path, training_data):
+    path = str(tmp_path / "model.joblib")
+    dump_atomically(LogisticRegression().fit(*training_data), path)
+    return path
+
+
+def test_model_arrays_are_memory_mapped(model_path):
+    assert isinstance(SklearnClassifier(classifier_path=model_path).classifier.coef_, numpy.memmap)
+    assert not isinstance(SklearnClassifier(classifier_path=model_path, mmap_mode=None).classifier.coef_, numpy.memmap)
+
+
+def test_classifiers_of_the_same_file_share_the_estimator(model_path):
+    first = SklearnClassifier(classifier_path=model_path)
+    second = SklearnClassifier(classifier_path=model_path)
+    assert first.classifier is second.classifier
+
+
+def test_copies_load_the_shared_estimator(model_path):
+    classifier = SklearnClassifier(classifier_path=model_path)
+    state = pickle.dumps(classifier)
+    assert pickle.loads(state).classifier is classifier.classifier
+
+
+def test_changed_model_file_is_swapped_in(model_path, training_data):
+    features, labels = training_data
+    reloading = SklearnClassifier(classifier_path=model_path, reload_interval_ms=20)
+    static = SklearnClassifier(classifier_path=model_path)
+    original = reloading.classifier
+    dump_atomically(LogisticRegression().fit(features, 1 - labels), model_path)
+    assert wait_for(lambda: reloading.classifier is not original)
+    assert static.classifier is original
+    flipped = reloading.process_batch(list(features[:10]))
+    kept = static.process_batch(list(features[:10]))
+    assert all((flipped_label != kept_label).all() for flipped_label, kept_label in zip(flipped, kept))
+
+
+def test_unreadable_model_file_keeps_the_current_estimator(model_path):
+    classifier = SklearnClassifier(classifier_path=model_path, reload_interval_ms=20)
+    original = classifier.classifier
+    original_version = classifier.classifier_version
+    with pytest.warns(UserWarning, match="Could not reload classifier"):
+        with open(model_path + ".tmp", "wb") as model_file:
+            model_file.write(b"not a model")
+        os.replace(model_path + ".tmp", model_path)
+        assert wait_for(lambda: classifier.classifier_version != original_version)
+    assert classifier.classifier is original
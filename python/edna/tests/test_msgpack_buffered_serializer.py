@@ -0,0 +1,64 @@
+import io
+import socket
+
+from edna.serializers.MsgPackBufferedSerializable import MsgPackBufferedSerializer
+
+
+RECORDS = [{"n": index, "text": "record {index}".format(index=index)} for index in range(100)]
+
+
+def test_batch_round_trip():
+    serializer = MsgPackBufferedSerializer()
+    packed = serializer.write_many(RECORDS)
+    assert isinstance(packed, bytes)
+    assert serializer.read_many(packed, len(RECORDS)) == RECORDS
+
+
+def test_write_many_resets_between_batches():
+    serializer = MsgPackBufferedSerializer()
+    first = serializer.write_many(RECORDS[:10])
+    second = serializer.write_many(RECORDS[10:20])
+    assert serializer.read_many(second, 10) == RECORDS[10:20]
+    assert first == MsgPackBufferedSerializer().write_many(RECORDS[:10])
+
+
+def test_read_many_without_a_count_unpacks_complete_records():
+    serializer = MsgPackBufferedSerializer()
+    packed = serializer.write_many(RECORDS[:3])
+    assert serializer.read_many(packed[:-2]) == RECORDS[:2]
+    assert serializer.read_many(packed[-2:]) == RECORDS[2:3]
+
+
+def test_instances_do_not_share_stream_state():
+    first, second = MsgPackBufferedSerializer(), MsgPackBufferedSerializer()
+    packed = first.write_many(RECORDS[:2])
+    first.feed(packed[:5])
+    assert second.read_many(packed, 2) == RECORDS[:2]
+    first.feed(packed[5:])
+    assert [first.next(), first.next()] == RECORDS[:2]
+
+
+def test_single_record_round_trip():
+    serializer = MsgPackBufferedSerializer()
+    assert serializer.read(serializer.write(RECORDS[0])) == RECORDS[0]
+
+
+def test_read_into_receives_into_the_preallocated_buffer():
+    serializer = MsgPackBufferedSerializer(receive_buffer_size=64)
+    packed = MsgPackBufferedSerializer().write_many(RECORDS[:5])
+    sender, receiver = socket.socketpair()
+    try:
+        sender.sendall(packed)
+        sender.close()
+        while serializer.read_into(receiver):
+            pass
+    finally:
+        receiver.close()
+    assert serializer.read_many(b"", 5) == RECORDS[:5]
+
+
+def test_read_into_reads_files():
+    serializer = MsgPackBufferedSerializer()
+    source = io.BytesIO(serializer.write_many(RECORDS[:5]))
+    assert serializer.read_into(source) > 0
+    assert serializer.read_many(b"", 5) == RECORDS[:5]
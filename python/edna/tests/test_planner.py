@@ -0,0 +1,46 @@
+from edna.api import StreamBuilder
+from edna.core.execution.context import StreamingContext
+from edna.ingest.streaming import SimulatedIngest
+from edna.process.ChainedProcess import ChainedProcess
+from edna.process.filter import KeyedFilter
+from edna.process.map import Map
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+
+from helpers import CollectEmit, RangeCallable
+
+
+class ToRecord(Map):
+    def map(self, message):
+        return {"n": message}
+
+
+def add_stream(context, count=100):
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=8)
+    stream = StreamBuilder().build(ingest=SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=RangeCallable(count)),
+                                    streaming_context=context)
+    stream = stream.map(map_process=ToRecord()) \
+                .filter(filter_process=KeyedFilter(filter_callable=lambda value: value % 2 == 0, key="n")) \
+                .emit(emit_process=emit)
+    context.addStream(stream=stream)
+    return emit
+
+
+def plan(context):
+    context.logical_stream_graph = context.flattenStream()
+    return context.buildPhysicalGraph()
+
+
+def test_chaining_fuses_a_linear_stream_into_one_node(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=True)
+    add_stream(context)
+    physical_graph = plan(context)
+    assert len(physical_graph.node_list) == 1
+    node = physical_graph.node_list[0]
+    assert node.hasIngest() and node.hasEmit()
+    assert isinstance(node.getProcess(), ChainedProcess)
+
+
+def test_disabled_chaining_plans_one_node_per_operator(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False)
+    add_stream(context)
+    assert len(plan(context).node_list) == 4
@@ -0,0 +1,74 @@
+from edna.process import BaseProcess
+from edna.process.ChainedProcess import ChainedProcess
+from edna.process.filter import KeyedFilter
+from edna.process.map import Map
+
+
+class Increment(Map):
+    def map(self, message):
+        return message + 1
+
+
+class Duplicate(BaseProcess):
+    """A 1-to-N process."""
+    def process(self, message):
+        return [message, message]
+
+
+class HoldBack(BaseProcess):
+    """Holds back every record until it is flushed."""
+    def __init__(self, *args, **kwargs):
+        self.held = []
+        super().__init__(*args, **kwargs)
+
+    def process_batch(self, records):
+        self.held.extend(records)
+        return []
+
+    def release_batch(self, expired_only=False):
+        if expired_only:
+            return []
+        held, self.held = self.held, []
+        return held
+
+
+def test_base_process_is_identity():
+    assert BaseProcess()([1, 2, 3]) == [1, 2, 3]
+
+
+def test_map_processes_a_batch():
+    assert Increment()([1, 2, 3]) == [2, 3, 4]
+
+
+def test_one_to_many_process_concatenates_outputs():
+    assert Duplicate()([1, 2]) == [1, 1, 2, 2]
+
+
+def test_keyed_filter_processes_a_batch():
+    keyed_filter = KeyedFilter(filter_callable=lambda value: value % 2 == 0, key="n")
+    assert keyed_filter([{"n": 1}, {"n": 2}, {"n": 4}]) == [{"n": 2}, {"n": 4}]
+
+
+def test_functional_chaining_applies_inner_process_first():
+    chained = Increment(process=Duplicate())
+    assert chained([1, 2]) == [2, 2, 3, 3]
+
+
+def test_chained_process_applies_inner_process_first():
+    chained = ChainedProcess(outer_process=Duplicate(), inner_process=Increment())
+    assert chained([1, 2]) == [2, 2, 3, 3]
+
+
+def test_flush_releases_held_back_records_through_outer_processes():
+    hold_back = HoldBack()
+    chained = ChainedProcess(outer_process=Increment(), inner_process=hold_back)
+    assert chained([1, 2]) == []
+    assert chained.flush(expired_only=True) == []
+    assert chained.flush() == [2, 3]
+    assert chained.flush() == []
+
+
+def test_flush_of_functionally_chained_process():
+    process = Increment(process=HoldBack())
+    assert process([5]) == []
+    assert process.flush() == [6]
@@ -0,0 +1,70 @@
+import os
+import random
+import time
+
+import pytest
+
+from edna.core.execution.context import SimpleStreamingContext
+from edna.process.map import Map
+
+from helpers import RangeCallable, run_with_timeout
+from test_process_batch import HoldBack
+from test_simple_streaming_context import Double, build_context
+
+
+class SlowTag(Map):
+    """Tags each record with the worker's pid, after a random delay per batch so batches finish out of order."""
+    def process_batch(self, records):
+        time.sleep(random.uniform(0, 0.02))
+        return super().process_batch(records)
+
+    def map(self, message):
+        return (message, os.getpid())
+
+
+class FailAt(Map):
+    def map(self, message):
+        if message == 50:
+            raise ValueError("bad record")
+        return message
+
+
+def test_workers_emit_batches_in_ingest_order(tmp_path):
+    context, emit = build_context(tmp_path, RangeCallable(500), process=SlowTag(),
+                        ingest_batch_size=10, process_workers=2)
+    run_with_timeout(context.execute, timeout=60)
+    assert [record for record, _ in emit.records] == list(range(500))
+    assert os.getpid() not in {pid for _, pid in emit.records}
+
+
+def test_unordered_workers_emit_every_record(tmp_path):
+    context, emit = build_context(tmp_path, RangeCallable(500), process=SlowTag(),
+                        ingest_batch_size=10, process_workers=2, process_ordered=False, process_max_inflight=8)
+    run_with_timeout(context.execute, timeout=60)
+    assert sorted(record for record, _ in emit.records) == list(range(500))
+
+
+def test_workers_release_held_back_records(tmp_path):
+    context, emit = build_context(tmp_path, RangeCallable(100), process=HoldBack(),
+                        ingest_batch_size=7, process_workers=2)
+    run_with_timeout(context.execute, timeout=60)
+    assert sorted(emit.records) == list(range(100))
+
+
+def test_worker_error_is_raised_from_execute(tmp_path):
+    context, _ = build_context(tmp_path, RangeCallable(100), process=FailAt(),
+                        ingest_batch_size=10, process_workers=2)
+    with pytest.raises(ValueError, match="bad record"):
+        run_with_timeout(context.execute, timeout=60)
+
+
+def test_workers_match_the_single_threaded_output(tmp_path):
+    context, emit = build_context(tmp_path, RangeCallable(300), process=Double(), ingest_batch_size=16, process_workers=3)
+    run_with_timeout(context.execute, timeout=60)
+    assert emit.records == [index * 2 for index in range(300)]
+
+
+@pytest.mark.parametrize("kwargs", [{"process_workers": 0}, {"process_workers": 2, "process_max_inflight": 0}])
+def test_invalid_worker_arguments_are_rejected(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        SimpleStreamingContext(dir=str(tmp_path), **kwargs)
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from edna.api import StreamBuilder
+from edna.core.execution.context import StreamingContext
+from edna.core.factories import SQLTupleFactory
+from edna.ingest.streaming import SimulatedIngest
+from edna.process.filter import KeyedFilter, RobustJsonToObject
+from edna.process.map import JsonToObject, ObjectToSQL
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+from edna.utils import JsonBackend
+
+from helpers import CollectEmit, RangeCallable, run_with_timeout
+from test_planner import plan
+
+
+def document(index):
+    return json.dumps({"id": index, "lang": "en" if index % 2 else "fr", "user": {"n": "x"}, "big": list(range(10))})
+
+
+class CustomValuesFactory(SQLTupleFactory):
+    def getValues(self, record):
+        return (record["id"], record["big"][0])
+
+
+def add_sql_stream(context, parser, tuple_factory=None):
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=16)
+    ingest = SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=RangeCallable(100, record=document))
+    stream = StreamBuilder().build(ingest=ingest, streaming_context=context) \
+                .map(map_process=parser) \
+                .filter(filter_process=KeyedFilter(filter_callable=lambda lang: lang == "en", key="lang")) \
+                .map(map_process=ObjectToSQL(tuple_factory=tuple_factory or SQLTupleFactory(["id", "user"]))) \
+                .emit(emit_process=emit)
+    context.addStream(stream=stream)
+    return emit
+
+
+def planned_parsers(physical_graph):
+    return [process for node in physical_graph.node_list for process in node.getProcessList()
+                if isinstance(process, (JsonToObject, RobustJsonToObject))]
+
+
+def test_projection_is_disabled_by_default(tmp_path):
+    context = StreamingContext(dir=str(tmp_path))
+    parser = JsonToObject()
+    add_sql_stream(context, parser)
+    assert not context.isProjectionEnabled()
+    assert [planned.getProjection() for planned in planned_parsers(plan(context))] == [None]
+
+
+@pytest.mark.parametrize("parser_class", [JsonToObject, RobustJsonToObject])
+def test_projection_is_set_on_a_plan_owned_copy(tmp_path, parser_class):
+    context = StreamingContext(dir=str(tmp_path), enable_projection=True)
+    parser = parser_class()
+    add_sql_stream(context, parser)
+    planned, = planned_parsers(plan(context))
+    assert planned is not parser
+    assert planned.getProjection() == ("lang", "id", "user")
+    assert parser.getProjection() is None
+
+
+@pytest.mark.parametrize("enable_projection", [True, False])
+def test_projected_and_full_parsing_emit_the_same_records(tmp_path, enable_projection):
+    context = StreamingContext(dir=str(tmp_path), enable_projection=enable_projection)
+    emit = add_sql_stream(context, JsonToObject())
+    run_with_timeout(context.execute)
+    assert emit.records == [(index, {"n": "x"}) for index in range(1, 100, 2)]
+
+
+def test_explicit_projection_is_kept(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_projection=True)
+    parser = JsonToObject(projection=["id", "lang", "user", "big"])
+    add_sql_stream(context, parser)
+    assert planned_parsers(plan(context)) == [parser]
+
+
+def test_records_reaching_an_emit_are_parsed_in_full(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_projection=True)
+    emit = CollectEmit(serializer=EmptyObjectSerializer)
+    ingest = SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=RangeCallable(10, record=document))
+    stream = StreamBuilder().build(ingest=ingest, streaming_context=context) \
+                .map(map_process=JsonToObject()) \
+                .filter(filter_process=KeyedFilter(filter_callable=lambda lang: True, key="lang")) \
+                .emit(emit_process=emit)
+    context.addStream(stream=stream)
+    assert [planned.getProjection() for planned in planned_parsers(plan(context))] == [None]
+
+
+def test_custom_get_values_disables_projection(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_projection=True)
+    add_sql_stream(context, JsonToObject(), tuple_factory=CustomValuesFactory(["id"]))
+    assert [planned.getProjection() for planned in planned_parsers(plan(context))] == [None]
+
+
+@pytest.mark.parametrize("name", JsonBackend.getAvailableBackends())
+def test_projected_loads_keep_only_the_requested_keys(name):
+    backend = JsonBackend.getBackend(name)
+    assert backend.loads_projected(document(1), ("id", "missing")) == {"id": 1}
+    assert backend.loads_projected_many(["[1, 2]", document(2)], ("lang",)) == [[1, 2], {"lang": "fr"}]
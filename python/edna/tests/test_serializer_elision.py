@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from edna.api import StreamBuilder
+from edna.core.execution.context import StreamingContext
+from edna.core.plans.executiongraph.ExecutionGraphBuilder import ExecutionGraphBuilder
+from edna.ingest.streaming import SimulatedIngest
+from edna.process.map import JsonToObject, Map
+from edna.serializers import ColumnarSerializer, MsgPackSerializer
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+from edna.serializers.MsgPackBufferedSerializable import MsgPackBufferedSerializer
+from edna.types.enums import ChannelType
+
+from helpers import CollectEmit, RangeCallable, run_with_timeout
+from test_planner import plan
+
+
+class ToRow(Map):
+    def map(self, message):
+        return (message["n"], float(message["n"]))
+
+
+def add_json_stream(context, count, parser, row=None):
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=16)
+    ingest = SimulatedIngest(serializer=EmptyObjectSerializer, 
+                stream_callback=RangeCallable(count, record=lambda index: json.dumps({"n": index, "pad": "x"})))
+    stream = StreamBuilder().build(ingest=ingest, streaming_context=context).map(map_process=parser)
+    if row is not None:
+        stream = stream.map(map_process=row)
+    context.addStream(stream=stream.emit(emit_process=emit))
+    return emit
+
+
+def edge_channels(context):
+    physical_graph = plan(context)
+    nodes = physical_graph.node_list
+    return physical_graph, [(source, target) for target in nodes for source in physical_graph.getSourceNodes(target.getNodeId())]
+
+
+def test_fused_processes_pass_records_through(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=True)
+    parser = JsonToObject(serializer=MsgPackBufferedSerializer())
+    add_json_stream(context, 10, parser)
+    plan(context)
+    assert parser.in_serializer is EmptyObjectSerializer
+    assert parser.out_serializer is EmptyObjectSerializer
+
+
+def test_memory_edges_pass_records_through(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False)
+    parser = JsonToObject(serializer=MsgPackBufferedSerializer())
+    add_json_stream(context, 10, parser)
+    plan(context)
+    assert parser.in_serializer is EmptyObjectSerializer
+    assert parser.out_serializer is EmptyObjectSerializer
+
+
+def test_byte_edges_keep_the_process_serializers(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False, channel_type=ChannelType.SOCKET)
+    serializer = MsgPackBufferedSerializer()
+    parser = JsonToObject(serializer=serializer)
+    add_json_stream(context, 10, parser)
+    plan(context)
+    assert parser.in_serializer is serializer
+    assert parser.out_serializer is serializer
+
+
+def test_record_serializers_are_not_wired_into_byte_channels(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False, channel_type=ChannelType.SOCKET)
+    add_json_stream(context, 10, JsonToObject(serializer=MsgPackSerializer))
+    physical_graph, edges = edge_channels(context)
+    for source, target in edges:
+        channel = ExecutionGraphBuilder._buildChannel(physical_graph, source, target)
+        try:
+            assert isinstance(channel.getWriter().out_serializer, MsgPackBufferedSerializer)
+            assert isinstance(channel.getReader().in_serializer, MsgPackBufferedSerializer)
+        finally:
+            channel.getWriter().close()
+            channel.getReader().close()
+
+
+@pytest.mark.parametrize("channel_type", [ChannelType.SOCKET, ChannelType.SHARED_MEMORY])
+def test_record_serializer_on_a_byte_channel_delivers_every_record(tmp_path, channel_type):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False, channel_type=channel_type)
+    emit = add_json_stream(context, 200, JsonToObject(serializer=MsgPackSerializer))
+    run_with_timeout(context.execute)
+    assert emit.records == [{"n": index, "pad": "x"} for index in range(200)]
+
+
+def test_buffered_process_serializer_sets_the_wire_format(tmp_path):
+    context = StreamingContext(dir=str(tmp_path), enable_chaining=False, channel_type=ChannelType.SOCKET)
+    row = ToRow(out_serializer=ColumnarSerializer([("n", "i8"), ("value", "f8")], backend="numpy"))
+    emit = add_json_stream(context, 200, JsonToObject(), row=row)
+    run_with_timeout(context.execute)
+    assert emit.records == [(index, float(index)) for index in range(200)]
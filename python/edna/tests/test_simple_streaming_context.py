@@ -0,0 +1,49 @@
+import pytest
+
+from edna.core.execution.context import SimpleStreamingContext
+from edna.ingest.streaming import SimulatedIngest
+from edna.process import BaseProcess
+from edna.process.map import Map
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+
+from helpers import CollectEmit, RangeCallable, run_with_timeout
+
+
+class Double(Map):
+    def map(self, message):
+        return message * 2
+
+
+class FailingIngestCallable(RangeCallable):
+    def compute_stream(self, index):
+        if index == 5:
+            raise RuntimeError("ingest failed")
+        return index
+
+
+def build_context(tmp_path, ingest_callable, process=None, **context_kwargs):
+    context = SimpleStreamingContext(dir=str(tmp_path), **context_kwargs)
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=16)
+    context.addIngest(SimulatedIngest(serializer=EmptyObjectSerializer, stream_callback=ingest_callable))
+    context.addProcess(process if process is not None else BaseProcess())
+    context.addEmit(emit)
+    return context, emit
+
+
+@pytest.mark.parametrize("prefetch_depth", [1, 4])
+def test_prefetched_batches_are_processed_in_order(tmp_path, prefetch_depth):
+    context, emit = build_context(tmp_path, RangeCallable(1000), process=Double(),
+                        ingest_prefetch_depth=prefetch_depth, ingest_batch_size=7)
+    run_with_timeout(context.execute)
+    assert emit.records == [index * 2 for index in range(1000)]
+
+
+def test_ingest_error_is_raised_from_execute(tmp_path):
+    context, _ = build_context(tmp_path, FailingIngestCallable(100), ingest_batch_size=1)
+    with pytest.raises(RuntimeError, match="ingest failed"):
+        run_with_timeout(context.execute)
+
+
+def test_invalid_prefetch_depth_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SimpleStreamingContext(dir=str(tmp_path), ingest_prefetch_depth=0)
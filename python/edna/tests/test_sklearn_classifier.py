@@ -0,0 +1,90 @@
+import time
+
+import joblib
+import numpy
+import pytest
+import scipy.sparse
+from sklearn.linear_model import LogisticRegression
+
+from edna.process.map import SklearnClassifier
+
+
+@pytest.fixture(scope="module")
+def features():
+    generator = numpy.random.default_rng(0)
+    return generator.random((60, 4))
+
+
+@pytest.fixture(scope="module")
+def estimator(features):
+    return LogisticRegression().fit(features, (features[:, 0] > .5).astype(int))
+
+
+@pytest.fixture
+def model_path(tmp_path, estimator):
+    path = tmp_path / "model.joblib"
+    joblib.dump(estimator, path)
+    return str(path)
+
+
+def assert_predictions_equal(predictions, expected):
+    assert len(predictions) == len(expected)
+    for prediction, expected_prediction in zip(predictions, expected):
+        assert prediction.shape == expected_prediction.shape
+        numpy.testing.assert_allclose(prediction, expected_prediction)
+
+
+@pytest.mark.parametrize("predict_proba", [False, True])
+def test_map_returns_the_estimator_output_for_one_sample(model_path, estimator, features, predict_proba):
+    classifier = SklearnClassifier(classifier_path=model_path, predict_proba=predict_proba)
+    expected = (estimator.predict_proba if predict_proba else estimator.predict)(features[:1])
+    prediction = classifier.map(features[:1])
+    assert prediction.shape == expected.shape
+    numpy.testing.assert_array_equal(prediction, expected)
+    numpy.testing.assert_array_equal(classifier.map(features[0]), expected)
+
+
+@pytest.mark.parametrize("predict_proba", [False, True])
+def test_batches_return_the_same_predictions_as_map(model_path, features, predict_proba):
+    classifier = SklearnClassifier(classifier_path=model_path, predict_proba=predict_proba)
+    records = list(features[:10])
+    assert_predictions_equal(classifier.process_batch(records), [classifier.map(record) for record in records])
+
+
+def test_sparse_records(model_path, features):
+    classifier = SklearnClassifier(classifier_path=model_path)
+    records = [scipy.sparse.csr_matrix(features[index:index + 1]) for index in range(5)]
+    assert_predictions_equal(classifier.process_batch(records), [classifier.map(features[index]) for index in range(5)])
+
+
+def test_multi_row_records_are_rejected(model_path, features):
+    classifier = SklearnClassifier(classifier_path=model_path)
+    with pytest.raises(ValueError):
+        classifier.process_batch([features[:2]])
+
+
+def test_records_are_held_back_until_a_batch_fills(model_path, features):
+    classifier = SklearnClassifier(classifier_path=model_path, max_batch_size=8, max_batch_wait_ms=10000)
+    records = list(features[:20])
+    assert classifier.process_batch(records[:5]) == []
+    predictions = classifier.process_batch(records[5:20])
+    assert len(predictions) == 16
+    assert len(classifier.pending_records) == 4
+    predictions += classifier.flush()
+    assert_predictions_equal(predictions, [classifier.map(record) for record in records])
+
+
+def test_held_back_records_are_released_after_the_wait(model_path, features):
+    classifier = SklearnClassifier(classifier_path=model_path, max_batch_size=8, max_batch_wait_ms=20)
+    assert classifier.process_batch(list(features[:3])) == []
+    assert classifier.flush(expired_only=True) == []
+    time.sleep(0.05)
+    assert len(classifier.flush(expired_only=True)) == 3
+    assert classifier.pending_records == []
+
+
+def test_invalid_arguments_are_rejected(model_path):
+    with pytest.raises(ValueError):
+        SklearnClassifier()
+    with pytest.raises(ValueError):
+        SklearnClassifier(classifier_path=model_path, max_batch_size=0)
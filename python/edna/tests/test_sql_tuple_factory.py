@@ -0,0 +1,44 @@
+import pytest
+
+from edna.core.factories import SQLTupleFactory
+from edna.process.map import ObjectToSQL
+
+
+RECORDS = [{"id": index, "name": "employee {index}".format(index=index), "salary": 100 + index} for index in range(5)]
+
+
+class FirstFieldFactory(SQLTupleFactory):
+    """Overrides getValues() to hardcode its object model."""
+    def getValues(self, message):
+        return (message["id"],)
+
+
+@pytest.mark.parametrize("fields", [[], ["id"], ["id", "name"], ["name", "salary", "id"]])
+def test_compiled_getter_returns_a_tuple_in_field_order(fields):
+    factory = SQLTupleFactory(fields)
+    for record in RECORDS:
+        assert factory.getValues(record) == tuple(record[field] for field in fields)
+    assert factory.getValuesMany(RECORDS) == [tuple(record[field] for field in fields) for record in RECORDS]
+
+
+def test_missing_field_raises_key_error():
+    with pytest.raises(KeyError):
+        SQLTupleFactory(["id", "missing"]).getValues(RECORDS[0])
+
+
+def test_get_values_many_uses_an_overridden_get_values():
+    factory = FirstFieldFactory(["id", "name"])
+    assert factory.getValuesMany(RECORDS) == [(record["id"],) for record in RECORDS]
+
+
+def test_upsert_fields():
+    factory = SQLTupleFactory(["id", "name"], upsert_fields=["name"])
+    assert (factory.getFields(), factory.getFieldCount()) == (("id", "name"), 2)
+    assert (factory.getUpsert(), factory.getUpsertCount()) == (("name",), 1)
+    assert (SQLTupleFactory(["id"]).getUpsert(), SQLTupleFactory(["id"]).getUpsertCount()) == (None, 0)
+
+
+def test_object_to_sql_batches_through_the_factory():
+    process = ObjectToSQL(tuple_factory=SQLTupleFactory(["salary", "id"]))
+    assert process.process_batch(RECORDS) == [(record["salary"], record["id"]) for record in RECORDS]
+    assert process.map(RECORDS[0]) == (100, 0)
@@ -0,0 +1,86 @@
+import joblib
+import numpy
+import pytest
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from edna.process.ChainedProcess import ChainedProcess
+from edna.process.map import SklearnClassifier, TextToFeatures
+from edna.types.builtin import FeatureBatch
+
+
+TEXTS = ["the quick brown fox", "jumps over", "the lazy dog", "the quick brown fox", "", "jumps over"]
+PARAMS = {"n_features": 2**10}
+
+
+class CountingVectorizer(HashingVectorizer):
+    texts_transformed = 0
+    def transform(self, X):
+        CountingVectorizer.texts_transformed += len(X)
+        return super().transform(X)
+
+
+def expected_matrix(texts):
+    return HashingVectorizer(**PARAMS).transform(texts).toarray()
+
+
+@pytest.mark.parametrize("cache_size", [None, 2, 100])
+def test_batch_rows_match_the_vectorizer(cache_size):
+    process = TextToFeatures(vectorizer_params=PARAMS, cache_size=cache_size)
+    for _ in range(2):
+        batch = process.process_batch(TEXTS)
+        assert isinstance(batch, FeatureBatch)
+        assert len(batch) == len(TEXTS)
+        numpy.testing.assert_array_equal(batch.matrix.toarray(), expected_matrix(TEXTS))
+
+
+def test_records_are_read_from_the_text_key():
+    process = TextToFeatures(text_key="text", vectorizer_params=PARAMS)
+    batch = process.process_batch([{"text": text} for text in TEXTS])
+    numpy.testing.assert_array_equal(batch.matrix.toarray(), expected_matrix(TEXTS))
+    assert process.getReferencedFields() == ("text",)
+    numpy.testing.assert_array_equal(process.map({"text": TEXTS[0]}).toarray(), expected_matrix(TEXTS[:1]))
+
+
+def test_repeated_and_cached_texts_are_vectorized_once():
+    process = TextToFeatures(vectorizer_params=PARAMS, cache_size=10)
+    process.vectorizer = CountingVectorizer(**PARAMS)
+    CountingVectorizer.texts_transformed = 0
+    process.process_batch(TEXTS)
+    assert CountingVectorizer.texts_transformed == 4
+    process.process_batch(TEXTS[:3])
+    assert CountingVectorizer.texts_transformed == 4
+
+
+def test_cache_keeps_the_most_recent_texts():
+    process = TextToFeatures(vectorizer_params=PARAMS, cache_size=2)
+    process.process_batch(["a b", "c d", "e f"])
+    assert list(process.feature_cache) == ["c d", "e f"]
+    process.process_batch(["c d", "g h"])
+    assert list(process.feature_cache) == ["c d", "g h"]
+
+
+def test_invalid_cache_size_is_rejected():
+    with pytest.raises(ValueError):
+        TextToFeatures(cache_size=0)
+
+
+def test_feature_batch_behaves_like_a_list_of_rows():
+    batch = TextToFeatures(vectorizer_params=PARAMS).process_batch(TEXTS)
+    numpy.testing.assert_array_equal(batch[-1].toarray(), expected_matrix(TEXTS[-1:]))
+    assert len(batch[1:3]) == 2
+    with pytest.raises(IndexError):
+        batch[len(TEXTS)]
+
+
+def test_classifier_classifies_the_feature_batch_directly(tmp_path):
+    labeled = [("good great fine", 1), ("bad awful poor", 0)] * 10
+    vectorizer = HashingVectorizer(**PARAMS)
+    model_path = str(tmp_path / "model.joblib")
+    joblib.dump(LogisticRegression().fit(vectorizer.transform([text for text, _ in labeled]), [label for _, label in labeled]), model_path)
+    classifier = SklearnClassifier(classifier_path=model_path)
+    chained = ChainedProcess(outer_process=classifier, inner_process=TextToFeatures(vectorizer_params=PARAMS))
+    texts = ["great and fine", "awful, bad", "good"]
+    predictions = chained(texts)
+    assert [prediction.tolist() for prediction in predictions] == [[1], [0], [1]]
+    assert [classifier.map(vectorizer.transform([text])).tolist() for text in texts] == [[1], [0], [1]]
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from edna.buffer import ByteBuffer
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+from edna.utils import TimerService
+
+from helpers import CollectEmit
+from test_byte_buffer import StreamSocket
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class SlowEmit(CollectEmit):
+    def write(self):
+        time.sleep(0.3)
+        super().write()
+
+
+def test_idle_byte_buffer_is_sent_by_the_timer():
+    sock = StreamSocket()
+    buffer = ByteBuffer(sock, max_buffer_size=1024, max_buffer_timeout=0.05)
+    buffer.write(b"abc")
+    assert wait_for(lambda: sock.sent == b"abc")
+    buffer.close()
+
+
+def test_byte_buffer_close_cancels_the_timeout():
+    buffer = ByteBuffer(StreamSocket(), max_buffer_size=1024, max_buffer_timeout=0.05)
+    handle = buffer.timer_handle
+    assert handle in TimerService.getInstance().callbacks
+    buffer.close()
+    assert handle not in TimerService.getInstance().callbacks
+
+
+def test_idle_emit_buffer_is_written_off_the_timer_thread():
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=100, emit_buffer_timeout_ms=50)
+    emit([1, 2])
+    assert wait_for(lambda: emit.records == [1, 2])
+    assert emit.write_threads == {"edna-emit-writer"}
+    emit.flush()
+
+
+def test_slow_timed_write_does_not_stall_the_timer():
+    emit = SlowEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=3, emit_buffer_timeout_ms=50)
+    emit([1])
+    fired = threading.Event()
+    fired_at = []
+    start = time.time()
+    TimerService.getInstance().schedule(start + 0.15, lambda: fired_at.append(time.time()) or fired.set())
+    time.sleep(0.1)
+    emit([2, 3, 4])     # Fills the buffer while the timed-out buffer is being written
+    emit([5])
+    assert fired.wait(5)
+    assert fired_at[0] - start < 0.3     # Not held up by the 0.3s write
+    emit.flush()
+    assert emit.records == [1, 2, 3, 4, 5]
+
+
+def test_flush_cancels_the_emit_timeout():
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=100, emit_buffer_timeout_ms=50)
+    handle = emit.timer_handle
+    assert handle in TimerService.getInstance().callbacks
+    emit([1])
+    emit.flush()
+    assert handle not in TimerService.getInstance().callbacks
+    assert emit.timer_handle is None
+    assert emit.records == [1]
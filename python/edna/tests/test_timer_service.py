@@ -0,0 +1,125 @@
+import gc
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from edna.serializers.EmptySerializer import EmptyObjectSerializer
+from edna.utils import CoarseClock, TimerService
+
+from helpers import CollectEmit
+
+
+class Ticker:
+    def __init__(self, times: int):
+        self.times = times
+        self.calls = 0
+        self.done = threading.Event()
+
+    def tick(self):
+        self.calls += 1
+        if self.calls == self.times:
+            self.done.set()
+            return None
+        return time.time() + 0.01
+
+
+@pytest.fixture
+def timer_service():
+    return TimerService()
+
+
+def test_callback_is_rescheduled_until_it_returns_none(timer_service):
+    ticker = Ticker(3)
+    handle = timer_service.schedule(time.time(), ticker.tick)
+    assert ticker.done.wait(5)
+    time.sleep(0.05)
+    assert ticker.calls == 3
+    assert handle not in timer_service.callbacks
+
+
+def test_earlier_deadline_runs_first(timer_service):
+    order = []
+    done = threading.Event()
+    timer_service.schedule(time.time() + 0.2, lambda: order.append("late") or done.set())
+    timer_service.schedule(time.time() + 0.05, lambda: order.append("early"))
+    assert done.wait(5)
+    assert order == ["early", "late"]
+
+
+def test_cancelled_callback_is_not_called(timer_service):
+    called = threading.Event()
+    handle = timer_service.schedule(time.time() + 0.1, called.set)
+    timer_service.cancel(handle)
+    assert not called.wait(0.3)
+    assert handle not in timer_service.callbacks
+
+
+def test_scheduled_method_does_not_keep_its_object_alive(timer_service):
+    ticker = Ticker(1000)
+    handle = timer_service.schedule(time.time() + 0.1, ticker.tick)
+    del ticker
+    gc.collect()
+    deadline = time.time() + 5
+    while handle in timer_service.callbacks and time.time() < deadline:
+        time.sleep(0.01)
+    assert handle not in timer_service.callbacks
+
+
+def test_failing_callback_is_reported_and_dropped(timer_service):
+    def fail():
+        raise RuntimeError("boom")
+    with pytest.warns(UserWarning, match="boom"):
+        handle = timer_service.schedule(time.time(), fail)
+        deadline = time.time() + 5
+        while handle in timer_service.callbacks and time.time() < deadline:
+            time.sleep(0.01)
+    assert handle not in timer_service.callbacks
+
+
+def test_coarse_clock_is_refreshed():
+    CoarseClock.start()
+    start = CoarseClock.now
+    time.sleep(0.2)
+    assert CoarseClock.now > start
+    assert abs(CoarseClock.now - time.time()) < 0.5
+
+
+@pytest.mark.parametrize("async_write, ring_size", [(False, 2), (True, 3)])
+def test_emit_buffers_are_reused(async_write, ring_size):
+    emit = CollectEmit(serializer=EmptyObjectSerializer, emit_buffer_batch_size=4, async_write=async_write, max_inflight_writes=2)
+    ring = list(emit.emit_buffer_ring)
+    assert len(ring) == ring_size
+    for start in range(0, 40, 5):
+        emit(list(range(start, start + 5)))
+        emit.flush()
+    assert emit.records == list(range(40))
+    assert all(buffer is original for buffer, original in zip(emit.emit_buffer_ring, ring))
+    assert len(emit.emit_buffer_ring) == ring_size
+    assert emit.emit_buffer in ring
+
+
+def report_timers_in_child(fired: threading.Event, results):
+    clock_start = CoarseClock.now
+    fired_in_child = fired.wait(5)
+    time.sleep(0.2)
+    results.put((fired_in_child, CoarseClock.now > clock_start))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_timers_keep_running_in_a_forked_child():
+    CoarseClock.start()
+    fired = threading.Event()
+    handle = TimerService.getInstance().schedule(time.time() + 0.3, fired.set)
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    child = context.Process(target=report_timers_in_child, args=(fired, results))
+    child.start()
+    try:
+        assert results.get(timeout=10) == (True, True)
+    finally:
+        child.join(10)
+        TimerService.getInstance().cancel(handle)
+    assert child.exitcode == 0